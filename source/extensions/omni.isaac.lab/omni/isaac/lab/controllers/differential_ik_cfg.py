@@ -32,7 +32,7 @@ class DifferentialIKControllerCfg:
     Otherwise, the controller treats the input command as the absolute position/pose.
     """
 
-    ik_method: Literal["pinv", "svd", "trans", "dls"] = MISSING
+    ik_method: Literal["pinv", "svd", "trans", "dls", "dls_cholesky", "dls_warp"] = MISSING
     """Method for computing inverse of Jacobian."""
 
     ik_params: dict[str, float] | None = None
@@ -48,13 +48,16 @@ class DifferentialIKControllerCfg:
         - "k_val": Scaling of computed delta-joint positions (default: 1.0).
     - Damped Moore-Penrose pseudo-inverse ("dls"):
         - "lambda_val": Damping coefficient (default: 0.01).
+    - Damped least-squares with Cholesky factorization ("dls_cholesky" and "dls_warp"):
+        - "lambda_val": Damping coefficient (default: 0.01).
+        - "factorization_period": Number of calls for which the factorization is reused (default: 1).
     """
 
     def __post_init__(self):
         # check valid input
         if self.command_type not in ["position", "pose"]:
             raise ValueError(f"Unsupported inverse-kinematics command: {self.command_type}.")
-        if self.ik_method not in ["pinv", "svd", "trans", "dls"]:
+        if self.ik_method not in ["pinv", "svd", "trans", "dls", "dls_cholesky", "dls_warp"]:
             raise ValueError(f"Unsupported inverse-kinematics method: {self.ik_method}.")
         # default parameters for different inverse kinematics approaches.
         default_ik_params = {
@@ -62,6 +65,8 @@ class DifferentialIKControllerCfg:
             "svd": {"k_val": 1.0, "min_singular_value": 1e-5},
             "trans": {"k_val": 1.0},
             "dls": {"lambda_val": 0.01},
+            "dls_cholesky": {"lambda_val": 0.01, "factorization_period": 1},
+            "dls_warp": {"lambda_val": 0.01, "factorization_period": 1},
         }
         # update parameters for IK-method if not provided
         ik_params = default_ik_params[self.ik_method].copy()
@@ -37,6 +37,16 @@ class OperationSpaceControllerCfg:
     inertial_compensation: bool = False
     """Whether to perform inertial compensation for motion control (inverse dynamics)."""
 
+    inertial_solver: str = "inverse"
+    """Method for computing the task-space inertia for inertial compensation: "inverse", "cholesky".
+
+    If "inverse", then explicit inverses of the mass matrix and the task-space inverse inertia are computed.
+    If "cholesky", then the Cholesky factor of the mass matrix is used with triangular solves to form the task-space
+    inverse inertia, which is then factorized to solve for the desired wrench. This is faster and numerically safer
+    since no explicit inverse is formed. The decoupled position and orientation blocks share the same factorization
+    of the mass matrix.
+    """
+
     gravity_compensation: bool = False
     """Whether to perform gravity compensation."""
 
@@ -93,6 +103,7 @@ class OperationSpaceController:
 
         Raises:
             ValueError: When invalid control command is provided.
+            ValueError: When invalid inertial solver is provided.
         """
         # store inputs
         self.cfg = cfg
@@ -114,6 +125,9 @@ class OperationSpaceController:
             else:
                 raise ValueError(f"Invalid control command: {command_type}.")
         self.target_dim = sum(self.target_list)
+        # check the inertial solver
+        if self.cfg.inertial_solver not in ["cholesky", "inverse"]:
+            raise ValueError(f"Invalid inertial solver: {self.cfg.inertial_solver}.")
 
         # create buffers
         # -- selection matrices
@@ -320,20 +334,7 @@ class OperationSpaceController:
                     raise ValueError("Mass matrix is required for inertial compensation.")
                 # compute task-space dynamics quantities
                 # wrench = (J M^(-1) J^T)^(-1) * \ddot(x_des)
-                mass_matrix_inv = torch.inverse(mass_matrix)
-                if self.cfg.uncouple_motion_wrench:
-                    # decoupled-mass matrices
-                    lambda_pos = torch.inverse(jacobian[:, 0:3] @ mass_matrix_inv * jacobian[:, 0:3].T)
-                    lambda_ori = torch.inverse(jacobian[:, 3:6] @ mass_matrix_inv * jacobian[:, 3:6].T)
-                    # desired end-effector wrench (from pseudo-dynamics)
-                    decoupled_force = lambda_pos @ des_ee_acc[:, 0:3]
-                    decoupled_torque = lambda_ori @ des_ee_acc[:, 3:6]
-                    des_motion_wrench = torch.cat(decoupled_force, decoupled_torque)
-                else:
-                    # coupled dynamics
-                    lambda_full = torch.inverse(jacobian @ mass_matrix_inv * jacobian.T)
-                    # desired end-effector wrench (from pseudo-dynamics)
-                    des_motion_wrench = lambda_full @ des_ee_acc
+                des_motion_wrench = self._compute_inertial_wrench(jacobian, mass_matrix, des_ee_acc)
             else:
                 # task-space impedance control
                 # wrench = \ddot(x_des)
@@ -365,3 +366,57 @@ class OperationSpaceController:
             self._desired_torques += gravity
 
         return self._desired_torques
+
+    """
+    Helper functions.
+    """
+
+    def _compute_inertial_wrench(
+        self, jacobian: torch.Tensor, mass_matrix: torch.Tensor, des_ee_acc: torch.Tensor
+    ) -> torch.Tensor:
+        r"""Computes the desired end-effector wrench from the desired end-effector acceleration.
+
+        The wrench is computed as :math:`\Lambda \ddot{x}_{des}`, where :math:`\Lambda = (J M^{-1} J^T)^{-1}` is the
+        task-space inertia. If :attr:`OperationSpaceControllerCfg.uncouple_motion_wrench` is True, then the
+        position and orientation blocks of the task-space inertia are computed separately.
+
+        Args:
+            jacobian: The Jacobian matrix of the end-effector. Shape is (num_robots, 6, num_dof).
+            mass_matrix: The joint-space inertial matrix. Shape is (num_robots, num_dof, num_dof).
+            des_ee_acc: The desired end-effector acceleration. Shape is (num_robots, 6).
+
+        Returns:
+            The desired end-effector wrench. Shape is (num_robots, 6).
+
+        Raises:
+            ValueError: When an invalid inertial solver is provided.
+        """
+        jacobian_T = torch.transpose(jacobian, dim0=1, dim1=2)
+        # compute the task-space inverse inertia: J M^(-1) J^T
+        if self.cfg.inertial_solver == "cholesky":
+            # M = L L^T, so that J M^(-1) J^T = (L^(-1) J^T)^T (L^(-1) J^T)
+            mass_matrix_factor = torch.linalg.cholesky(mass_matrix)
+            jacobian_T_scaled = torch.linalg.solve_triangular(mass_matrix_factor, jacobian_T, upper=False)
+            lambda_inv = torch.transpose(jacobian_T_scaled, dim0=1, dim1=2) @ jacobian_T_scaled
+        elif self.cfg.inertial_solver == "inverse":
+            lambda_inv = jacobian @ torch.inverse(mass_matrix) @ jacobian_T
+        else:
+            raise ValueError(f"Invalid inertial solver: {self.cfg.inertial_solver}.")
+
+        # resolve the systems to solve
+        if self.cfg.uncouple_motion_wrench:
+            # decoupled-mass matrices: the diagonal blocks of the coupled task-space inverse inertia
+            # note: both blocks are solved with a single batched call
+            lambda_inv = torch.stack((lambda_inv[:, 0:3, 0:3], lambda_inv[:, 3:6, 3:6]), dim=1)
+            des_ee_acc = des_ee_acc.reshape(-1, 2, 3, 1)
+        else:
+            # coupled dynamics
+            des_ee_acc = des_ee_acc.unsqueeze(-1)
+
+        # desired end-effector wrench (from pseudo-dynamics)
+        if self.cfg.inertial_solver == "cholesky":
+            des_motion_wrench = torch.cholesky_solve(des_ee_acc, torch.linalg.cholesky(lambda_inv))
+        else:
+            des_motion_wrench = torch.inverse(lambda_inv) @ des_ee_acc
+
+        return des_motion_wrench.reshape(-1, 6)
@@ -181,6 +181,20 @@ class ObservationGroupCfg:
     Otherwise, no corruption is applied.
     """
 
+    use_group_buffer: bool = False
+    """Whether to compute the observation terms in a persistent group buffer. Defaults to False.
+
+    If true, the observation terms are written directly into pre-assigned slices of a buffer that is
+    allocated once for the group. Clipping, scaling and additive uniform or gaussian noise are then applied
+    to the whole buffer at once with per-column parameters. This avoids cloning each term and concatenating
+    the terms into a new tensor at every call.
+
+    Note:
+        This option requires :attr:`concatenate_terms` to be True. Since the same buffer is returned at every
+        call, the returned observations are overwritten by the next call to the observation manager. Please
+        clone them if they need to be stored.
+    """
+
 
 ##
 # Event manager
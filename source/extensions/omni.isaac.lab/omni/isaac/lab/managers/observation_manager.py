@@ -13,7 +13,7 @@ from collections.abc import Sequence
 from prettytable import PrettyTable
 from typing import TYPE_CHECKING
 
-from omni.isaac.lab.utils import modifiers
+from omni.isaac.lab.utils import modifiers, noise
 
 from .manager_base import ManagerBase, ManagerTermBase
 from .manager_term_cfg import ObservationGroupCfg, ObservationTermCfg
@@ -93,6 +93,11 @@ class ObservationManager(ManagerBase):
             else:
                 self._group_obs_dim[group_name] = group_term_dims
 
+        # create persistent buffers for groups that compute terms in place
+        for group_name, use_group_buffer in self._group_obs_use_buffer.items():
+            if use_group_buffer:
+                self._prepare_group_buffer(group_name)
+
     def __str__(self) -> str:
         """Returns: A string representation for the observation manager."""
         msg = f"<ObservationManager> contains {len(self._group_obs_term_names)} groups.\n"
@@ -222,6 +227,10 @@ class ObservationManager(ManagerBase):
         could be artificially constrained or amplified, which might misrepresent how noise naturally occurs
         in the data.
 
+        If :attr:`ObservationGroupCfg.use_group_buffer` is True, the terms are written into a persistent buffer
+        of the group and the noise, clipping and scaling operations are vectorized over all the terms where
+        possible. The same buffer is returned at every call.
+
         Args:
             group_name: The name of the group for which to compute the observations. Defaults to None,
                 in which case observations for all the groups are computed and returned.
@@ -240,6 +249,9 @@ class ObservationManager(ManagerBase):
                 f"Unable to find the group '{group_name}' in the observation manager."
                 f" Available groups are: {list(self._group_obs_term_names.keys())}"
             )
+        # compute the terms directly into the persistent buffer of the group
+        if self._group_obs_use_buffer[group_name]:
+            return self._compute_group_in_buffer(group_name)
         # iterate over all the terms in each group
         group_term_names = self._group_obs_term_names[group_name]
         # buffer to store obs per group
@@ -274,6 +286,145 @@ class ObservationManager(ManagerBase):
     Helper functions.
     """
 
+    def _compute_group_in_buffer(self, group_name: str) -> torch.Tensor:
+        """Computes the observations for a given group into its persistent buffer.
+
+        The terms are written into their slices of the group buffer, after which the custom modifiers and
+        the noise models that cannot be vectorized are applied on each slice. The vectorized noise, clipping
+        and scaling are then applied once on the whole buffer.
+
+        Args:
+            group_name: The name of the group for which to compute the observations.
+
+        Returns:
+            The persistent buffer of the group. Shape is (num_envs, *group_obs_dim).
+        """
+        obs_buffer = self._group_obs_buffer[group_name]
+        # read attributes for each term
+        obs_terms = zip(self._group_obs_term_views[group_name], self._group_obs_term_cfgs[group_name])
+
+        # evaluate terms: compute, custom modifiers, non-vectorized noise
+        for obs_view, term_cfg in obs_terms:
+            # compute term's value
+            # note: the copy into the group buffer replaces the clone of the term's value
+            obs_view.copy_(term_cfg.func(self._env, **term_cfg.params))
+            # apply post-processing
+            if term_cfg.modifiers is not None:
+                obs = obs_view
+                for modifier in term_cfg.modifiers:
+                    obs = modifier.func(obs, **modifier.params)
+                obs_view.copy_(obs)
+            if term_cfg.noise and not self._is_vectorized_noise(term_cfg.noise):
+                obs_view.copy_(term_cfg.noise.func(obs_view, term_cfg.noise))
+
+        # apply vectorized post-processing over all the terms
+        uniform_noise = self._group_obs_uniform_noise[group_name]
+        if uniform_noise is not None:
+            n_min, n_range = uniform_noise
+            obs_buffer.add_(torch.rand_like(obs_buffer).mul_(n_range).add_(n_min))
+        gaussian_noise = self._group_obs_gaussian_noise[group_name]
+        if gaussian_noise is not None:
+            mean, std = gaussian_noise
+            obs_buffer.add_(torch.randn_like(obs_buffer).mul_(std).add_(mean))
+        clip = self._group_obs_clip[group_name]
+        if clip is not None:
+            obs_buffer.clamp_(min=clip[0], max=clip[1])
+        scale = self._group_obs_scale[group_name]
+        if scale is not None:
+            obs_buffer.mul_(scale)
+
+        return obs_buffer
+
+    def _prepare_group_buffer(self, group_name: str):
+        """Prepares the persistent buffer and the per-column post-processing parameters of a group.
+
+        The columns correspond to the last dimension of the group observation, along which the terms
+        are concatenated.
+
+        Args:
+            group_name: The name of the group for which to prepare the buffer.
+
+        Raises:
+            ValueError: If the terms in the group are not concatenated.
+        """
+        # check that terms are concatenated
+        if not self._group_obs_concatenate[group_name]:
+            raise ValueError(
+                f"Observation group '{group_name}' has 'use_group_buffer' set to True but 'concatenate_terms'"
+                " set to False. Persistent group buffers are only supported for concatenated terms."
+            )
+        # allocate the buffer for the group
+        group_obs_dim = self._group_obs_dim[group_name]
+        obs_buffer = torch.zeros((self.num_envs, *group_obs_dim), device=self.device)
+        num_columns = group_obs_dim[-1]
+
+        # per-column parameters for post-processing
+        clip_min = torch.full((num_columns,), -torch.inf, device=self.device)
+        clip_max = torch.full((num_columns,), torch.inf, device=self.device)
+        scale = torch.ones(num_columns, device=self.device)
+        uniform_min = torch.zeros(num_columns, device=self.device)
+        uniform_range = torch.zeros(num_columns, device=self.device)
+        gaussian_mean = torch.zeros(num_columns, device=self.device)
+        gaussian_std = torch.zeros(num_columns, device=self.device)
+        # flags to skip the operations that do not apply to any term
+        has_clip, has_scale, has_uniform_noise, has_gaussian_noise = False, False, False, False
+
+        # resolve the slice of each term in the buffer
+        term_views = list()
+        start_idx = 0
+        for term_dims, term_cfg in zip(self._group_obs_term_dim[group_name], self._group_obs_term_cfgs[group_name]):
+            term_slice = slice(start_idx, start_idx + term_dims[-1])
+            term_views.append(obs_buffer[..., term_slice])
+            start_idx = term_slice.stop
+            # -- clip
+            if term_cfg.clip:
+                has_clip = True
+                if term_cfg.clip[0] is not None:
+                    clip_min[term_slice] = term_cfg.clip[0]
+                if term_cfg.clip[1] is not None:
+                    clip_max[term_slice] = term_cfg.clip[1]
+            # -- scale
+            if term_cfg.scale is not None:
+                has_scale = True
+                scale[term_slice] = term_cfg.scale
+            # -- noise
+            if term_cfg.noise and self._is_vectorized_noise(term_cfg.noise):
+                if isinstance(term_cfg.noise, noise.UniformNoiseCfg):
+                    has_uniform_noise = True
+                    uniform_min[term_slice] = term_cfg.noise.n_min
+                    uniform_range[term_slice] = term_cfg.noise.n_max - term_cfg.noise.n_min
+                else:
+                    has_gaussian_noise = True
+                    gaussian_mean[term_slice] = term_cfg.noise.mean
+                    gaussian_std[term_slice] = term_cfg.noise.std
+
+        # store the buffers
+        self._group_obs_buffer[group_name] = obs_buffer
+        self._group_obs_term_views[group_name] = term_views
+        self._group_obs_clip[group_name] = (clip_min, clip_max) if has_clip else None
+        self._group_obs_scale[group_name] = scale if has_scale else None
+        self._group_obs_uniform_noise[group_name] = (uniform_min, uniform_range) if has_uniform_noise else None
+        self._group_obs_gaussian_noise[group_name] = (gaussian_mean, gaussian_std) if has_gaussian_noise else None
+
+    def _is_vectorized_noise(self, noise_cfg: noise.NoiseCfg) -> bool:
+        """Checks whether the noise can be applied over the whole group buffer with per-column parameters.
+
+        This is the case for additive uniform and gaussian noise with the built-in functions and scalar parameters.
+
+        Args:
+            noise_cfg: The noise configuration of the observation term.
+
+        Returns:
+            True if the noise can be vectorized, False otherwise.
+        """
+        if noise_cfg.operation != "add":
+            return False
+        if isinstance(noise_cfg, noise.UniformNoiseCfg) and noise_cfg.func is noise.uniform_noise:
+            return isinstance(noise_cfg.n_min, (float, int)) and isinstance(noise_cfg.n_max, (float, int))
+        if isinstance(noise_cfg, noise.GaussianNoiseCfg) and noise_cfg.func is noise.gaussian_noise:
+            return isinstance(noise_cfg.mean, (float, int)) and isinstance(noise_cfg.std, (float, int))
+        return False
+
     def _prepare_terms(self):
         """Prepares a list of observation terms functions."""
         # create buffers to store information for each observation group
@@ -283,6 +434,15 @@ class ObservationManager(ManagerBase):
         self._group_obs_term_cfgs: dict[str, list[ObservationTermCfg]] = dict()
         self._group_obs_class_term_cfgs: dict[str, list[ObservationTermCfg]] = dict()
         self._group_obs_concatenate: dict[str, bool] = dict()
+        self._group_obs_use_buffer: dict[str, bool] = dict()
+        # create buffers for groups that compute terms in a persistent buffer
+        # note: these are filled in :meth:`_prepare_group_buffer`
+        self._group_obs_buffer: dict[str, torch.Tensor] = dict()
+        self._group_obs_term_views: dict[str, list[torch.Tensor]] = dict()
+        self._group_obs_clip: dict[str, tuple[torch.Tensor, torch.Tensor] | None] = dict()
+        self._group_obs_scale: dict[str, torch.Tensor | None] = dict()
+        self._group_obs_uniform_noise: dict[str, tuple[torch.Tensor, torch.Tensor] | None] = dict()
+        self._group_obs_gaussian_noise: dict[str, tuple[torch.Tensor, torch.Tensor] | None] = dict()
 
         # create a list to store modifiers that are classes
         # we store it as a separate list to only call reset on them and prevent unnecessary calls
@@ -311,6 +471,7 @@ class ObservationManager(ManagerBase):
             self._group_obs_class_term_cfgs[group_name] = list()
             # read common config for the group
             self._group_obs_concatenate[group_name] = group_cfg.concatenate_terms
+            self._group_obs_use_buffer[group_name] = group_cfg.use_group_buffer
             # check if config is dict already
             if isinstance(group_cfg, dict):
                 group_cfg_items = group_cfg.items()
@@ -319,7 +480,7 @@ class ObservationManager(ManagerBase):
             # iterate over all the terms in each group
             for term_name, term_cfg in group_cfg_items:
                 # skip non-obs settings
-                if term_name in ["enable_corruption", "concatenate_terms"]:
+                if term_name in ["enable_corruption", "concatenate_terms", "use_group_buffer"]:
                     continue
                 # check for non config
                 if term_cfg is None:
@@ -51,13 +51,28 @@ class RewardManager(ManagerBase):
         self._term_names: list[str] = list()
         self._term_cfgs: list[RewardTermCfg] = list()
         self._class_term_cfgs: list[RewardTermCfg] = list()
+        # create buffers for the term weights and the terms to compute
+        # note: these are filled when parsing the terms config
+        self._term_weights = torch.zeros(0, 1, dtype=torch.float, device=env.device)
+        self._active_term_indices: list[int] = list()
 
         # call the base class constructor (this will parse the terms config)
         super().__init__(cfg, env)
+        # create buffer for the weighted values of the reward terms at the current step
+        # note: the terms are stacked so that the total reward and the episodic sums are updated
+        #   with a single reduction and a single in-place addition respectively.
+        num_terms = len(self._term_names)
+        self._term_values = torch.zeros(num_terms, self.num_envs, dtype=torch.float, device=self.device)
         # prepare extra info to store individual reward term information
+        # note: the dictionary entries are views into the stacked buffer of episodic sums
+        self._episode_sums_buf = torch.zeros(num_terms, self.num_envs, dtype=torch.float, device=self.device)
         self._episode_sums = dict()
-        for term_name in self._term_names:
-            self._episode_sums[term_name] = torch.zeros(self.num_envs, dtype=torch.float, device=self.device)
+        for index, term_name in enumerate(self._term_names):
+            self._episode_sums[term_name] = self._episode_sums_buf[index]
+        # create buffer for the term weights multiplied by the time-step interval
+        # note: this is updated lazily when the weights or the time-step interval change
+        self._term_scales = torch.zeros(num_terms, 1, dtype=torch.float, device=self.device)
+        self._term_scales_dt: float | None = None
         # create buffer for managing reward per environment
         self._reward_buf = torch.zeros(self.num_envs, dtype=torch.float, device=self.device)
 
@@ -108,14 +123,13 @@ class RewardManager(ManagerBase):
         if env_ids is None:
             env_ids = slice(None)
         # store information
+        # r_1 + r_2 + ... + r_n
+        episodic_sum_avg = torch.mean(self._episode_sums_buf[:, env_ids], dim=1) / self._env.max_episode_length_s
         extras = {}
-        for key in self._episode_sums.keys():
-            # store information
-            # r_1 + r_2 + ... + r_n
-            episodic_sum_avg = torch.mean(self._episode_sums[key][env_ids])
-            extras["Episode_Reward/" + key] = episodic_sum_avg / self._env.max_episode_length_s
-            # reset episodic sum
-            self._episode_sums[key][env_ids] = 0.0
+        for index, key in enumerate(self._term_names):
+            extras["Episode_Reward/" + key] = episodic_sum_avg[index]
+        # reset episodic sum
+        self._episode_sums_buf[:, env_ids] = 0.0
         # reset all the reward terms
         for term_cfg in self._class_term_cfgs:
             term_cfg.func.reset(env_ids=env_ids)
@@ -125,8 +139,9 @@ class RewardManager(ManagerBase):
     def compute(self, dt: float) -> torch.Tensor:
         """Computes the reward signal as a weighted sum of individual terms.
 
-        This function calls each reward term managed by the class and adds them to compute the net
-        reward signal. It also updates the episodic sums corresponding to individual reward terms.
+        This function calls each reward term managed by the class and stores their values in a stacked
+        buffer of shape (num_terms, num_envs). The net reward signal is then computed with a single weighted
+        reduction over the terms, and the episodic sums of all the terms are updated with a single addition.
 
         Args:
             dt: The time-step interval of the environment.
@@ -134,19 +149,22 @@ class RewardManager(ManagerBase):
         Returns:
             The net reward signal of shape (num_envs,).
         """
-        # reset computation
-        self._reward_buf[:] = 0.0
-        # iterate over all the reward terms
-        for name, term_cfg in zip(self._term_names, self._term_cfgs):
-            # skip if weight is zero (kind of a micro-optimization)
-            if term_cfg.weight == 0.0:
-                continue
+        # update the scaled term weights if the time-step interval changed
+        if self._term_scales_dt != dt:
+            torch.mul(self._term_weights, dt, out=self._term_scales)
+            self._term_scales_dt = dt
+        # iterate over the reward terms with a non-zero weight (kind of a micro-optimization)
+        # note: the values of the other terms are zeroed out when their weight is set to zero
+        for index in self._active_term_indices:
+            term_cfg = self._term_cfgs[index]
             # compute term's value
-            value = term_cfg.func(self._env, **term_cfg.params) * term_cfg.weight * dt
-            # update total reward
-            self._reward_buf += value
-            # update episodic sum
-            self._episode_sums[name] += value
+            self._term_values[index] = term_cfg.func(self._env, **term_cfg.params)
+        # weigh the terms
+        self._term_values.mul_(self._term_scales)
+        # update total reward
+        torch.sum(self._term_values, dim=0, out=self._reward_buf)
+        # update episodic sum
+        self._episode_sums_buf.add_(self._term_values)
 
         return self._reward_buf
 
@@ -157,6 +175,9 @@ class RewardManager(ManagerBase):
     def set_term_cfg(self, term_name: str, cfg: RewardTermCfg):
         """Sets the configuration of the specified term into the manager.
 
+        The weights of the terms are stored in a tensor that is only updated by this function. Thus, the
+        weight of a term must be modified through this function to take effect.
+
         Args:
             term_name: The name of the reward term.
             cfg: The configuration for the reward term.
@@ -167,7 +188,13 @@ class RewardManager(ManagerBase):
         if term_name not in self._term_names:
             raise ValueError(f"Reward term '{term_name}' not found.")
         # set the configuration
-        self._term_cfgs[self._term_names.index(term_name)] = cfg
+        index = self._term_names.index(term_name)
+        self._term_cfgs[index] = cfg
+        # update the term weights
+        self._update_term_weights()
+        # clear the values of the term if it is skipped
+        if cfg.weight == 0.0:
+            self._term_values[index] = 0.0
 
     def get_term_cfg(self, term_name: str) -> RewardTermCfg:
         """Gets the configuration for the specified term.
@@ -190,6 +217,14 @@ class RewardManager(ManagerBase):
     Helper functions.
     """
 
+    def _update_term_weights(self):
+        """Updates the buffer of term weights and the terms to compute from the term configurations."""
+        weights = [term_cfg.weight for term_cfg in self._term_cfgs]
+        self._term_weights = torch.tensor(weights, dtype=torch.float, device=self.device).unsqueeze(1)
+        self._active_term_indices = [index for index, weight in enumerate(weights) if weight != 0.0]
+        # mark the scaled weights as outdated
+        self._term_scales_dt = None
+
     def _prepare_terms(self):
         # check if config is dict already
         if isinstance(self.cfg, dict):
@@ -221,3 +256,5 @@ class RewardManager(ManagerBase):
             # check if the term is a class
             if isinstance(term_cfg.func, ManagerTermBase):
                 self._class_term_cfgs.append(term_cfg)
+        # update the buffer of term weights
+        self._update_term_weights()
@@ -25,7 +25,7 @@ from omni.isaac.lab.assets import (
     RigidObjectCollection,
     RigidObjectCollectionCfg,
 )
-from omni.isaac.lab.sensors import ContactSensorCfg, FrameTransformerCfg, SensorBase, SensorBaseCfg
+from omni.isaac.lab.sensors import ContactSensorCfg, FrameTransformerCfg, SensorBase, SensorBaseCfg, SensorScheduler
 from omni.isaac.lab.terrains import TerrainImporter, TerrainImporterCfg
 
 from .interactive_scene_cfg import InteractiveSceneCfg
@@ -118,6 +118,8 @@ class InteractiveScene:
         self._rigid_object_collections = dict()
         self._sensors = dict()
         self._extras = dict()
+        # scheduler for updating the sensors in batches
+        self._sensor_scheduler = SensorScheduler()
         # obtain the current stage
         self.stage = omni.usd.get_context().get_stage()
         # physics scene path
@@ -393,8 +395,8 @@ class InteractiveScene:
         for rigid_object_collection in self._rigid_object_collections.values():
             rigid_object_collection.update(dt)
         # -- sensors
-        for sensor in self._sensors.values():
-            sensor.update(dt, force_recompute=not self.cfg.lazy_sensor_update)
+        # note: the sensors with the same update period are updated in batches
+        self._sensor_scheduler.update(self._sensors.values(), dt, force_recompute=not self.cfg.lazy_sensor_update)
 
     """
     Operations: Iteration.
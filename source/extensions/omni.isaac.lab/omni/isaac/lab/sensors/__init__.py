@@ -42,3 +42,4 @@ from .imu import *  # noqa: F401, F403
 from .ray_caster import *  # noqa: F401, F403
 from .sensor_base import SensorBase  # noqa: F401
 from .sensor_base_cfg import SensorBaseCfg  # noqa: F401
+from .sensor_scheduler import SensorScheduler  # noqa: F401
@@ -18,7 +18,7 @@ from omni.isaac.core.prims import XFormPrimView
 from omni.isaac.version import get_version
 from pxr import UsdGeom
 
-from omni.isaac.lab.utils.warp.kernels import reshape_tiled_image
+from omni.isaac.lab.utils.warp import reshape_tiled_image
 
 from ..sensor_base import SensorBase
 from .camera import Camera
@@ -245,12 +245,6 @@ class TiledCamera(Camera):
             else:
                 tiled_data_buffer = output
 
-            # convert data buffer to warp array
-            if isinstance(tiled_data_buffer, np.ndarray):
-                tiled_data_buffer = wp.array(tiled_data_buffer, device=self.device, dtype=wp.uint8)
-            else:
-                tiled_data_buffer = tiled_data_buffer.to(device=self.device)
-
             # process data for different segmentation types
             # Note: Replicator returns raw buffers of dtype uint32 for segmentation types
             #   so we need to convert them to uint8 4 channel images for colorized types
@@ -259,26 +253,25 @@ class TiledCamera(Camera):
                 or (data_type == "instance_segmentation_fast" and self.cfg.colorize_instance_segmentation)
                 or (data_type == "instance_id_segmentation_fast" and self.cfg.colorize_instance_id_segmentation)
             ):
-                tiled_data_buffer = wp.array(
-                    ptr=tiled_data_buffer.ptr, shape=(*tiled_data_buffer.shape, 4), dtype=wp.uint8, device=self.device
-                )
-
-            wp.launch(
-                kernel=reshape_tiled_image,
-                dim=(self._view.count, self.cfg.height, self.cfg.width),
-                inputs=[
-                    tiled_data_buffer.flatten(),
-                    wp.from_torch(self._data.output[data_type]),  # zero-copy alias
-                    *list(self._data.output[data_type].shape[1:]),  # height, width, num_channels
-                    self._tiling_grid_shape()[0],  # num_tiles_x
-                ],
-                device=self.device,
+                if isinstance(tiled_data_buffer, np.ndarray):
+                    tiled_data_buffer = tiled_data_buffer.view(np.uint8)
+                else:
+                    tiled_data_buffer = wp.array(
+                        ptr=tiled_data_buffer.ptr,
+                        shape=(*tiled_data_buffer.shape, 4),
+                        dtype=wp.uint8,
+                        device=tiled_data_buffer.device,
+                    )
+
+            # de-tile the data into the output buffer
+            # note: numpy buffers are wrapped without copying on the CPU
+            reshape_tiled_image(
+                tiled_data_buffer,
+                self._data.output[data_type],
+                self._tiling_grid_shape()[0],
+                **self._reshape_tiled_image_params.get(data_type, {}),
             )
 
-            # alias rgb as first 3 channels of rgba
-            if data_type == "rgba" and "rgb" in self.cfg.data_types:
-                self._data.output["rgb"] = self._data.output["rgba"][..., :3]
-
     """
     Private Helpers
     """
@@ -374,6 +367,15 @@ class TiledCamera(Camera):
         self._data.output = data_dict
         self._data.info = dict()
 
+        # -- post-processing of the depth images
+        self._reshape_tiled_image_params = dict()
+        if self.cfg.depth_clipping_behavior != "none":
+            # obtain the far clipping distance of the cameras
+            far_clip = self._sensor_prims[0].GetClippingRangeAttr().Get()[1]
+            fill_value = far_clip if self.cfg.depth_clipping_behavior == "max" else 0.0
+            for data_type in ["distance_to_camera", "distance_to_image_plane", "depth"]:
+                self._reshape_tiled_image_params[data_type] = {"max_value": far_clip, "fill_value": fill_value}
+
     def _tiled_image_shape(self) -> tuple[int, int]:
         """Returns a tuple containing the dimension of the tiled image."""
         cols, rows = self._tiling_grid_shape()
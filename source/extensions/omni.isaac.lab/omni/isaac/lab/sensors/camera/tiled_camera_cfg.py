@@ -3,6 +3,8 @@
 #
 # SPDX-License-Identifier: BSD-3-Clause
 
+from typing import Literal
+
 from omni.isaac.lab.utils import configclass
 
 from .camera_cfg import CameraCfg
@@ -22,3 +24,14 @@ class TiledCameraCfg(CameraCfg):
     due to the use of :class:`XformPrimView`.
     If False, the pose of the camera during initialization is returned.
     """
+
+    depth_clipping_behavior: Literal["max", "zero", "none"] = "none"
+    """Clipping behavior for the depth images beyond the far clipping distance of the camera. Defaults to "none".
+
+    This applies to the ``"distance_to_camera"``, ``"distance_to_image_plane"`` and ``"depth"`` data types.
+    The clipping is performed while de-tiling the rendered images, so it does not add any extra operation.
+
+    - ``"max"``: Values are clipped to the far clipping distance.
+    - ``"zero"``: Values are set to zero.
+    - ``"none"``: No clipping is applied. Values are returned as ``inf`` where nothing is hit.
+    """
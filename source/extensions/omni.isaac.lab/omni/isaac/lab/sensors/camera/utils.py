@@ -8,8 +8,10 @@
 # needed to import for allowing type-hinting: torch.device | str | None
 from __future__ import annotations
 
+import functools
 import numpy as np
 import torch
+from collections import OrderedDict
 from collections.abc import Sequence
 
 import warp as wp
@@ -257,6 +259,118 @@ def create_pointcloud_from_rgbd(
         return points_xyz, points_rgb
 
 
+def create_pixel_rays(intrinsic_matrices: torch.Tensor, height: int, width: int, is_ortho: bool = True) -> torch.Tensor:
+    r"""Creates the rays through the pixels of a batch of cameras.
+
+    The rays are computed as :math:`K^{-1} \times [u, v, 1]^T` for every pixel :math:`(u, v)`, in row-major
+    order. If :attr:`is_ortho` is True, the rays have a unit z-component, so they can be scaled by the distance
+    to the image plane. Otherwise, the rays are normalized, so they can be scaled by the distance to the camera.
+
+    The rays only depend on the intrinsics and the resolution of the cameras. They can be computed once and
+    passed to :meth:`create_pointclouds_from_depth` for as long as the intrinsics do not change.
+
+    The rays are cached based on the values of the intrinsic matrices, the resolution, the depth type and
+    the device. The cache keeps the rays of the most recent calls, so repeated calls with the same intrinsics
+    return the same tensor, which must therefore not be modified in-place.
+
+    Args:
+        intrinsic_matrices: The calibration matrices of the cameras. Shape is (N, 3, 3).
+        height: The height of the images.
+        width: The width of the images.
+        is_ortho: Whether the rays are scaled by orthogonal or perspective depth. Defaults to True.
+
+    Returns:
+        The rays through the pixels in the camera frame. Shape is (N, H x W, 3).
+    """
+    # resolve the key of the rays
+    key = (tuple(intrinsic_matrices.flatten().tolist()), height, width, is_ortho, str(intrinsic_matrices.device))
+    # return the rays if cached
+    if key in _PIXEL_RAYS_CACHE:
+        _PIXEL_RAYS_CACHE.move_to_end(key)
+        return _PIXEL_RAYS_CACHE[key]
+    # obtain the homogeneous pixel coordinates (H x W, 3)
+    pixels = _pixel_grid(height, width, intrinsic_matrices.device)
+    # unproject the pixels onto the image plane at unit depth
+    rays = torch.matmul(pixels, torch.inverse(intrinsic_matrices.float()).transpose(1, 2))
+    # normalize the rays for perspective depth
+    if not is_ortho:
+        rays = rays / torch.norm(rays, dim=-1, keepdim=True)
+    # add the rays to the cache and release the least recently used ones
+    _PIXEL_RAYS_CACHE[key] = rays
+    if len(_PIXEL_RAYS_CACHE) > _PIXEL_RAYS_CACHE_MAX_SIZE:
+        _PIXEL_RAYS_CACHE.popitem(last=False)
+    return rays
+
+
+def create_pointclouds_from_depth(
+    intrinsic_matrices: torch.Tensor,
+    depth: torch.Tensor,
+    position: torch.Tensor | None = None,
+    orientation: torch.Tensor | None = None,
+    is_ortho: bool = True,
+    max_depth: float | None = None,
+    pixel_rays: torch.Tensor | None = None,
+) -> tuple[torch.Tensor, torch.Tensor]:
+    r"""Creates a batch of fixed-size pointclouds from the depth images of multiple cameras.
+
+    This function provides the same functionality as :meth:`create_pointcloud_from_depth` for a batch of
+    cameras with different intrinsics and poses. Instead of removing the invalid points, which results in
+    pointclouds of different sizes, every pixel yields a point and the invalid points are set to zero.
+    A point is invalid if its depth value is zero, negative, NaN, infinite or greater than :attr:`max_depth`.
+
+    The points are ordered like the pixels in row-major order, i.e. the point ``v * W + u`` corresponds
+    to the pixel :math:`(u, v)`. The colors of the points can thus be obtained by reshaping the RGB images
+    to (N, H x W, 3).
+
+    For repeated calls with the same intrinsics, the rays through the pixels can be computed once with
+    :meth:`create_pixel_rays` and passed as :attr:`pixel_rays` to avoid recomputing them.
+
+    Args:
+        intrinsic_matrices: The calibration matrices of the cameras. Shape is (N, 3, 3).
+        depth: The depth images. Shape is (N, H, W) or (N, H, W, 1).
+        position: The positions of the cameras in a target frame. Shape is (N, 3). Defaults to None.
+        orientation: The orientations (w, x, y, z) of the cameras in a target frame. Shape is (N, 4).
+            Defaults to None.
+        is_ortho: Whether the depth images are orthogonal (distance to the image plane) or perspective
+            (distance to the camera) depth images. Defaults to True.
+        max_depth: The maximum valid depth value. Defaults to None, in which case all finite depth values
+            are valid.
+        pixel_rays: The rays through the pixels computed with :meth:`create_pixel_rays`. Shape is (N, H x W, 3).
+            Defaults to None, in which case the rays are computed from the intrinsic matrices.
+
+    Returns:
+        A tuple containing the points of the pointclouds and a mask of the valid points. The shape of the points
+        is (N, H x W, 3) and the shape of the mask is (N, H x W).
+
+    Raises:
+        ValueError: When depth is not of shape (N, H, W) or (N, H, W, 1).
+    """
+    # make sure the depth images are of shape (N, H, W)
+    if depth.dim() == 4 and depth.shape[-1] == 1:
+        depth = depth.squeeze(dim=3)
+    if depth.dim() != 3:
+        raise ValueError(f"Expected depth images to have shape (N, H, W) or (N, H, W, 1): got shape {depth.shape}.")
+    num_cameras, height, width = depth.shape
+    # obtain the rays through the pixels
+    if pixel_rays is None:
+        pixel_rays = create_pixel_rays(intrinsic_matrices, height, width, is_ortho)
+    # flatten the depth images (N, H, W) -> (N, H x W, 1)
+    depth = depth.reshape(num_cameras, -1, 1).float()
+    # compute the mask of the valid points
+    valid_mask = torch.isfinite(depth) & (depth > 0.0)
+    if max_depth is not None:
+        valid_mask &= depth <= max_depth
+    # scale the rays by the depth and set the invalid points to zero
+    points = torch.where(valid_mask, pixel_rays * depth, 0.0)
+    # convert the points to the target frame
+    if position is not None or orientation is not None:
+        points = math_utils.transform_points(points, position, orientation)
+        # keep the invalid points at zero in the target frame
+        points = torch.where(valid_mask, points, 0.0)
+
+    return points, valid_mask.squeeze(-1)
+
+
 def save_images_to_file(images: torch.Tensor, file_path: str):
     """Save images to file.
 
@@ -269,3 +383,29 @@ def save_images_to_file(images: torch.Tensor, file_path: str):
     save_image(
         make_grid(torch.swapaxes(images.unsqueeze(1), 1, -1).squeeze(-1), nrow=round(images.shape[0] ** 0.5)), file_path
     )
+
+
+"""
+Internal helpers.
+"""
+
+
+_PIXEL_RAYS_CACHE_MAX_SIZE = 8
+"""The maximum number of pixel rays kept in the cache."""
+
+_PIXEL_RAYS_CACHE: OrderedDict[tuple, torch.Tensor] = OrderedDict()
+"""The cached rays through the pixels, indexed by the intrinsics, the resolution, the depth type and the device.
+
+The entries are ordered from the least to the most recently used one.
+"""
+
+
+@functools.lru_cache(maxsize=8)
+def _pixel_grid(height: int, width: int, device: torch.device) -> torch.Tensor:
+    """Returns the homogeneous coordinates of the pixels of an image in row-major order. Shape is (H x W, 3)."""
+    indices_v, indices_u = torch.meshgrid(
+        torch.arange(height, device=device, dtype=torch.float32),
+        torch.arange(width, device=device, dtype=torch.float32),
+        indexing="ij",
+    )
+    return torch.stack([indices_u, indices_v, torch.ones_like(indices_u)], dim=-1).reshape(-1, 3)
@@ -19,6 +19,7 @@ import omni.isaac.lab.sim as sim_utils
 import omni.isaac.lab.utils.string as string_utils
 from omni.isaac.lab.markers import VisualizationMarkers
 from omni.isaac.lab.utils.math import convert_quat
+from omni.isaac.lab.utils.warp import update_contact_time
 
 from ..sensor_base import SensorBase
 from .contact_sensor_data import ContactSensorData
@@ -141,9 +142,8 @@ class ContactSensor(SensorBase):
             env_ids = slice(None)
         # reset accumulative data buffers
         self._data.net_forces_w[env_ids] = 0.0
-        self._data.net_forces_w_history[env_ids] = 0.0
         if self.cfg.history_length > 0:
-            self._data.net_forces_w_history[env_ids] = 0.0
+            self._data.net_forces_w_history_buffer[env_ids] = 0.0
         # reset force matrix
         if len(self.cfg.filter_prim_paths_expr) != 0:
             self._data.force_matrix_w[env_ids] = 0.0
@@ -288,12 +288,16 @@ class ContactSensor(SensorBase):
         self._data.net_forces_w = torch.zeros(self._num_envs, self._num_bodies, 3, device=self._device)
         # optional buffers
         # -- history of net forces
+        # note: the history is stored in a circular buffer with a write head per environment.
         if self.cfg.history_length > 0:
-            self._data.net_forces_w_history = torch.zeros(
+            self._data.net_forces_w_history_buffer = torch.zeros(
                 self._num_envs, self.cfg.history_length, self._num_bodies, 3, device=self._device
             )
+            self._data.net_forces_w_history_head = torch.zeros(self._num_envs, dtype=torch.long, device=self._device)
         else:
-            self._data.net_forces_w_history = self._data.net_forces_w.unsqueeze(1)
+            self._data.net_forces_w_history_buffer = self._data.net_forces_w.unsqueeze(1)
+        # -- indices of all the environments
+        self._ALL_INDICES = torch.arange(self._num_envs, dtype=torch.long, device=self._device)
         # -- pose of sensor origins
         if self.cfg.track_pose:
             self._data.pos_w = torch.zeros(self._num_envs, self._num_bodies, 3, device=self._device)
@@ -323,9 +327,12 @@ class ContactSensor(SensorBase):
         net_forces_w = self.contact_physx_view.get_net_contact_forces(dt=self._sim_physics_dt)
         self._data.net_forces_w[env_ids, :, :] = net_forces_w.view(-1, self._num_bodies, 3)[env_ids]
         # update contact force history
+        # note: the write head moves to the oldest entry, which is then overwritten
         if self.cfg.history_length > 0:
-            self._data.net_forces_w_history[env_ids, 1:] = self._data.net_forces_w_history[env_ids, :-1].clone()
-            self._data.net_forces_w_history[env_ids, 0] = self._data.net_forces_w[env_ids]
+            history_env_ids = self._ALL_INDICES[env_ids]
+            history_head = (self._data.net_forces_w_history_head[history_env_ids] + 1) % self.cfg.history_length
+            self._data.net_forces_w_history_head[history_env_ids] = history_head
+            self._data.net_forces_w_history_buffer[history_env_ids, history_head] = self._data.net_forces_w[env_ids]
 
         # obtain the contact force matrix
         if len(self.cfg.filter_prim_paths_expr) != 0:
@@ -346,30 +353,17 @@ class ContactSensor(SensorBase):
         if self.cfg.track_air_time:
             # -- time elapsed since last update
             # since this function is called every frame, we can use the difference to get the elapsed time
-            elapsed_time = self._timestamp[env_ids] - self._timestamp_last_update[env_ids]
-            # -- check contact state of bodies
-            is_contact = torch.norm(self._data.net_forces_w[env_ids, :, :], dim=-1) > self.cfg.force_threshold
-            is_first_contact = (self._data.current_air_time[env_ids] > 0) * is_contact
-            is_first_detached = (self._data.current_contact_time[env_ids] > 0) * ~is_contact
-            # -- update the last contact time if body has just become in contact
-            self._data.last_air_time[env_ids] = torch.where(
-                is_first_contact,
-                self._data.current_air_time[env_ids] + elapsed_time.unsqueeze(-1),
-                self._data.last_air_time[env_ids],
-            )
-            # -- increment time for bodies that are not in contact
-            self._data.current_air_time[env_ids] = torch.where(
-                ~is_contact, self._data.current_air_time[env_ids] + elapsed_time.unsqueeze(-1), 0.0
-            )
-            # -- update the last contact time if body has just detached
-            self._data.last_contact_time[env_ids] = torch.where(
-                is_first_detached,
-                self._data.current_contact_time[env_ids] + elapsed_time.unsqueeze(-1),
-                self._data.last_contact_time[env_ids],
-            )
-            # -- increment time for bodies that are in contact
-            self._data.current_contact_time[env_ids] = torch.where(
-                is_contact, self._data.current_contact_time[env_ids] + elapsed_time.unsqueeze(-1), 0.0
+            elapsed_time = self._timestamp - self._timestamp_last_update
+            # -- update the air and contact times of the bodies in a single kernel
+            update_contact_time(
+                self._data.net_forces_w,
+                elapsed_time,
+                self.cfg.force_threshold,
+                self._data.current_air_time,
+                self._data.last_air_time,
+                self._data.current_contact_time,
+                self._data.last_contact_time,
+                env_ids=self._ALL_INDICES[env_ids],
             )
 
     def _set_debug_vis_impl(self, debug_vis: bool):
@@ -42,19 +42,52 @@ class ContactSensorData:
         with the total contact forces acting on the sensor bodies (which also includes the tangential forces).
     """
 
-    net_forces_w_history: torch.Tensor | None = None
-    """The net normal contact forces in world frame.
+    net_forces_w_history_buffer: torch.Tensor | None = None
+    """The history of the net normal contact forces in world frame, stored as a circular buffer.
 
     Shape is (N, T, B, 3), where N is the number of sensors, T is the configured history length
     and B is the number of bodies in each sensor.
 
-    In the history dimension, the first index is the most recent and the last index is the oldest.
+    In the history dimension, the index of the most recent entry of each sensor is given by
+    :attr:`net_forces_w_history_head` and the entries are not ordered. This buffer can be used directly
+    for reductions over the history that do not depend on the order (for instance, the maximum). For the
+    ordered history, please use :attr:`net_forces_w_history`.
+    """
+
+    net_forces_w_history_head: torch.Tensor | None = None
+    """The index of the most recent entry in :attr:`net_forces_w_history_buffer`.
+
+    Shape is (N,), where N is the number of sensors.
 
     Note:
-        This quantity is the sum of the normal contact forces acting on the sensor bodies. It must not be confused
-        with the total contact forces acting on the sensor bodies (which also includes the tangential forces).
+        If the :attr:`ContactSensorCfg.history_length` is 0, then this quantity is None and the buffer
+        only holds the current forces.
     """
 
+    @property
+    def net_forces_w_history(self) -> torch.Tensor | None:
+        """The net normal contact forces in world frame.
+
+        Shape is (N, T, B, 3), where N is the number of sensors, T is the configured history length
+        and B is the number of bodies in each sensor.
+
+        In the history dimension, the first index is the most recent and the last index is the oldest.
+        The history is ordered from :attr:`net_forces_w_history_buffer` at every access.
+
+        Note:
+            This quantity is the sum of the normal contact forces acting on the sensor bodies. It must not be confused
+            with the total contact forces acting on the sensor bodies (which also includes the tangential forces).
+        """
+        # return the buffer if there is nothing to order
+        if self.net_forces_w_history_buffer is None or self.net_forces_w_history_head is None:
+            return self.net_forces_w_history_buffer
+        # resolve the slots of the entries from the most recent to the oldest
+        num_envs, history_length = self.net_forces_w_history_buffer.shape[:2]
+        device = self.net_forces_w_history_buffer.device
+        slots = self.net_forces_w_history_head.unsqueeze(1) - torch.arange(history_length, device=device)
+        slots = torch.remainder(slots, history_length)
+        return self.net_forces_w_history_buffer[torch.arange(num_envs, device=device).unsqueeze(1), slots]
+
     force_matrix_w: torch.Tensor | None = None
     """The normal contact forces filtered between the sensor bodies and filtered bodies in world frame.
 
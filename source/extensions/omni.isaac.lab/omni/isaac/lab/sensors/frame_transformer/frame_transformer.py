@@ -12,16 +12,13 @@ from typing import TYPE_CHECKING
 
 import omni.log
 import omni.physics.tensors.impl.api as physx
+import warp as wp
 from pxr import UsdPhysics
 
 import omni.isaac.lab.sim as sim_utils
 from omni.isaac.lab.markers import VisualizationMarkers
-from omni.isaac.lab.utils.math import (
-    combine_frame_transforms,
-    convert_quat,
-    is_identity_pose,
-    subtract_frame_transforms,
-)
+from omni.isaac.lab.utils.math import convert_quat, is_identity_pose
+from omni.isaac.lab.utils.warp.kernels import frame_transformer_kernel
 
 from ..sensor_base import SensorBase
 from .frame_transformer_data import FrameTransformerData
@@ -118,9 +115,11 @@ class FrameTransformer(SensorBase):
             self._apply_source_frame_offset = False
         else:
             omni.log.verbose(f"Applying offset to source frame as it is not identity: {self.cfg.prim_path}")
-            # Store offsets as tensors (duplicating each env's offsets for ease of multiplication later)
-            self._source_frame_offset_pos = source_frame_offset_pos.unsqueeze(0).repeat(self._num_envs, 1)
-            self._source_frame_offset_quat = source_frame_offset_quat.unsqueeze(0).repeat(self._num_envs, 1)
+        # Store the offset as a warp transform (x, y, z, qx, qy, qz, qw)
+        self._source_frame_offset = wp.transformf(
+            wp.vec3(*self.cfg.source_frame_offset.pos),
+            wp.quatf(*convert_quat(source_frame_offset_quat, to="xyzw").tolist()),
+        )
 
         # Keep track of mapping from the rigid body name to the desired frames and prim path, as there may be multiple frames
         # based upon the same body name and we don't want to create unnecessary views
@@ -309,11 +308,23 @@ class FrameTransformer(SensorBase):
             [duplicate_frame_indices + num_target_body_frames * env_num for env_num in range(self._num_envs)]
         )
 
-        # Target frame offsets are only applied if at least one of the offsets are non-identity
-        if self._apply_target_frame_offset:
-            # Stack up all the frame offsets for shape (num_envs, num_frames, 3) and (num_envs, num_frames, 4)
-            self._target_frame_offset_pos = torch.stack(target_frame_offset_pos).repeat(self._num_envs, 1)
-            self._target_frame_offset_quat = torch.stack(target_frame_offset_quat).repeat(self._num_envs, 1)
+        # Stack up all the frame offsets as warp transforms (x, y, z, qx, qy, qz, qw) of shape (num_frames,)
+        # note: the offsets are only applied if at least one of the offsets is non-identity
+        self._target_frame_offsets = torch.cat(
+            [torch.stack(target_frame_offset_pos), convert_quat(torch.stack(target_frame_offset_quat), to="xyzw")],
+            dim=-1,
+        ).contiguous()
+
+        # Resolve the indices into the view transforms of the source body and the body of each target frame
+        # note: this folds the reordering of the view transforms per environment and the duplication of the bodies
+        per_env_indices = torch.tensor(self._per_env_indices, device=self.device)
+        self._source_frame_view_ids = per_env_indices[self._source_frame_body_ids.to(self.device)].to(torch.int32)
+        self._target_frame_view_ids = (
+            per_env_indices[self._target_frame_body_ids.to(self.device)][self._duplicate_frame_indices]
+            .view(self._num_envs, -1)
+            .to(torch.int32)
+        )
+        self._ALL_INDICES = torch.arange(self._num_envs, dtype=torch.long, device=self.device)
 
         # fill the data buffer
         self._data.target_frame_names = self._target_frame_names
@@ -334,60 +345,30 @@ class FrameTransformer(SensorBase):
         # (the total number of source and target body frames being tracked * self._num_envs, 7)
         transforms = self._frame_physx_view.get_transforms()
 
-        # Reorder the transforms to be per environment as is expected of SensorData
-        transforms = transforms[self._per_env_indices]
-
-        # Convert quaternions as PhysX uses xyzw form
-        transforms[:, 3:] = convert_quat(transforms[:, 3:], to="wxyz")
-
-        # Process source frame transform
-        source_frames = transforms[self._source_frame_body_ids]
-        # Only apply offset if the offsets will result in a coordinate frame transform
-        if self._apply_source_frame_offset:
-            source_pos_w, source_quat_w = combine_frame_transforms(
-                source_frames[:, :3],
-                source_frames[:, 3:],
-                self._source_frame_offset_pos,
-                self._source_frame_offset_quat,
-            )
-        else:
-            source_pos_w = source_frames[:, :3]
-            source_quat_w = source_frames[:, 3:]
-
-        # Process target frame transforms
-        target_frames = transforms[self._target_frame_body_ids]
-        duplicated_target_frame_pos_w = target_frames[self._duplicate_frame_indices, :3]
-        duplicated_target_frame_quat_w = target_frames[self._duplicate_frame_indices, 3:]
-
-        # Only apply offset if the offsets will result in a coordinate frame transform
-        if self._apply_target_frame_offset:
-            target_pos_w, target_quat_w = combine_frame_transforms(
-                duplicated_target_frame_pos_w,
-                duplicated_target_frame_quat_w,
-                self._target_frame_offset_pos,
-                self._target_frame_offset_quat,
-            )
-        else:
-            target_pos_w = duplicated_target_frame_pos_w
-            target_quat_w = duplicated_target_frame_quat_w
-
-        # Compute the transform of the target frame with respect to the source frame
-        total_num_frames = len(self._target_frame_names)
-        target_pos_source, target_quat_source = subtract_frame_transforms(
-            source_pos_w.unsqueeze(1).expand(-1, total_num_frames, -1).reshape(-1, 3),
-            source_quat_w.unsqueeze(1).expand(-1, total_num_frames, -1).reshape(-1, 4),
-            target_pos_w,
-            target_quat_w,
-        )
-
-        # Update buffers
+        # Compute the frame transforms and update the buffers in a single kernel
         # note: The frame names / ordering don't change so no need to update them after initialization
-        self._data.source_pos_w[:] = source_pos_w.view(-1, 3)
-        self._data.source_quat_w[:] = source_quat_w.view(-1, 4)
-        self._data.target_pos_w[:] = target_pos_w.view(-1, total_num_frames, 3)
-        self._data.target_quat_w[:] = target_quat_w.view(-1, total_num_frames, 4)
-        self._data.target_pos_source[:] = target_pos_source.view(-1, total_num_frames, 3)
-        self._data.target_quat_source[:] = target_quat_source.view(-1, total_num_frames, 4)
+        env_ids = self._ALL_INDICES[env_ids].to(torch.int32)
+        wp.launch(
+            kernel=frame_transformer_kernel,
+            dim=(len(env_ids), len(self._target_frame_names)),
+            inputs=[
+                wp.from_torch(env_ids),
+                wp.from_torch(transforms.contiguous(), dtype=wp.transformf),
+                wp.from_torch(self._source_frame_view_ids),
+                wp.from_torch(self._target_frame_view_ids),
+                self._source_frame_offset,
+                wp.from_torch(self._target_frame_offsets, dtype=wp.transformf),
+                int(self._apply_source_frame_offset),
+                int(self._apply_target_frame_offset),
+                wp.from_torch(self._data.source_pos_w, dtype=wp.vec3),
+                wp.from_torch(self._data.source_quat_w, dtype=wp.vec4),
+                wp.from_torch(self._data.target_pos_w, dtype=wp.vec3),
+                wp.from_torch(self._data.target_quat_w, dtype=wp.vec4),
+                wp.from_torch(self._data.target_pos_source, dtype=wp.vec3),
+                wp.from_torch(self._data.target_quat_source, dtype=wp.vec4),
+            ],
+            device=self.device,
+        )
 
     def _set_debug_vis_impl(self, debug_vis: bool):
         # set visibility of markers
@@ -11,11 +11,13 @@ from typing import TYPE_CHECKING
 
 import omni.isaac.core.utils.stage as stage_utils
 import omni.physics.tensors.impl.api as physx
+import warp as wp
 from pxr import UsdPhysics
 
 import omni.isaac.lab.sim as sim_utils
 import omni.isaac.lab.utils.math as math_utils
 from omni.isaac.lab.markers import VisualizationMarkers
+from omni.isaac.lab.utils.warp.kernels import imu_kernel
 
 from ..sensor_base import SensorBase
 from .imu_data import ImuData
@@ -101,6 +103,7 @@ class Imu(SensorBase):
         self._data.ang_vel_b[env_ids] = 0.0
         self._data.lin_acc_b[env_ids] = 0.0
         self._data.ang_acc_b[env_ids] = 0.0
+        self._data.projected_gravity_b[env_ids] = 0.0
 
     def update(self, dt: float, force_recompute: bool = False):
         # save timestamp
@@ -146,41 +149,40 @@ class Imu(SensorBase):
             raise RuntimeError(
                 "The update function must be called before the data buffers are accessed the first time."
             )
-        # default to all sensors
-        if len(env_ids) == self._num_envs:
-            env_ids = slice(None)
-        # obtain the poses of the sensors
-        pos_w, quat_w = self._view.get_transforms()[env_ids].split([3, 4], dim=-1)
-        quat_w = math_utils.convert_quat(quat_w, to="wxyz")
-
-        # store the poses
-        self._data.pos_w[env_ids] = pos_w + math_utils.quat_rotate(quat_w, self._offset_pos_b[env_ids])
-        self._data.quat_w[env_ids] = math_utils.quat_mul(quat_w, self._offset_quat_b[env_ids])
-
-        # get the offset from COM to link origin
-        com_pos_b = self._view.get_coms().to(self.device).split([3, 4], dim=-1)[0]
-
-        # obtain the velocities of the link COM
-        lin_vel_w, ang_vel_w = self._view.get_velocities()[env_ids].split([3, 3], dim=-1)
-        # if an offset is present or the COM does not agree with the link origin, the linear velocity has to be
-        # transformed taking the angular velocity into account
-        lin_vel_w += torch.linalg.cross(
-            ang_vel_w, math_utils.quat_rotate(quat_w, self._offset_pos_b[env_ids] - com_pos_b[env_ids]), dim=-1
+        # convert the environment indices for the kernel
+        env_ids = self._ALL_INDICES[env_ids]
+        # obtain the states of the bodies
+        # note: the transforms, velocities and centers of mass are stored in the PhysX layout
+        transforms = self._view.get_transforms()
+        velocities = self._view.get_velocities()
+        coms = self._view.get_coms().to(self.device)
+        # compute all the outputs in a single kernel
+        # note: the previous velocities are updated in place for the next finite difference
+        wp.launch(
+            kernel=imu_kernel,
+            dim=len(env_ids),
+            inputs=[
+                wp.from_torch(env_ids),
+                wp.from_torch(transforms.contiguous(), dtype=wp.transformf),
+                wp.from_torch(velocities.contiguous().view(-1, 2, 3), dtype=wp.vec3),
+                wp.from_torch(coms.contiguous(), dtype=wp.transformf),
+                wp.from_torch(self._offsets, dtype=wp.transformf),
+                wp.from_torch(self._gravity_bias_w, dtype=wp.vec3),
+                self._gravity_dir_w,
+                self._dt,
+                wp.from_torch(self._prev_lin_vel_w, dtype=wp.vec3),
+                wp.from_torch(self._prev_ang_vel_w, dtype=wp.vec3),
+                wp.from_torch(self._data.pos_w, dtype=wp.vec3),
+                wp.from_torch(self._data.quat_w, dtype=wp.vec4),
+                wp.from_torch(self._data.lin_vel_b, dtype=wp.vec3),
+                wp.from_torch(self._data.ang_vel_b, dtype=wp.vec3),
+                wp.from_torch(self._data.lin_acc_b, dtype=wp.vec3),
+                wp.from_torch(self._data.ang_acc_b, dtype=wp.vec3),
+                wp.from_torch(self._data.projected_gravity_b, dtype=wp.vec3),
+            ],
+            device=self.device,
         )
 
-        # numerical derivative
-        lin_acc_w = (lin_vel_w - self._prev_lin_vel_w[env_ids]) / self._dt + self._gravity_bias_w[env_ids]
-        ang_acc_w = (ang_vel_w - self._prev_ang_vel_w[env_ids]) / self._dt
-        # store the velocities
-        self._data.lin_vel_b[env_ids] = math_utils.quat_rotate_inverse(self._data.quat_w[env_ids], lin_vel_w)
-        self._data.ang_vel_b[env_ids] = math_utils.quat_rotate_inverse(self._data.quat_w[env_ids], ang_vel_w)
-        # store the accelerations
-        self._data.lin_acc_b[env_ids] = math_utils.quat_rotate_inverse(self._data.quat_w[env_ids], lin_acc_w)
-        self._data.ang_acc_b[env_ids] = math_utils.quat_rotate_inverse(self._data.quat_w[env_ids], ang_acc_w)
-
-        self._prev_lin_vel_w[env_ids] = lin_vel_w
-        self._prev_ang_vel_w[env_ids] = ang_vel_w
-
     def _initialize_buffers_impl(self):
         """Create buffers for storing data."""
         # data buffers
@@ -191,12 +193,24 @@ class Imu(SensorBase):
         self._data.ang_vel_b = torch.zeros_like(self._data.pos_w)
         self._data.lin_acc_b = torch.zeros_like(self._data.pos_w)
         self._data.ang_acc_b = torch.zeros_like(self._data.pos_w)
+        self._data.projected_gravity_b = torch.zeros_like(self._data.pos_w)
         self._prev_lin_vel_w = torch.zeros_like(self._data.pos_w)
         self._prev_ang_vel_w = torch.zeros_like(self._data.pos_w)
 
+        # indices of all the sensors for the kernel
+        self._ALL_INDICES = torch.arange(self._view.count, dtype=torch.int32, device=self._device)
+
         # store sensor offset transformation
-        self._offset_pos_b = torch.tensor(list(self.cfg.offset.pos), device=self._device).repeat(self._view.count, 1)
-        self._offset_quat_b = torch.tensor(list(self.cfg.offset.rot), device=self._device).repeat(self._view.count, 1)
+        # note: the offsets are stored in the PhysX layout (x, y, z, qx, qy, qz, qw) for the kernel
+        offset_quat_b = torch.tensor(list(self.cfg.offset.rot), device=self._device)
+        self._offsets = torch.cat([
+            torch.tensor(list(self.cfg.offset.pos), device=self._device),
+            math_utils.convert_quat(offset_quat_b, to="xyzw"),
+        ]).repeat(self._view.count, 1)
+        # obtain the direction of gravity
+        gravity = self._physics_sim_view.get_gravity()
+        gravity_dir = math_utils.normalize(torch.tensor((gravity[0], gravity[1], gravity[2])).unsqueeze(0)).squeeze(0)
+        self._gravity_dir_w = wp.vec3(*gravity_dir.tolist())
         # set gravity bias
         self._gravity_bias_w = torch.tensor(list(self.cfg.gravity_bias), device=self._device).repeat(
             self._view.count, 1
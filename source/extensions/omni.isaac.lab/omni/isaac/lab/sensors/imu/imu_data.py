@@ -48,3 +48,9 @@ class ImuData:
 
     Shape is (N, 3), where ``N`` is the number of environments.
     """
+
+    projected_gravity_b: torch.Tensor = None
+    """Gravity direction unit vector projected on the IMU frame.
+
+    Shape is (N, 3), where ``N`` is the number of environments.
+    """
@@ -5,5 +5,12 @@
 
 """Sub-module for ray-casting patterns used by the ray-caster."""
 
-from .patterns import bpearl_pattern, grid_pattern, lidar_pattern, pinhole_camera_pattern
+from .patterns import (
+    bpearl_pattern,
+    clear_pattern_cache,
+    get_cached_pattern,
+    grid_pattern,
+    lidar_pattern,
+    pinhole_camera_pattern,
+)
 from .patterns_cfg import BpearlPatternCfg, GridPatternCfg, LidarPatternCfg, PatternBaseCfg, PinholeCameraPatternCfg
@@ -7,6 +7,7 @@ from __future__ import annotations
 
 import math
 import torch
+from collections import OrderedDict
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -177,3 +178,65 @@ def lidar_pattern(cfg: patterns_cfg.LidarPatternCfg, device: str) -> tuple[torch
     ray_starts = torch.zeros_like(ray_directions).to(device)
 
     return ray_starts, ray_directions
+
+
+"""
+Pattern caching.
+"""
+
+_PATTERN_CACHE_MAX_SIZE = 8
+"""The maximum number of patterns kept in the cache."""
+
+_PATTERN_CACHE: OrderedDict[tuple, tuple[torch.Tensor, torch.Tensor]] = OrderedDict()
+"""The cached ray starts and directions, indexed by the pattern configuration, intrinsics and device.
+
+The entries are ordered from the least to the most recently used one.
+"""
+
+
+def get_cached_pattern(
+    cfg: patterns_cfg.PatternBaseCfg, device: str, intrinsic_matrix: torch.Tensor | None = None
+) -> tuple[torch.Tensor, torch.Tensor]:
+    """Returns the rays of a pattern, generating them only once for the same configuration and intrinsics.
+
+    The rays are generated with the function :attr:`PatternBaseCfg.func` of the configuration. Sensors with
+    the same pattern configuration (and intrinsics for camera patterns) share the same tensors. The returned
+    tensors must therefore not be modified in-place.
+
+    The cache keeps the :data:`_PATTERN_CACHE_MAX_SIZE` most recently used patterns. The least recently used
+    pattern is released when a new pattern is added to a full cache.
+
+    Args:
+        cfg: The configuration instance for the pattern.
+        device: The device to create the pattern on.
+        intrinsic_matrix: The intrinsic matrix of the camera for camera patterns. Shape is (3, 3).
+            Defaults to None, for patterns that do not depend on intrinsics.
+
+    Returns:
+        The starting positions and directions of the rays. The shape of the tensors are (B, 3) and (B, 3)
+        respectively, where B is the number of rays.
+    """
+    # resolve the key of the pattern
+    key = (type(cfg).__name__, repr(cfg.to_dict()), str(device))
+    if intrinsic_matrix is not None:
+        key += (tuple(intrinsic_matrix.flatten().tolist()),)
+    # return the pattern if cached
+    if key in _PATTERN_CACHE:
+        _PATTERN_CACHE.move_to_end(key)
+        return _PATTERN_CACHE[key]
+    # generate the pattern
+    if intrinsic_matrix is None:
+        ray_starts, ray_directions = cfg.func(cfg, device)
+    else:
+        ray_starts, ray_directions = cfg.func(cfg, intrinsic_matrix.to(device).unsqueeze(0), device)
+        ray_starts, ray_directions = ray_starts[0], ray_directions[0]
+    # add the pattern to the cache and release the least recently used one
+    _PATTERN_CACHE[key] = (ray_starts, ray_directions)
+    if len(_PATTERN_CACHE) > _PATTERN_CACHE_MAX_SIZE:
+        _PATTERN_CACHE.popitem(last=False)
+    return ray_starts, ray_directions
+
+
+def clear_pattern_cache():
+    """Clears the cached patterns to free their memory."""
+    _PATTERN_CACHE.clear()
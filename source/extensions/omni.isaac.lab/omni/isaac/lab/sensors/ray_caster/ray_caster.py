@@ -15,15 +15,17 @@ import omni.log
 import omni.physics.tensors.impl.api as physx
 import warp as wp
 from omni.isaac.core.prims import XFormPrimView
-from pxr import UsdGeom, UsdPhysics
+from pxr import Usd, UsdGeom, UsdPhysics
 
 import omni.isaac.lab.sim as sim_utils
 from omni.isaac.lab.markers import VisualizationMarkers
 from omni.isaac.lab.terrains.trimesh.utils import make_plane
-from omni.isaac.lab.utils.math import convert_quat, quat_apply, quat_apply_yaw
-from omni.isaac.lab.utils.warp import convert_to_warp_mesh, raycast_mesh
+from omni.isaac.lab.utils.math import convert_quat, quat_apply, quat_rotate_inverse
+from omni.isaac.lab.utils.warp import convert_to_warp_mesh
+from omni.isaac.lab.utils.warp.kernels import raycast_sensor_kernel
 
 from ..sensor_base import SensorBase
+from .patterns import get_cached_pattern
 from .ray_caster_data import RayCasterData
 
 if TYPE_CHECKING:
@@ -38,12 +40,12 @@ class RayCaster(SensorBase):
     a set of meshes with a given ray pattern.
 
     The meshes are parsed from the list of primitive paths provided in the configuration. These are then
-    converted to warp meshes and stored in the `warp_meshes` list. The ray-caster then ray-casts against
-    these warp meshes using the ray pattern provided in the configuration.
+    merged into a single warp mesh in the world frame, so that all of them are ray-casted with a single
+    bounding volume hierarchy (BVH) and kernel launch. The index of the mesh prim path hit by each ray
+    can be tracked through :attr:`RayCasterCfg.track_mesh_ids`.
 
-    .. note::
-        Currently, only static meshes are supported. Extending the warp mesh to support dynamic meshes
-        is a work in progress.
+    Meshes listed in :attr:`RayCasterCfg.dynamic_mesh_prim_paths` are allowed to move rigidly. Their
+    vertices are updated from the world poses of the mesh prims and the BVH is refitted at every update.
     """
 
     cfg: RayCasterCfg
@@ -70,6 +72,7 @@ class RayCaster(SensorBase):
         # Create empty variables for storing output data
         self._data = RayCasterData()
         # the warp meshes used for raycasting.
+        # note: all the mesh prim paths refer to the same merged warp mesh.
         self.meshes: dict[str, wp.Mesh] = {}
 
     def __str__(self) -> str:
@@ -78,7 +81,7 @@ class RayCaster(SensorBase):
             f"Ray-caster @ '{self.cfg.prim_path}': \n"
             f"\tview type            : {self._view.__class__}\n"
             f"\tupdate period (s)    : {self.cfg.update_period}\n"
-            f"\tnumber of meshes     : {len(self.meshes)}\n"
+            f"\tnumber of meshes     : {len(self.meshes)} ({len(self._dynamic_mesh_prim_paths)} dynamic)\n"
             f"\tnumber of sensors    : {self._view.count}\n"
             f"\tnumber of rays/sensor: {self.num_rays}\n"
             f"\ttotal number of rays : {self.num_rays * self._view.count}"
@@ -149,61 +152,121 @@ class RayCaster(SensorBase):
         self._initialize_rays_impl()
 
     def _initialize_warp_meshes(self):
-        # check number of mesh prims provided
-        if len(self.cfg.mesh_prim_paths) != 1:
-            raise NotImplementedError(
-                f"RayCaster currently only supports one mesh prim. Received: {len(self.cfg.mesh_prim_paths)}"
-            )
+        # check that the dynamic meshes are ray-casted against
+        for mesh_prim_path in self.cfg.dynamic_mesh_prim_paths:
+            if mesh_prim_path not in self.cfg.mesh_prim_paths:
+                raise ValueError(
+                    f"Dynamic mesh prim path '{mesh_prim_path}' is not in the mesh prim paths:"
+                    f" {self.cfg.mesh_prim_paths}"
+                )
+
+        # read the vertices and faces of all the prims to ray-cast
+        points_list = list()
+        faces_list = list()
+        face_mesh_ids = list()
+        num_points = 0
+        # the dynamic meshes and the range of their vertices in the merged mesh
+        self._dynamic_mesh_prim_paths = list()
+        dynamic_vertex_ranges = list()
+        for mesh_id, mesh_prim_path in enumerate(self.cfg.mesh_prim_paths):
+            # resolve the prim paths matching the expression
+            prim_paths = sim_utils.find_matching_prim_paths(mesh_prim_path)
+            if len(prim_paths) == 0:
+                raise RuntimeError(f"Invalid mesh prim path: {mesh_prim_path}")
+            for prim_path in prim_paths:
+                points, faces, prim_path = self._read_mesh(prim_path)
+                # add the mesh to the merged mesh
+                points_list.append(points)
+                faces_list.append(faces + num_points)
+                face_mesh_ids.append(np.full(len(faces), mesh_id, dtype=np.int32))
+                if mesh_prim_path in self.cfg.dynamic_mesh_prim_paths:
+                    self._dynamic_mesh_prim_paths.append(prim_path)
+                    dynamic_vertex_ranges.append((num_points, num_points + len(points)))
+                num_points += len(points)
+
+        # create the merged warp mesh
+        wp_mesh = convert_to_warp_mesh(np.concatenate(points_list), np.concatenate(faces_list), device=self.device)
+        self.meshes = {mesh_prim_path: wp_mesh for mesh_prim_path in self.cfg.mesh_prim_paths}
+        self._mesh = wp_mesh
+        # map from the faces of the merged mesh to the index of their mesh prim path
+        self._face_mesh_ids = torch.from_numpy(np.concatenate(face_mesh_ids)).to(self.device).contiguous()
+        # print info
+        omni.log.info(
+            f"Merged {len(points_list)} mesh prims into a mesh with {num_points} vertices and"
+            f" {len(self._face_mesh_ids)} faces."
+        )
 
-        # read prims to ray-cast
-        for mesh_prim_path in self.cfg.mesh_prim_paths:
-            # check if the prim is a plane - handle PhysX plane as a special case
-            # if a plane exists then we need to create an infinite mesh that is a plane
-            mesh_prim = sim_utils.get_first_matching_child_prim(
-                mesh_prim_path, lambda prim: prim.GetTypeName() == "Plane"
+        # store the dynamic mesh vertices in the frames of their prims
+        if len(self._dynamic_mesh_prim_paths) > 0:
+            self._dynamic_mesh_view = XFormPrimView(self._dynamic_mesh_prim_paths, reset_xform_properties=False)
+            # the vertex indices in the merged mesh and the prim they belong to
+            self._dynamic_vertex_ids = torch.cat(
+                [torch.arange(start, end, device=self.device) for start, end in dynamic_vertex_ranges]
             )
-            # if we did not find a plane then we need to read the mesh
-            if mesh_prim is None:
-                # obtain the mesh prim
-                mesh_prim = sim_utils.get_first_matching_child_prim(
-                    mesh_prim_path, lambda prim: prim.GetTypeName() == "Mesh"
-                )
-                # check if valid
-                if mesh_prim is None or not mesh_prim.IsValid():
-                    raise RuntimeError(f"Invalid mesh prim path: {mesh_prim_path}")
-                # cast into UsdGeomMesh
-                mesh_prim = UsdGeom.Mesh(mesh_prim)
-                # read the vertices and faces
-                points = np.asarray(mesh_prim.GetPointsAttr().Get())
-                indices = np.asarray(mesh_prim.GetFaceVertexIndicesAttr().Get())
-                wp_mesh = convert_to_warp_mesh(points, indices, device=self.device)
-                # print info
-                omni.log.info(
-                    f"Read mesh prim: {mesh_prim.GetPath()} with {len(points)} vertices and {len(indices)} faces."
-                )
-            else:
-                mesh = make_plane(size=(2e6, 2e6), height=0.0, center_zero=True)
-                wp_mesh = convert_to_warp_mesh(mesh.vertices, mesh.faces, device=self.device)
-                # print info
-                omni.log.info(f"Created infinite plane mesh prim: {mesh_prim.GetPath()}.")
-            # add the warp mesh to the list
-            self.meshes[mesh_prim_path] = wp_mesh
-
-        # throw an error if no meshes are found
-        if all([mesh_prim_path not in self.meshes for mesh_prim_path in self.cfg.mesh_prim_paths]):
-            raise RuntimeError(
-                f"No meshes found for ray-casting! Please check the mesh prim paths: {self.cfg.mesh_prim_paths}"
+            self._dynamic_vertex_owners = torch.repeat_interleave(
+                torch.arange(len(dynamic_vertex_ranges), device=self.device),
+                torch.tensor([end - start for start, end in dynamic_vertex_ranges], device=self.device),
+            )
+            # note: the tensor shares the memory of the warp mesh vertices
+            self._mesh_points = wp.to_torch(wp_mesh.points)
+            pos_w, quat_w = self._dynamic_mesh_view.get_world_poses()
+            owners = self._dynamic_vertex_owners
+            self._dynamic_points_b = quat_rotate_inverse(
+                quat_w[owners], self._mesh_points[self._dynamic_vertex_ids] - pos_w[owners]
             )
 
+    def _read_mesh(self, prim_path: str) -> tuple[np.ndarray, np.ndarray, str]:
+        """Reads the vertices and faces of the first mesh found under the prim path.
+
+        The vertices are returned in the world frame. A PhysX plane is handled as a special case
+        and converted into a large plane mesh at zero height.
+
+        Args:
+            prim_path: The prim path to look for the mesh under.
+
+        Returns:
+            A tuple containing the vertices (shape is (V, 3)), the triangles (shape is (F, 3)) and
+            the path of the mesh prim.
+
+        Raises:
+            RuntimeError: If no valid mesh prim is found under the prim path.
+        """
+        # check if the prim is a plane - handle PhysX plane as a special case
+        # if a plane exists then we need to create an infinite mesh that is a plane
+        mesh_prim = sim_utils.get_first_matching_child_prim(prim_path, lambda prim: prim.GetTypeName() == "Plane")
+        # if we did not find a plane then we need to read the mesh
+        if mesh_prim is None:
+            # obtain the mesh prim
+            mesh_prim = sim_utils.get_first_matching_child_prim(prim_path, lambda prim: prim.GetTypeName() == "Mesh")
+            # check if valid
+            if mesh_prim is None or not mesh_prim.IsValid():
+                raise RuntimeError(f"Invalid mesh prim path: {prim_path}")
+            # read the vertices and faces
+            points = np.asarray(UsdGeom.Mesh(mesh_prim).GetPointsAttr().Get(), dtype=np.float64)
+            faces = np.asarray(UsdGeom.Mesh(mesh_prim).GetFaceVertexIndicesAttr().Get()).reshape(-1, 3)
+            # transform the vertices into the world frame
+            # note: USD uses row vectors, so the translation is in the last row
+            transform = np.asarray(UsdGeom.Xformable(mesh_prim).ComputeLocalToWorldTransform(Usd.TimeCode.Default()))
+            points = points @ transform[:3, :3] + transform[3, :3]
+            # print info
+            omni.log.info(f"Read mesh prim: {mesh_prim.GetPath()} with {len(points)} vertices and {len(faces)} faces.")
+        else:
+            mesh = make_plane(size=(2e6, 2e6), height=0.0, center_zero=True)
+            points, faces = mesh.vertices, mesh.faces
+            # print info
+            omni.log.info(f"Created infinite plane mesh prim: {mesh_prim.GetPath()}.")
+        return points, faces, mesh_prim.GetPath().pathString
+
     def _initialize_rays_impl(self):
         # compute ray stars and directions
-        self.ray_starts, self.ray_directions = self.cfg.pattern_cfg.func(self.cfg.pattern_cfg, self._device)
-        self.num_rays = len(self.ray_directions)
+        # note: the pattern is shared with the other sensors with the same configuration, so it is not modified
+        ray_starts, ray_directions = get_cached_pattern(self.cfg.pattern_cfg, self._device)
+        self.num_rays = len(ray_directions)
         # apply offset transformation to the rays
         offset_pos = torch.tensor(list(self.cfg.offset.pos), device=self._device)
         offset_quat = torch.tensor(list(self.cfg.offset.rot), device=self._device)
-        self.ray_directions = quat_apply(offset_quat.repeat(len(self.ray_directions), 1), self.ray_directions)
-        self.ray_starts += offset_pos
+        self.ray_directions = quat_apply(offset_quat.repeat(len(ray_directions), 1), ray_directions)
+        self.ray_starts = ray_starts + offset_pos
         # repeat the rays for each sensor
         self.ray_starts = self.ray_starts.repeat(self._view.count, 1, 1)
         self.ray_directions = self.ray_directions.repeat(self._view.count, 1, 1)
@@ -213,9 +276,29 @@ class RayCaster(SensorBase):
         self._data.pos_w = torch.zeros(self._view.count, 3, device=self._device)
         self._data.quat_w = torch.zeros(self._view.count, 4, device=self._device)
         self._data.ray_hits_w = torch.zeros(self._view.count, self.num_rays, 3, device=self._device)
+        if self.cfg.track_mesh_ids:
+            self._data.ray_mesh_ids = torch.full(
+                (self._view.count, self.num_rays), -1, dtype=torch.int32, device=self._device
+            )
+        # create warp views of the buffers used by the ray-casting kernel
+        # note: these share the memory of the tensors, so no data is copied at every update
+        self._ray_starts_wp = wp.from_torch(self.ray_starts, dtype=wp.vec3)
+        self._ray_directions_wp = wp.from_torch(self.ray_directions, dtype=wp.vec3)
+        self._pos_w_wp = wp.from_torch(self._data.pos_w, dtype=wp.vec3)
+        self._quat_w_wp = wp.from_torch(self._data.quat_w, dtype=wp.vec4)
+        self._ray_hits_w_wp = wp.from_torch(self._data.ray_hits_w, dtype=wp.vec3)
+        if self.cfg.track_mesh_ids:
+            self._ray_mesh_ids_wp = wp.from_torch(self._data.ray_mesh_ids, dtype=wp.int32)
+            self._face_mesh_ids_wp = wp.from_torch(self._face_mesh_ids, dtype=wp.int32)
+        else:
+            self._ray_mesh_ids_wp = wp.empty((1, 1), dtype=wp.int32, device=self._device)
+            self._face_mesh_ids_wp = wp.empty((1,), dtype=wp.int32, device=self._device)
 
     def _update_buffers_impl(self, env_ids: Sequence[int]):
         """Fills the buffers of the sensor data."""
+        # move the dynamic meshes
+        if len(self._dynamic_mesh_prim_paths) > 0:
+            self._update_dynamic_meshes()
         # obtain the poses of the sensors
         if isinstance(self._view, XFormPrimView):
             pos_w, quat_w = self._view.get_world_poses(env_ids)
@@ -227,34 +310,40 @@ class RayCaster(SensorBase):
             quat_w = convert_quat(quat_w, to="wxyz")
         else:
             raise RuntimeError(f"Unsupported view type: {type(self._view)}")
-        # note: we clone here because we are read-only operations
-        pos_w = pos_w.clone()
-        quat_w = quat_w.clone()
-        # apply drift
-        pos_w += self.drift[env_ids]
         # store the poses
-        self._data.pos_w[env_ids] = pos_w
+        # note: the drift is applied to the positions
+        self._data.pos_w[env_ids] = pos_w + self.drift[env_ids]
         self._data.quat_w[env_ids] = quat_w
 
-        # ray cast based on the sensor poses
-        if self.cfg.attach_yaw_only:
-            # only yaw orientation is considered and directions are not rotated
-            ray_starts_w = quat_apply_yaw(quat_w.repeat(1, self.num_rays), self.ray_starts[env_ids])
-            ray_starts_w += pos_w.unsqueeze(1)
-            ray_directions_w = self.ray_directions[env_ids]
-        else:
-            # full orientation is considered
-            ray_starts_w = quat_apply(quat_w.repeat(1, self.num_rays), self.ray_starts[env_ids])
-            ray_starts_w += pos_w.unsqueeze(1)
-            ray_directions_w = quat_apply(quat_w.repeat(1, self.num_rays), self.ray_directions[env_ids])
-        # ray cast and store the hits
-        # TODO: Make this work for multiple meshes?
-        self._data.ray_hits_w[env_ids] = raycast_mesh(
-            ray_starts_w,
-            ray_directions_w,
-            max_dist=self.cfg.max_distance,
-            mesh=self.meshes[self.cfg.mesh_prim_paths[0]],
-        )[0]
+        # ray cast based on the sensor poses and store the hits
+        # note: the kernel transforms the rays and writes the hits directly into the data buffers
+        env_ids = torch.as_tensor(env_ids, dtype=torch.int32, device=self._device)
+        wp.launch(
+            kernel=raycast_sensor_kernel,
+            dim=(len(env_ids), self.num_rays),
+            inputs=[
+                self._mesh.id,
+                wp.from_torch(env_ids),
+                self._pos_w_wp,
+                self._quat_w_wp,
+                self._ray_starts_wp,
+                self._ray_directions_wp,
+                self._ray_hits_w_wp,
+                self._ray_mesh_ids_wp,
+                self._face_mesh_ids_wp,
+                float(self.cfg.max_distance),
+                int(self.cfg.attach_yaw_only),
+                int(self.cfg.track_mesh_ids),
+            ],
+            device=self._mesh.device,
+        )
+
+    def _update_dynamic_meshes(self):
+        """Moves the vertices of the dynamic meshes to the current poses of their prims and refits the BVH."""
+        pos_w, quat_w = self._dynamic_mesh_view.get_world_poses()
+        owners = self._dynamic_vertex_owners
+        self._mesh_points[self._dynamic_vertex_ids] = quat_apply(quat_w[owners], self._dynamic_points_b) + pos_w[owners]
+        self._mesh.refit()
 
     def _set_debug_vis_impl(self, debug_vis: bool):
         # set visibility of markers
@@ -283,3 +372,4 @@ class RayCaster(SensorBase):
         # set all existing views to None to invalidate them
         self._physics_sim_view = None
         self._view = None
+        self._dynamic_mesh_view = None
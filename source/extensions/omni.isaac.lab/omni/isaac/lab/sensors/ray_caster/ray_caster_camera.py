@@ -17,6 +17,7 @@ import omni.isaac.lab.utils.math as math_utils
 from omni.isaac.lab.sensors.camera import CameraData
 from omni.isaac.lab.utils.warp import raycast_mesh
 
+from . import patterns
 from .ray_caster import RayCaster
 
 if TYPE_CHECKING:
@@ -31,17 +32,13 @@ class RayCasterCamera(RayCaster):
     :class:`omni.isaac.lab.sensors.Camera` that implements the camera class through USD camera prims.
     However, this class provides a faster image generation. The sensor converts meshes from the list of
     primitive paths provided in the configuration to Warp meshes. The camera then ray-casts against these
-    Warp meshes only.
+    Warp meshes only. Please refer to :class:`RayCaster` for how the meshes are merged and moved.
 
     Currently, only the following annotators are supported:
 
     - ``"distance_to_camera"``: An image containing the distance to camera optical center.
     - ``"distance_to_image_plane"``: An image containing distances of 3D points from camera plane along camera's z-axis.
     - ``"normals"``: An image containing the local surface normal vectors at each pixel.
-
-    .. note::
-        Currently, only static meshes are supported. Extending the warp mesh to support dynamic meshes
-        is a work in progress.
     """
 
     cfg: RayCasterCameraCfg
@@ -86,7 +83,7 @@ class RayCasterCamera(RayCaster):
             f"Ray-Caster-Camera @ '{self.cfg.prim_path}': \n"
             f"\tview type            : {self._view.__class__}\n"
             f"\tupdate period (s)    : {self.cfg.update_period}\n"
-            f"\tnumber of meshes     : {len(self.meshes)}\n"
+            f"\tnumber of meshes     : {len(self.meshes)} ({len(self._dynamic_mesh_prim_paths)} dynamic)\n"
             f"\tnumber of sensors    : {self._view.count}\n"
             f"\tnumber of rays/sensor: {self.num_rays}\n"
             f"\ttotal number of rays : {self.num_rays * self._view.count}\n"
@@ -114,6 +111,26 @@ class RayCasterCamera(RayCaster):
         """Frame number when the measurement took place."""
         return self._frame
 
+    @property
+    def ray_starts(self) -> torch.Tensor:
+        """The starting positions of the rays in the camera frame. Shape is (N, B, 3).
+
+        Note:
+            The cameras with the same intrinsics share the same rays internally. This property
+            returns a copy of the rays for all the cameras.
+        """
+        return self._ray_starts[self._ray_pattern_ids]
+
+    @property
+    def ray_directions(self) -> torch.Tensor:
+        """The directions of the rays in the camera frame. Shape is (N, B, 3).
+
+        Note:
+            The cameras with the same intrinsics share the same rays internally. This property
+            returns a copy of the rays for all the cameras.
+        """
+        return self._ray_directions[self._ray_pattern_ids]
+
     """
     Operations.
     """
@@ -135,9 +152,7 @@ class RayCasterCamera(RayCaster):
         self._data.intrinsic_matrices[env_ids] = matrices.to(self._device)
         self._focal_length = focal_length
         # recompute ray directions
-        self.ray_starts[env_ids], self.ray_directions[env_ids] = self.cfg.pattern_cfg.func(
-            self.cfg.pattern_cfg, self._data.intrinsic_matrices[env_ids], self._device
-        )
+        self._update_ray_patterns()
 
     def reset(self, env_ids: Sequence[int] | None = None):
         # reset the timestamps
@@ -241,10 +256,8 @@ class RayCasterCamera(RayCaster):
         # compute intrinsic matrices
         self._compute_intrinsic_matrices()
         # compute ray stars and directions
-        self.ray_starts, self.ray_directions = self.cfg.pattern_cfg.func(
-            self.cfg.pattern_cfg, self._data.intrinsic_matrices, self._device
-        )
-        self.num_rays = self.ray_directions.shape[1]
+        self._update_ray_patterns()
+        self.num_rays = self._ray_directions.shape[1]
         # create buffer to store ray hits
         self.ray_hits_w = torch.zeros(self._view.count, self.num_rays, 3, device=self._device)
         # set offsets
@@ -258,6 +271,9 @@ class RayCasterCamera(RayCaster):
         """Fills the buffers of the sensor data."""
         # increment frame count
         self._frame[env_ids] += 1
+        # move the dynamic meshes
+        if len(self._dynamic_mesh_prim_paths) > 0:
+            self._update_dynamic_meshes()
 
         # compute poses from current view
         pos_w, quat_w = self._compute_camera_world_poses(env_ids)
@@ -266,21 +282,20 @@ class RayCasterCamera(RayCaster):
         self._data.quat_w_world[env_ids] = quat_w
 
         # note: full orientation is considered
-        ray_starts_w = math_utils.quat_apply(quat_w.repeat(1, self.num_rays), self.ray_starts[env_ids])
+        ray_pattern_ids = self._ray_pattern_ids[env_ids]
+        ray_starts_w = math_utils.quat_apply(quat_w.repeat(1, self.num_rays), self._ray_starts[ray_pattern_ids])
         ray_starts_w += pos_w.unsqueeze(1)
-        ray_directions_w = math_utils.quat_apply(quat_w.repeat(1, self.num_rays), self.ray_directions[env_ids])
+        ray_directions_w = math_utils.quat_apply(quat_w.repeat(1, self.num_rays), self._ray_directions[ray_pattern_ids])
 
         # ray cast and store the hits
         # note: we set max distance to 1e6 during the ray-casting. THis is because we clip the distance
         # to the image plane and distance to the camera to the maximum distance afterwards in-order to
         # match the USD camera behavior.
 
-        # TODO: Make ray-casting work for multiple meshes?
-        # necessary for regular dictionaries.
         self.ray_hits_w, ray_depth, ray_normal, _ = raycast_mesh(
             ray_starts_w,
             ray_directions_w,
-            mesh=self.meshes[self.cfg.mesh_prim_paths[0]],
+            mesh=self._mesh,
             max_dist=1e6,
             return_distance=any(
                 [name in self.cfg.data_types for name in ["distance_to_image_plane", "distance_to_camera"]]
@@ -382,6 +397,31 @@ class RayCasterCamera(RayCaster):
         # save focal length
         self._focal_length = pattern_cfg.focal_length
 
+    def _update_ray_patterns(self):
+        """Updates the rays of the cameras from their intrinsic matrices.
+
+        The cameras with the same intrinsic matrix share the same rays. The rays are stored once per distinct
+        intrinsic matrix and indexed by :attr:`_ray_pattern_ids`. If all the cameras share the same intrinsic
+        matrix, the rays are obtained from the pattern cache. Otherwise, the rays of all the distinct intrinsic
+        matrices are generated with a single call to the pattern function.
+        """
+        # find the distinct intrinsic matrices
+        intrinsic_matrices, self._ray_pattern_ids = torch.unique(
+            self._data.intrinsic_matrices.reshape(-1, 9), dim=0, return_inverse=True
+        )
+        intrinsic_matrices = intrinsic_matrices.view(-1, 3, 3)
+        if len(intrinsic_matrices) == 1:
+            # note: the rays are views of the cached tensors, shared with the other cameras
+            ray_starts, ray_directions = patterns.get_cached_pattern(
+                self.cfg.pattern_cfg, self._device, intrinsic_matrices[0]
+            )
+            self._ray_starts, self._ray_directions = ray_starts.unsqueeze(0), ray_directions.unsqueeze(0)
+        else:
+            # note: the rays are not cached since they are rarely shared with other cameras
+            self._ray_starts, self._ray_directions = self.cfg.pattern_cfg.func(
+                self.cfg.pattern_cfg, intrinsic_matrices, self._device
+            )
+
     def _compute_view_world_poses(self, env_ids: Sequence[int]) -> tuple[torch.Tensor, torch.Tensor]:
         """Obtains the pose of the view the camera is attached to in the world frame.
 
@@ -35,9 +35,22 @@ class RayCasterCfg(SensorBaseCfg):
     mesh_prim_paths: list[str] = MISSING
     """The list of mesh primitive paths to ray cast against.
 
-    Note:
-        Currently, only a single static mesh is supported. We are working on supporting multiple
-        static meshes and dynamic meshes.
+    Each path may be a regex expression matching several prims. The first mesh (or PhysX plane) found under
+    every matching prim is read in the world frame. All the meshes are merged into a single warp mesh.
+    """
+
+    dynamic_mesh_prim_paths: list[str] = []
+    """The list of mesh primitive paths whose meshes move rigidly. Defaults to an empty list.
+
+    Each entry must also be in :attr:`mesh_prim_paths`. At every update, the vertices of these meshes are
+    transformed with the current world poses of the mesh prims and the merged warp mesh is refitted.
+    Refitting is cheaper than rebuilding the mesh, but its cost grows with the total number of faces.
+    """
+
+    track_mesh_ids: bool = False
+    """Whether to store the index of the mesh prim path hit by each ray. Defaults to False.
+
+    If True, the indices are stored in :attr:`RayCasterData.ray_mesh_ids`.
     """
 
     offset: OffsetCfg = OffsetCfg()
@@ -27,3 +27,12 @@ class RayCasterData:
     Shape is (N, B, 3), where N is the number of sensors, B is the number of rays
     in the scan pattern per sensor.
     """
+    ray_mesh_ids: torch.Tensor = None
+    """The index of the mesh prim path hit by each ray.
+
+    Shape is (N, B), where N is the number of sensors, B is the number of rays in the scan pattern
+    per sensor. The index refers to :attr:`RayCasterCfg.mesh_prim_paths` and is -1 for missed rays.
+
+    Note:
+        This is only filled if :attr:`RayCasterCfg.track_mesh_ids` is True. Otherwise, it is None.
+    """
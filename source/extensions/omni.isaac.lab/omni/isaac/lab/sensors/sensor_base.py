@@ -193,6 +193,8 @@ class SensorBase(ABC):
         self._timestamp_last_update[env_ids] = 0.0
         # Set all reset sensors to outdated so that they are updated when data is called the next time.
         self._is_outdated[env_ids] = True
+        # Flag the reset on the host for the batched scheduling of the sensor updates
+        self._is_reset_pending = True
 
     def update(self, dt: float, force_recompute: bool = False):
         # Update the timestamp for the sensors
@@ -229,6 +231,8 @@ class SensorBase(ABC):
         self._timestamp = torch.zeros(self._num_envs, device=self._device)
         # Timestamp from last update
         self._timestamp_last_update = torch.zeros_like(self._timestamp)
+        # Whether the sensor was reset since the last update of the scheduler (see :class:`SensorScheduler`)
+        self._is_reset_pending = True
 
     @abstractmethod
     def _update_buffers_impl(self, env_ids: Sequence[int]):
@@ -0,0 +1,227 @@
+# Copyright (c) 2022-2024, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Scheduler for updating the sensors of a scene in batches.
+
+Each sensor keeps track of the time elapsed since its last update and refreshes the environments whose
+update period has elapsed. When the sensors are updated one after the other, every sensor compares its
+timestamps separately and finds the environments to refresh with a host-synchronizing call. The
+:class:`SensorScheduler` instead stacks the timestamps of the sensors with equal update periods into shared
+buffers, so that the timestamps of each group are advanced with a single batched operation.
+"""
+
+from __future__ import annotations
+
+import torch
+from collections.abc import Iterable
+
+from .sensor_base import SensorBase
+
+
+class SensorScheduler:
+    """Scheduler for updating the sensors of a scene in batches.
+
+    The sensors are grouped by their update period, number of environments and device. The timestamps and the
+    outdated flags of the sensors in a group are stored in shared buffers of shape (S, N), where ``S`` is the
+    number of sensors in the group and ``N`` is the number of environments. The buffers of the sensors are
+    replaced with views into the shared buffers, so the sensors keep working when they are updated, reset or
+    accessed individually.
+
+    When the sensors are updated eagerly (for instance, when the lazy sensor update of the scene is disabled),
+    the environments to refresh are resolved for the whole group at once:
+
+    * If the update period is zero, all environments are due at every step and no host synchronization is needed.
+    * Otherwise, the scheduler keeps an upper bound of the time elapsed since the last update on the host. As
+      long as this bound is smaller than the update period and no sensor of the group was reset, nothing is due
+      and the group is skipped without a host synchronization.
+
+    Sensors that override :meth:`SensorBase.update` are updated individually through their own method.
+
+    .. note::
+
+        The buffers are rebuilt whenever the sensors are added, removed or re-initialized, i.e. when the
+        simulation is played again after a stop.
+    """
+
+    def __init__(self):
+        """Initializes the scheduler."""
+        self._sensors: tuple[SensorBase, ...] = tuple()
+        self._groups: list[_SensorGroup] = list()
+        self._individual_sensors: list[SensorBase] = list()
+
+    def __str__(self) -> str:
+        """Returns: A string containing information about the instance."""
+        msg = (
+            f"<SensorScheduler> with {len(self._groups)} groups and"
+            f" {len(self._individual_sensors)} individually updated sensors"
+        )
+        for group in self._groups:
+            msg += (
+                f"\n\tupdate period (s) : {group.update_period}, number of environments : {group.num_envs},"
+                f" number of sensors : {len(group.sensors)}"
+            )
+        return msg
+
+    """
+    Operations.
+    """
+
+    def update(self, sensors: Iterable[SensorBase], dt: float, force_recompute: bool = False):
+        """Updates the timestamps of the sensors and refreshes the data of the outdated sensors.
+
+        This is equivalent to calling :meth:`SensorBase.update` on each sensor.
+
+        Args:
+            sensors: The sensors to update. The sensors must be initialized.
+            dt: The amount of time passed from the last update call.
+            force_recompute: Whether to refresh the data of the outdated sensors. Defaults to False, in which
+                case only the sensors that are visualized or have a history are refreshed.
+        """
+        # regroup the sensors if they changed
+        sensors = tuple(sensors)
+        if sensors != self._sensors or any(not group.is_valid() for group in self._groups):
+            self._build_groups(sensors)
+        # update the sensors individually
+        for sensor in self._individual_sensors:
+            sensor.update(dt, force_recompute)
+        # update the groups
+        for group in self._groups:
+            group.update(dt, force_recompute)
+
+    """
+    Internal helpers.
+    """
+
+    def _build_groups(self, sensors: tuple[SensorBase, ...]):
+        """Groups the sensors by their update period, number of environments and device."""
+        self._sensors = sensors
+        self._individual_sensors = list()
+        grouped_sensors: dict[tuple[float, int, str], list[SensorBase]] = dict()
+        for sensor in sensors:
+            if type(sensor).update is not SensorBase.update:
+                self._individual_sensors.append(sensor)
+            else:
+                key = (float(sensor.cfg.update_period), sensor._num_envs, str(sensor.device))
+                grouped_sensors.setdefault(key, list()).append(sensor)
+        self._groups = [_SensorGroup(group_sensors) for group_sensors in grouped_sensors.values()]
+
+
+class _SensorGroup:
+    """Sensors with the same update period, number of environments and device."""
+
+    def __init__(self, sensors: list[SensorBase]):
+        """Stacks the timestamps of the sensors and replaces the buffers of the sensors with views.
+
+        Args:
+            sensors: The sensors of the group.
+        """
+        self.sensors = sensors
+        self.update_period = float(sensors[0].cfg.update_period)
+        self.num_envs = sensors[0]._num_envs
+        device = sensors[0].device
+        # stack the buffers of the sensors
+        self.timestamp = torch.stack([sensor._timestamp for sensor in sensors])
+        self.timestamp_last_update = torch.stack([sensor._timestamp_last_update for sensor in sensors])
+        self.is_outdated = torch.stack([sensor._is_outdated for sensor in sensors])
+        # replace the buffers of the sensors with views into the stacked buffers
+        self._timestamp_views = list(self.timestamp)
+        for index, sensor in enumerate(sensors):
+            sensor._timestamp = self._timestamp_views[index]
+            sensor._timestamp_last_update = self.timestamp_last_update[index]
+            sensor._is_outdated = self.is_outdated[index]
+            sensor._is_reset_pending = False
+        # indices of all the environments
+        self.all_env_ids = torch.arange(self.num_envs, dtype=torch.long, device=device)
+        # the sensors that are refreshed at every update and their indices in the group
+        self._eager_mask: tuple[bool, ...] = tuple()
+        self._eager_sensor_ids = torch.zeros(0, dtype=torch.long, device=device)
+        # upper bound of the time elapsed since the last update of the eagerly refreshed sensors
+        # note: this is infinite until the elapsed time is known on the host
+        self._max_elapsed_time = float("inf")
+
+    def is_valid(self) -> bool:
+        """Whether the buffers of the sensors are still views into the stacked buffers."""
+        return all(sensor._timestamp is timestamp for sensor, timestamp in zip(self.sensors, self._timestamp_views))
+
+    def update(self, dt: float, force_recompute: bool):
+        """Updates the timestamps of the sensors and refreshes the data of the outdated sensors.
+
+        Args:
+            dt: The amount of time passed from the last update call.
+            force_recompute: Whether to refresh the data of the outdated sensors.
+        """
+        # update the timestamps and outdated flags of all the sensors
+        self.timestamp += dt
+        self.is_outdated |= self.timestamp - self.timestamp_last_update + 1e-6 >= self.update_period
+        self._max_elapsed_time += dt
+        # resolve the sensors that are refreshed at every update
+        # note: this mirrors the condition in :meth:`SensorBase.update`
+        eager_mask = tuple(
+            force_recompute or sensor._is_visualizing or sensor.cfg.history_length > 0 for sensor in self.sensors
+        )
+        if eager_mask != self._eager_mask:
+            self._eager_mask = eager_mask
+            eager_sensor_ids = [index for index, is_eager in enumerate(eager_mask) if is_eager]
+            self._eager_sensor_ids = torch.tensor(eager_sensor_ids, dtype=torch.long, device=self.all_env_ids.device)
+            # the newly added sensors may have been outdated for a while
+            self._max_elapsed_time = float("inf")
+        if len(self._eager_sensor_ids) == 0:
+            return
+        eager_sensors = [sensor for sensor, is_eager in zip(self.sensors, eager_mask) if is_eager]
+
+        # refresh the outdated sensors
+        if self.update_period == 0.0:
+            # all the environments are due at every update, so the indices are known without synchronization
+            for sensor in eager_sensors:
+                sensor._update_buffers_impl(self.all_env_ids)
+            self.timestamp_last_update[self._eager_sensor_ids] = self.timestamp[self._eager_sensor_ids]
+            self.is_outdated[self._eager_sensor_ids] = False
+            self._max_elapsed_time = 0.0
+        elif self._max_elapsed_time + 1e-6 >= self.update_period - 1e-4 or any(
+            sensor._is_reset_pending for sensor in eager_sensors
+        ):
+            self._refresh_outdated_sensors(eager_sensors)
+
+    """
+    Internal helpers.
+    """
+
+    def _refresh_outdated_sensors(self, eager_sensors: list[SensorBase]):
+        """Refreshes the data of the outdated environments of the eagerly refreshed sensors.
+
+        The number of outdated environments of the sensors and the maximum time elapsed since the last update of
+        the other environments are obtained with a single transfer to the host.
+
+        Args:
+            eager_sensors: The sensors that are refreshed at every update.
+        """
+        timestamp = self.timestamp[self._eager_sensor_ids]
+        timestamp_last_update = self.timestamp_last_update[self._eager_sensor_ids]
+        is_outdated = self.is_outdated[self._eager_sensor_ids]
+        # time elapsed for the environments that stay up to date
+        elapsed_time = torch.where(is_outdated, 0.0, timestamp - timestamp_last_update)
+        *num_outdated, max_elapsed_time = torch.cat(
+            [is_outdated.sum(dim=-1, dtype=torch.float32), elapsed_time.max().view(1)]
+        ).tolist()
+        num_outdated = [int(count) for count in num_outdated]
+        self._max_elapsed_time = max_elapsed_time
+        for sensor in eager_sensors:
+            sensor._is_reset_pending = False
+        if sum(num_outdated) == 0:
+            return
+        # obtain the outdated environments of the partially outdated sensors
+        if any(0 < count < self.num_envs for count in num_outdated):
+            outdated_env_ids = is_outdated.nonzero()[:, 1].split(num_outdated)
+        else:
+            outdated_env_ids = [self.all_env_ids] * len(eager_sensors)
+        # obtain new data
+        for sensor, count, env_ids in zip(eager_sensors, num_outdated, outdated_env_ids):
+            if count == self.num_envs:
+                sensor._update_buffers_impl(self.all_env_ids)
+            elif count > 0:
+                sensor._update_buffers_impl(env_ids)
+        # update the timestamp from last update and the outdated flags of the refreshed sensors
+        self.timestamp_last_update[self._eager_sensor_ids] = torch.where(is_outdated, timestamp, timestamp_last_update)
+        self.is_outdated[self._eager_sensor_ids] = False
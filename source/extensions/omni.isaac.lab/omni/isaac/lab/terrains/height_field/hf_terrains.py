@@ -186,24 +186,15 @@ def pyramid_stairs_terrain(difficulty: float, cfg: hf_terrains_cfg.HfPyramidStai
     # -- platform
     platform_width = int(cfg.platform_width / cfg.horizontal_scale)
 
+    # compute the number of steps until the platform is reached
+    # note: a step is added as long as the remaining region is larger than the platform along both axes
+    num_steps = max(0, -(-(min(width_pixels, length_pixels) - platform_width) // (2 * step_width)))
+    # compute the step index of each pixel based on its distance to the border of the terrain
+    step_x = np.minimum(np.arange(width_pixels), np.arange(width_pixels)[::-1]) // step_width
+    step_y = np.minimum(np.arange(length_pixels), np.arange(length_pixels)[::-1]) // step_width
+    step_ids = np.minimum(np.minimum.outer(step_x, step_y), num_steps)
     # create a terrain with a flat platform at the center
-    hf_raw = np.zeros((width_pixels, length_pixels))
-    # add the steps
-    current_step_height = 0
-    start_x, start_y = 0, 0
-    stop_x, stop_y = width_pixels, length_pixels
-    while (stop_x - start_x) > platform_width and (stop_y - start_y) > platform_width:
-        # increment position
-        # -- x
-        start_x += step_width
-        stop_x -= step_width
-        # -- y
-        start_y += step_width
-        stop_y -= step_width
-        # increment height
-        current_step_height += step_height
-        # add the step
-        hf_raw[start_x:stop_x, start_y:stop_y] = current_step_height
+    hf_raw = step_ids * step_height
 
     # round off the heights to the nearest vertical step
     return np.rint(hf_raw).astype(np.int16)
@@ -255,29 +246,47 @@ def discrete_obstacles_terrain(difficulty: float, cfg: hf_terrains_cfg.HfDiscret
     obs_x_range = np.arange(0, width_pixels, 4)
     obs_y_range = np.arange(0, length_pixels, 4)
 
-    # create a terrain with a flat platform at the center
-    hf_raw = np.zeros((width_pixels, length_pixels))
-    # generate the obstacles
-    for _ in range(cfg.num_obstacles):
+    # check the obstacle height mode
+    if cfg.obstacle_height_mode not in ["choice", "fixed"]:
+        raise ValueError(f"Unknown obstacle height mode '{cfg.obstacle_height_mode}'. Must be 'choice' or 'fixed'.")
+    # sample the obstacles
+    # note: the samples are drawn obstacle by obstacle to keep the same sequence of random numbers
+    obstacles = np.zeros((cfg.num_obstacles, 5), dtype=np.int64)
+    for index in range(cfg.num_obstacles):
         # sample size
         if cfg.obstacle_height_mode == "choice":
-            height = np.random.choice([-obs_height, -obs_height // 2, obs_height // 2, obs_height])
-        elif cfg.obstacle_height_mode == "fixed":
-            height = obs_height
+            obstacles[index, 0] = np.random.choice([-obs_height, -obs_height // 2, obs_height // 2, obs_height])
         else:
-            raise ValueError(f"Unknown obstacle height mode '{cfg.obstacle_height_mode}'. Must be 'choice' or 'fixed'.")
-        width = int(np.random.choice(obs_width_range))
-        length = int(np.random.choice(obs_length_range))
+            obstacles[index, 0] = obs_height
+        obstacles[index, 1] = np.random.choice(obs_width_range)
+        obstacles[index, 2] = np.random.choice(obs_length_range)
         # sample position
-        x_start = int(np.random.choice(obs_x_range))
-        y_start = int(np.random.choice(obs_y_range))
-        # clip start position to the terrain
-        if x_start + width > width_pixels:
-            x_start = width_pixels - width
-        if y_start + length > length_pixels:
-            y_start = length_pixels - length
-        # add to terrain
-        hf_raw[x_start : x_start + width, y_start : y_start + length] = height
+        obstacles[index, 3] = np.random.choice(obs_x_range)
+        obstacles[index, 4] = np.random.choice(obs_y_range)
+    heights, widths, lengths, x_start, y_start = obstacles.T
+    # clip start position to the terrain
+    x_start = np.where(x_start + widths > width_pixels, width_pixels - widths, x_start)
+    y_start = np.where(y_start + lengths > length_pixels, length_pixels - lengths, y_start)
+    # compute the region covered by each obstacle
+    # note: negative start indices are wrapped around as in python slicing
+    # dim: (num_obstacles, width_pixels) and (num_obstacles, length_pixels)
+    x_ids = np.arange(width_pixels)
+    y_ids = np.arange(length_pixels)
+    in_x = (x_ids >= np.where(x_start < 0, x_start + width_pixels, x_start)[:, None]) & (
+        x_ids < (x_start + widths)[:, None]
+    )
+    in_y = (y_ids >= np.where(y_start < 0, y_start + length_pixels, y_start)[:, None]) & (
+        y_ids < (y_start + lengths)[:, None]
+    )
+    # add the obstacles to the terrain
+    # note: overlapping obstacles are resolved by taking the last obstacle covering each pixel
+    # dim: (num_obstacles, width_pixels, length_pixels)
+    covered = in_x[:, :, None] & in_y[:, None, :]
+    # create a terrain with a flat platform at the center
+    hf_raw = np.zeros((width_pixels, length_pixels))
+    if cfg.num_obstacles > 0:
+        last_ids = cfg.num_obstacles - 1 - np.argmax(covered[::-1], axis=0)
+        hf_raw = np.where(covered.any(axis=0), heights[last_ids], hf_raw)
     # clip the terrain to the platform
     x1 = (width_pixels - platform_width) // 2
     x2 = (width_pixels + platform_width) // 2
@@ -392,40 +401,12 @@ def stepping_stones_terrain(difficulty: float, cfg: hf_terrains_cfg.HfSteppingSt
     # create a terrain with a flat platform at the center
     hf_raw = np.full((width_pixels, length_pixels), holes_depth)
     # add the stones
-    start_x, start_y = 0, 0
     # -- if the terrain is longer than it is wide then fill the terrain column by column
     if length_pixels >= width_pixels:
-        while start_y < length_pixels:
-            # ensure that stone stops along y-axis
-            stop_y = min(length_pixels, start_y + stone_width)
-            # randomly sample x-position
-            start_x = np.random.randint(0, stone_width)
-            stop_x = max(0, start_x - stone_distance)
-            # fill first stone
-            hf_raw[0:stop_x, start_y:stop_y] = np.random.choice(stone_height_range)
-            # fill row with stones
-            while start_x < width_pixels:
-                stop_x = min(width_pixels, start_x + stone_width)
-                hf_raw[start_x:stop_x, start_y:stop_y] = np.random.choice(stone_height_range)
-                start_x += stone_width + stone_distance
-            # update y-position
-            start_y += stone_width + stone_distance
-    elif width_pixels > length_pixels:
-        while start_x < width_pixels:
-            # ensure that stone stops along x-axis
-            stop_x = min(width_pixels, start_x + stone_width)
-            # randomly sample y-position
-            start_y = np.random.randint(0, stone_width)
-            stop_y = max(0, start_y - stone_distance)
-            # fill first stone
-            hf_raw[start_x:stop_x, 0:stop_y] = np.random.choice(stone_height_range)
-            # fill column with stones
-            while start_y < length_pixels:
-                stop_y = min(length_pixels, start_y + stone_width)
-                hf_raw[start_x:stop_x, start_y:stop_y] = np.random.choice(stone_height_range)
-                start_y += stone_width + stone_distance
-            # update x-position
-            start_x += stone_width + stone_distance
+        _add_stepping_stones(hf_raw, stone_width, stone_distance, stone_height_range)
+    # -- otherwise fill the terrain row by row (i.e. column by column of the transposed terrain)
+    else:
+        _add_stepping_stones(hf_raw.T, stone_width, stone_distance, stone_height_range)
     # add the platform in the center
     x1 = (width_pixels - platform_width) // 2
     x2 = (width_pixels + platform_width) // 2
@@ -434,3 +415,42 @@ def stepping_stones_terrain(difficulty: float, cfg: hf_terrains_cfg.HfSteppingSt
     hf_raw[x1:x2, y1:y2] = 0
     # round off the heights to the nearest vertical step
     return np.rint(hf_raw).astype(np.int16)
+
+
+"""
+Helper functions.
+"""
+
+
+def _add_stepping_stones(hf_raw: np.ndarray, stone_width: int, stone_distance: int, stone_height_range: np.ndarray):
+    """Add stepping stones to the height field column by column.
+
+    The columns are filled along the second axis of the height field. In each column, the stones are
+    placed along the first axis starting from a random offset. The operation is performed in-place.
+
+    Args:
+        hf_raw: The height field to fill. Shape is (num_rows, num_cols).
+        stone_width: The width of the stones (in pixels).
+        stone_distance: The distance between the stones (in pixels).
+        stone_height_range: The range of heights to sample the stones from (in discrete units).
+    """
+    num_rows, num_cols = hf_raw.shape
+    # pixel indices along the columns
+    row_ids = np.arange(num_rows)
+    for start_y in range(0, num_cols, stone_width + stone_distance):
+        # ensure that stone stops along y-axis
+        stop_y = min(num_cols, start_y + stone_width)
+        # randomly sample x-position
+        start_x = np.random.randint(0, stone_width)
+        # sample the heights of the first stone and all the stones in the column
+        # note: a single batched draw produces the same samples as drawing the stones one by one
+        num_stones = max(0, -(-(num_rows - start_x) // (stone_width + stone_distance)))
+        heights = np.random.choice(stone_height_range, size=num_stones + 1)
+        # compute the stone index of each pixel in the column (zero for the first stone, -1 for holes)
+        offset = row_ids - start_x
+        stone_ids = np.where(offset % (stone_width + stone_distance) < stone_width, offset, -1)
+        stone_ids = np.where(stone_ids >= 0, stone_ids // (stone_width + stone_distance) + 1, -1)
+        stone_ids[: max(0, start_x - stone_distance)] = 0
+        # fill the column with the stones
+        column = hf_raw[:, start_y]
+        hf_raw[:, start_y:stop_y] = np.where(stone_ids >= 0, heights[stone_ids], column)[:, None]
@@ -28,6 +28,11 @@ class HfTerrainBaseCfg(SubTerrainBaseCfg):
     slope_threshold: float | None = None
     """The slope threshold above which surfaces are made vertical. Defaults to None,
     in which case no correction is applied."""
+    decimate_flat_regions: bool = False
+    """Whether to merge the flat regions of the height field into larger quads. Defaults to False.
+
+    This reduces the number of triangles of terrains with large flat areas, such as stairs and obstacles.
+    """
 
 
 """
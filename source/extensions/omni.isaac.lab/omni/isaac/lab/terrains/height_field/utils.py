@@ -60,7 +60,7 @@ def height_field_to_mesh(func: Callable) -> Callable:
 
         # convert to trimesh
         vertices, triangles = convert_height_field_to_mesh(
-            heights, cfg.horizontal_scale, cfg.vertical_scale, cfg.slope_threshold
+            heights, cfg.horizontal_scale, cfg.vertical_scale, cfg.slope_threshold, cfg.decimate_flat_regions
         )
         mesh = trimesh.Trimesh(vertices=vertices, faces=triangles)
         # compute origin
@@ -77,7 +77,11 @@ def height_field_to_mesh(func: Callable) -> Callable:
 
 
 def convert_height_field_to_mesh(
-    height_field: np.ndarray, horizontal_scale: float, vertical_scale: float, slope_threshold: float | None = None
+    height_field: np.ndarray,
+    horizontal_scale: float,
+    vertical_scale: float,
+    slope_threshold: float | None = None,
+    decimate_flat_regions: bool = False,
 ) -> tuple[np.ndarray, np.ndarray]:
     """Convert a height-field array to a triangle mesh represented by vertices and triangles.
 
@@ -102,12 +106,20 @@ def convert_height_field_to_mesh(
                   /  |
         (x_1,y_1)A---A'(x_1',y_1)
 
+    If :attr:`decimate_flat_regions` is True, the flat regions of the height field are merged into larger
+    quads using a quad-tree over the grid cells. A block of cells is merged if all its vertices have the same
+    height and are not moved by the slope correction. The resulting mesh describes the same surface with
+    fewer triangles. However, the vertices on the boundary of a merged block may lie on the edge of the
+    neighboring block (T-junctions).
+
     Args:
         height_field: The input height-field array.
         horizontal_scale: The discretization of the terrain along the x and y axis.
         vertical_scale: The discretization of the terrain along the z axis.
         slope_threshold: The slope threshold above which surfaces are made vertical.
             Defaults to None, in which case no correction is applied.
+        decimate_flat_regions: Whether to merge the flat regions of the height field into larger quads.
+            Defaults to False.
 
     Returns:
         The vertices and triangles of the mesh:
@@ -118,56 +130,128 @@ def convert_height_field_to_mesh(
     """
     # read height field
     num_rows, num_cols = height_field.shape
-    # create a mesh grid of the height field
-    y = np.linspace(0, (num_cols - 1) * horizontal_scale, num_cols)
-    x = np.linspace(0, (num_rows - 1) * horizontal_scale, num_rows)
-    yy, xx = np.meshgrid(y, x)
-    # copy height field to avoid modifying the original array
-    hf = height_field.copy()
+    # create vertices for the mesh
+    # note: we fill the vertices in-place to avoid allocating full-size temporaries
+    vertices = np.empty((num_rows, num_cols, 3), dtype=np.float32)
+    vertices[..., 0] = np.linspace(0, (num_rows - 1) * horizontal_scale, num_rows)[:, None]
+    vertices[..., 1] = np.linspace(0, (num_cols - 1) * horizontal_scale, num_cols)[None, :]
+    np.multiply(height_field, vertical_scale, out=vertices[..., 2], casting="unsafe")
 
     # correct vertical surfaces above the slope threshold
+    moved = None
     if slope_threshold is not None:
         # scale slope threshold based on the horizontal and vertical scale
         slope_threshold *= horizontal_scale / vertical_scale
+        # compute the height differences along the x-axis, y-axis and the corners
+        diff_x = height_field[1:, :] - height_field[:-1, :]
+        diff_y = height_field[:, 1:] - height_field[:, :-1]
+        diff_corners = height_field[1:, 1:] - height_field[:-1, :-1]
         # allocate arrays to store the movement of the vertices
-        move_x = np.zeros((num_rows, num_cols))
-        move_y = np.zeros((num_rows, num_cols))
-        move_corners = np.zeros((num_rows, num_cols))
+        move_x = np.zeros((num_rows, num_cols), dtype=np.float32)
+        move_y = np.zeros((num_rows, num_cols), dtype=np.float32)
+        move_corners = np.zeros((num_rows, num_cols), dtype=np.float32)
         # move vertices along the x-axis
-        move_x[: num_rows - 1, :] += hf[1:num_rows, :] - hf[: num_rows - 1, :] > slope_threshold
-        move_x[1:num_rows, :] -= hf[: num_rows - 1, :] - hf[1:num_rows, :] > slope_threshold
+        move_x[:-1, :] += diff_x > slope_threshold
+        move_x[1:, :] -= -diff_x > slope_threshold
         # move vertices along the y-axis
-        move_y[:, : num_cols - 1] += hf[:, 1:num_cols] - hf[:, : num_cols - 1] > slope_threshold
-        move_y[:, 1:num_cols] -= hf[:, : num_cols - 1] - hf[:, 1:num_cols] > slope_threshold
+        move_y[:, :-1] += diff_y > slope_threshold
+        move_y[:, 1:] -= -diff_y > slope_threshold
         # move vertices along the corners
-        move_corners[: num_rows - 1, : num_cols - 1] += (
-            hf[1:num_rows, 1:num_cols] - hf[: num_rows - 1, : num_cols - 1] > slope_threshold
-        )
-        move_corners[1:num_rows, 1:num_cols] -= (
-            hf[: num_rows - 1, : num_cols - 1] - hf[1:num_rows, 1:num_cols] > slope_threshold
-        )
-        xx += (move_x + move_corners * (move_x == 0)) * horizontal_scale
-        yy += (move_y + move_corners * (move_y == 0)) * horizontal_scale
+        move_corners[:-1, :-1] += diff_corners > slope_threshold
+        move_corners[1:, 1:] -= -diff_corners > slope_threshold
+        # keep track of the moved vertices
+        if decimate_flat_regions:
+            moved = (move_x != 0) | (move_y != 0) | (move_corners != 0)
+        # apply the movement: the corner movement only applies if there is no movement along the axis
+        for axis, move in enumerate((move_x, move_y)):
+            np.copyto(move, move_corners, where=move == 0)
+            move *= horizontal_scale
+            vertices[..., axis] += move
 
-    # create vertices for the mesh
-    vertices = np.zeros((num_rows * num_cols, 3), dtype=np.float32)
-    vertices[:, 0] = xx.flatten()
-    vertices[:, 1] = yy.flatten()
-    vertices[:, 2] = hf.flatten() * vertical_scale
     # create triangles for the mesh
-    triangles = -np.ones((2 * (num_rows - 1) * (num_cols - 1), 3), dtype=np.uint32)
-    for i in range(num_rows - 1):
-        ind0 = np.arange(0, num_cols - 1) + i * num_cols
-        ind1 = ind0 + 1
-        ind2 = ind0 + num_cols
-        ind3 = ind2 + 1
-        start = 2 * i * (num_cols - 1)
-        stop = start + 2 * (num_cols - 1)
-        triangles[start:stop:2, 0] = ind0
-        triangles[start:stop:2, 1] = ind3
-        triangles[start:stop:2, 2] = ind1
-        triangles[start + 1 : stop : 2, 0] = ind0
-        triangles[start + 1 : stop : 2, 1] = ind2
-        triangles[start + 1 : stop : 2, 2] = ind3
+    if decimate_flat_regions:
+        block_rows, block_cols, block_sizes = _find_flat_blocks(height_field, moved)
+    else:
+        block_rows, block_cols = np.divmod(np.arange((num_rows - 1) * (num_cols - 1)), num_cols - 1)
+        block_sizes = 1
+    # indices of the corners of each block
+    ind0 = block_rows * num_cols + block_cols
+    ind1 = ind0 + block_sizes
+    ind2 = ind0 + block_sizes * num_cols
+    ind3 = ind2 + block_sizes
+    # each block is split into two triangles
+    triangles = np.empty((2 * len(ind0), 3), dtype=np.uint32)
+    triangles[0::2, 0] = ind0
+    triangles[0::2, 1] = ind3
+    triangles[0::2, 2] = ind1
+    triangles[1::2, 0] = ind0
+    triangles[1::2, 1] = ind2
+    triangles[1::2, 2] = ind3
+
+    # flatten the vertices
+    vertices = vertices.reshape(-1, 3)
+    # remove the vertices that are not part of any triangle
+    if decimate_flat_regions:
+        used = np.zeros(len(vertices), dtype=bool)
+        used[triangles] = True
+        new_indices = np.cumsum(used, dtype=np.int64) - 1
+        vertices = vertices[used]
+        triangles = new_indices[triangles].astype(np.uint32)
 
     return vertices, triangles
+
+
+"""
+Internal helpers.
+"""
+
+
+def _find_flat_blocks(
+    height_field: np.ndarray, moved: np.ndarray | None = None
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Find the largest flat square blocks of grid cells using a quad-tree.
+
+    A grid cell is flat if its four vertices have the same height and are not moved. At each level of the
+    quad-tree, a block of size :math:`2^k` is flat if its four child blocks are flat and have the same height.
+    Every grid cell is covered by exactly one of the returned blocks.
+
+    Args:
+        height_field: The input height-field array. Shape is (num_rows, num_cols).
+        moved: A boolean array indicating the vertices moved by the slope correction.
+            Shape is (num_rows, num_cols). Defaults to None, in which case no vertex is moved.
+
+    Returns:
+        A tuple containing the row index, column index and size (in number of cells) of each block.
+    """
+    # flat grid cells
+    heights = height_field[:-1, :-1]
+    flat = (heights == height_field[1:, :-1]) & (heights == height_field[:-1, 1:]) & (heights == height_field[1:, 1:])
+    if moved is not None:
+        flat &= ~(moved[:-1, :-1] | moved[1:, :-1] | moved[:-1, 1:] | moved[1:, 1:])
+    # build the quad-tree levels from bottom to top
+    levels = [flat]
+    while min(flat.shape) >= 2:
+        rows, cols = flat.shape[0] // 2, flat.shape[1] // 2
+        flat = flat[: 2 * rows, : 2 * cols].reshape(rows, 2, cols, 2)
+        heights = heights[: 2 * rows, : 2 * cols].reshape(rows, 2, cols, 2)
+        flat = flat.all(axis=(1, 3)) & (heights == heights[:, :1, :, :1]).all(axis=(1, 3))
+        heights = heights[:, 0, :, 0]
+        levels.append(flat)
+    # select the blocks from top to bottom
+    covered = np.zeros_like(levels[0])
+    block_rows, block_cols, block_sizes = list(), list(), list()
+    for level in reversed(range(len(levels))):
+        size = 2**level
+        rows, cols = levels[level].shape
+        # blocks that are not covered by a larger block
+        is_covered = covered[: rows * size, : cols * size].reshape(rows, size, cols, size).all(axis=(1, 3))
+        # note: at the lowest level, all remaining cells are added
+        selected = ~is_covered if level == 0 else levels[level] & ~is_covered
+        # mark the selected blocks as covered
+        covered[: rows * size, : cols * size] |= np.repeat(np.repeat(selected, size, axis=0), size, axis=1)
+        # store the selected blocks
+        rows_ids, cols_ids = np.nonzero(selected)
+        block_rows.append(rows_ids * size)
+        block_cols.append(cols_ids * size)
+        block_sizes.append(np.full(len(rows_ids), size))
+    return np.concatenate(block_rows), np.concatenate(block_cols), np.concatenate(block_sizes)
@@ -3,10 +3,18 @@
 #
 # SPDX-License-Identifier: BSD-3-Clause
 
+import multiprocessing as mp
 import numpy as np
 import os
+import runpy
+import shutil
+import sys
+import tempfile
 import torch
 import trimesh
+import types
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 
 import omni.log
 
@@ -15,10 +23,12 @@ from omni.isaac.lab.utils.io import dump_yaml
 from omni.isaac.lab.utils.timer import Timer
 from omni.isaac.lab.utils.warp import convert_to_warp_mesh
 
+from . import terrain_generator_worker
 from .height_field import HfTerrainBaseCfg
 from .terrain_generator_cfg import FlatPatchSamplingCfg, SubTerrainBaseCfg, TerrainGeneratorCfg
+from .terrain_generator_worker import generate_sub_terrain, generate_terrain_mesh, load_sub_terrain, save_array
 from .trimesh.utils import make_border
-from .utils import color_meshes_by_height, find_flat_patches
+from .utils import color_meshes_by_height, find_flat_patches_batched
 
 
 class TerrainGenerator:
@@ -63,6 +73,10 @@ class TerrainGenerator:
     in the :obj:`flat_patches` dictionary. The key specifies the intention of the flat patches and the
     value is a tensor containing the flat patches for each sub-terrain.
 
+    If :attr:`~TerrainGeneratorCfg.num_workers` is greater than zero, the sub-terrain meshes are generated
+    in parallel in a pool of worker processes. Each sub-terrain is then seeded independently based on the
+    generator seed and its (row, column) index, so that the result does not depend on the number of workers.
+
     If the flag :attr:`~TerrainGeneratorCfg.use_cache` is set to True, the terrains are cached based on their
     sub-terrain configurations. This means that if the same sub-terrain configuration is used
     multiple times, the terrain is only generated once and then reused. This is useful when
@@ -130,6 +144,8 @@ class TerrainGenerator:
             seed = self.cfg.seed
         else:
             seed = np.random.get_state()[1][0]
+        # store the seed for deriving the seeds of the sub-terrains generated in parallel
+        self._seed = int(seed)
         # set the seed for reproducibility
         # note: we create a new random number generator to avoid affecting the global state
         #  in the other places where random numbers are used.
@@ -139,8 +155,51 @@ class TerrainGenerator:
         self.flat_patches = {}
         # create a list of all sub-terrains
         self.terrain_meshes = list()
+        self._sub_terrain_cfgs: dict[tuple[int, int], SubTerrainBaseCfg] = dict()
         self.terrain_origins = np.zeros((self.cfg.num_rows, self.cfg.num_cols, 3))
 
+        # check if the whole terrain exists in the cache
+        # note: the terrain is only cached if the seed is set since it is not reproducible otherwise
+        terrain_cache_dir = None
+        if self.cfg.use_cache and self.cfg.seed is not None:
+            terrain_cache_dir = os.path.join(self.cfg.cache_dir, self._get_terrain_hash())
+        # load the terrain from the cache or generate it
+        if terrain_cache_dir is not None and os.path.exists(os.path.join(terrain_cache_dir, "faces.npy")):
+            with Timer("[INFO] Loading terrain from cache took"):
+                self._load_terrain_from_cache(terrain_cache_dir)
+        else:
+            self._generate_terrain()
+            # store the terrain in the cache
+            if terrain_cache_dir is not None:
+                self._save_terrain_to_cache(terrain_cache_dir)
+        # bound the size of the cache directory
+        if self.cfg.use_cache and self.cfg.cache_max_size is not None:
+            _evict_cache_entries(self.cfg.cache_dir, self.cfg.cache_max_size, keep_entry_dir=terrain_cache_dir)
+
+    def __str__(self):
+        """Return a string representation of the terrain generator."""
+        msg = "Terrain Generator:"
+        msg += f"\n\tSeed: {self.cfg.seed}"
+        msg += f"\n\tNumber of rows: {self.cfg.num_rows}"
+        msg += f"\n\tNumber of columns: {self.cfg.num_cols}"
+        msg += f"\n\tSub-terrain size: {self.cfg.size}"
+        msg += f"\n\tSub-terrain types: {list(self.cfg.sub_terrains.keys())}"
+        msg += f"\n\tCurriculum: {self.cfg.curriculum}"
+        msg += f"\n\tDifficulty range: {self.cfg.difficulty_range}"
+        msg += f"\n\tColor scheme: {self.cfg.color_scheme}"
+        msg += f"\n\tNumber of workers: {self.cfg.num_workers}"
+        msg += f"\n\tUse cache: {self.cfg.use_cache}"
+        if self.cfg.use_cache:
+            msg += f"\n\tCache directory: {self.cfg.cache_dir}"
+
+        return msg
+
+    """
+    Terrain generator functions.
+    """
+
+    def _generate_terrain(self):
+        """Generate the sub-terrains and combine them into a single terrain mesh."""
         # parse configuration and add sub-terrains
         # create terrains based on curriculum or randomly
         if self.cfg.curriculum:
@@ -153,6 +212,8 @@ class TerrainGenerator:
         self._add_terrain_border()
         # combine all the sub-terrains into a single mesh
         self.terrain_mesh = trimesh.util.concatenate(self.terrain_meshes)
+        # sample flat patches for all the sub-terrains
+        self._sample_flat_patches()
 
         # color the terrain mesh
         if self.cfg.color_scheme == "height":
@@ -178,27 +239,6 @@ class TerrainGenerator:
         for name, value in self.flat_patches.items():
             self.flat_patches[name] = value + terrain_origins_torch
 
-    def __str__(self):
-        """Return a string representation of the terrain generator."""
-        msg = "Terrain Generator:"
-        msg += f"\n\tSeed: {self.cfg.seed}"
-        msg += f"\n\tNumber of rows: {self.cfg.num_rows}"
-        msg += f"\n\tNumber of columns: {self.cfg.num_cols}"
-        msg += f"\n\tSub-terrain size: {self.cfg.size}"
-        msg += f"\n\tSub-terrain types: {list(self.cfg.sub_terrains.keys())}"
-        msg += f"\n\tCurriculum: {self.cfg.curriculum}"
-        msg += f"\n\tDifficulty range: {self.cfg.difficulty_range}"
-        msg += f"\n\tColor scheme: {self.cfg.color_scheme}"
-        msg += f"\n\tUse cache: {self.cfg.use_cache}"
-        if self.cfg.use_cache:
-            msg += f"\n\tCache directory: {self.cfg.cache_dir}"
-
-        return msg
-
-    """
-    Terrain generator functions.
-    """
-
     def _generate_random_terrains(self):
         """Add terrains based on randomly sampled difficulty parameter."""
         # normalize the proportions of the sub-terrains
@@ -208,6 +248,7 @@ class TerrainGenerator:
         sub_terrains_cfgs = list(self.cfg.sub_terrains.values())
 
         # randomly sample sub-terrains
+        sub_terrains = list()
         for index in range(self.cfg.num_rows * self.cfg.num_cols):
             # coordinate index of the sub-terrain
             (sub_row, sub_col) = np.unravel_index(index, (self.cfg.num_rows, self.cfg.num_cols))
@@ -215,10 +256,10 @@ class TerrainGenerator:
             sub_index = self.np_rng.choice(len(proportions), p=proportions)
             # randomly sample difficulty parameter
             difficulty = self.np_rng.uniform(*self.cfg.difficulty_range)
-            # generate terrain
-            mesh, origin = self._get_terrain_mesh(difficulty, sub_terrains_cfgs[sub_index])
-            # add to sub-terrains
-            self._add_sub_terrain(mesh, origin, sub_row, sub_col, sub_terrains_cfgs[sub_index])
+            # store the sub-terrain to generate
+            sub_terrains.append((sub_row, sub_col, difficulty, sub_terrains_cfgs[sub_index]))
+        # generate the sub-terrains
+        self._generate_sub_terrains(sub_terrains)
 
     def _generate_curriculum_terrains(self):
         """Add terrains based on the difficulty parameter."""
@@ -237,6 +278,7 @@ class TerrainGenerator:
         sub_terrains_cfgs = list(self.cfg.sub_terrains.values())
 
         # curriculum-based sub-terrains
+        sub_terrains = list()
         for sub_col in range(self.cfg.num_cols):
             for sub_row in range(self.cfg.num_rows):
                 # vary the difficulty parameter linearly over the number of rows
@@ -248,15 +290,119 @@ class TerrainGenerator:
                 lower, upper = self.cfg.difficulty_range
                 difficulty = (sub_row + self.np_rng.uniform()) / self.cfg.num_rows
                 difficulty = lower + (upper - lower) * difficulty
+                # store the sub-terrain to generate
+                sub_terrains.append((sub_row, sub_col, difficulty, sub_terrains_cfgs[sub_indices[sub_col]]))
+        # generate the sub-terrains
+        self._generate_sub_terrains(sub_terrains)
+
+    def _generate_sub_terrains(self, sub_terrains: list[tuple[int, int, float, SubTerrainBaseCfg]]):
+        """Generate the sub-terrains and add them to the list of sub-terrains.
+
+        The sub-terrains are added in the order of the input list. If the number of workers is greater
+        than zero, the sub-terrain meshes are generated in a pool of worker processes.
+
+        Args:
+            sub_terrains: A list of tuples containing the row index, column index, difficulty and
+                configuration of each sub-terrain.
+        """
+        # generate the sub-terrains sequentially
+        if self.cfg.num_workers <= 0:
+            for sub_row, sub_col, difficulty, sub_cfg in sub_terrains:
                 # generate terrain
-                mesh, origin = self._get_terrain_mesh(difficulty, sub_terrains_cfgs[sub_indices[sub_col]])
+                mesh, origin = self._get_terrain_mesh(difficulty, sub_cfg)
                 # add to sub-terrains
-                self._add_sub_terrain(mesh, origin, sub_row, sub_col, sub_terrains_cfgs[sub_indices[sub_col]])
+                self._add_sub_terrain(mesh, origin, sub_row, sub_col, sub_cfg)
+            return
+
+        # note: the sub-terrain arrays are exchanged through files in a temporary directory instead of being
+        #   pickled into the results of the workers
+        with tempfile.TemporaryDirectory(prefix="isaaclab_terrains_") as output_dir:
+            # resolve the inputs of the workers
+            tasks = list()
+            for sub_row, sub_col, difficulty, sub_cfg in sub_terrains:
+                # derive the seed of the sub-terrain from its location in the grid
+                seed = int(np.random.SeedSequence([self._seed, sub_row, sub_col]).generate_state(1)[0])
+                sub_terrain_dir = os.path.join(output_dir, f"{sub_row}_{sub_col}")
+                tasks.append((difficulty, sub_cfg, self.cfg, seed, sub_terrain_dir))
+            # generate the sub-terrains in the worker processes
+            try:
+                sub_terrain_dirs = _run_sub_terrain_workers(tasks, self.cfg.num_workers)
+            except BrokenProcessPool as e:
+                omni.log.warn(
+                    f"The worker processes of the terrain generator failed: {e}. Generating the sub-terrains in the"
+                    " main process instead."
+                )
+                # note: the sub-terrains are seeded in the same way, so the result does not change
+                sub_terrain_dirs = [generate_sub_terrain(*task) for task in tasks]
+            # assemble the sub-terrains in order
+            for (sub_row, sub_col, _, sub_cfg), sub_terrain_dir in zip(sub_terrains, sub_terrain_dirs):
+                mesh, origin = load_sub_terrain(sub_terrain_dir)
+                # add to sub-terrains
+                self._add_sub_terrain(mesh, origin, sub_row, sub_col, sub_cfg)
 
     """
     Internal helper functions.
     """
 
+    def _get_terrain_hash(self) -> str:
+        """Compute the hash that identifies the combined terrain in the cache.
+
+        Only the parameters that affect the generated terrain are hashed. The caching parameters and the number
+        of workers are left out, except for whether the sub-terrains are generated in parallel, which changes
+        the seeds of the sub-terrains.
+
+        Returns:
+            The MD5 hash of the terrain parameters.
+        """
+        terrain_dict = self.cfg.to_dict()
+        for name in ["use_cache", "cache_dir", "cache_max_size", "num_workers"]:
+            terrain_dict.pop(name)
+        terrain_dict["parallel"] = self.cfg.num_workers > 0
+        return dict_to_md5_hash(terrain_dict)
+
+    def _load_terrain_from_cache(self, terrain_cache_dir: str):
+        """Load the combined terrain mesh, origins and flat patches from the cache.
+
+        Args:
+            terrain_cache_dir: The cache directory of the terrain.
+        """
+        # load the terrain mesh
+        # note: the arrays are memory-mapped, so the data is only read from disk when it is accessed
+        vertices = np.load(os.path.join(terrain_cache_dir, "vertices.npy"), mmap_mode="r")
+        faces = np.load(os.path.join(terrain_cache_dir, "faces.npy"), mmap_mode="r")
+        vertex_colors = None
+        if os.path.exists(os.path.join(terrain_cache_dir, "vertex_colors.npy")):
+            vertex_colors = np.load(os.path.join(terrain_cache_dir, "vertex_colors.npy"))
+        self.terrain_mesh = trimesh.Trimesh(vertices=vertices, faces=faces, vertex_colors=vertex_colors, process=False)
+        self.terrain_meshes = [self.terrain_mesh]
+        # load the terrain origins
+        self.terrain_origins = np.load(os.path.join(terrain_cache_dir, "origin.npy"))
+        # load the flat patches
+        with np.load(os.path.join(terrain_cache_dir, "flat_patches.npz")) as flat_patches:
+            for name, value in flat_patches.items():
+                self.flat_patches[name] = torch.tensor(value, device=self.device)
+        # mark the cache entry as recently used
+        os.utime(terrain_cache_dir)
+
+    def _save_terrain_to_cache(self, terrain_cache_dir: str):
+        """Save the combined terrain mesh, origins and flat patches into the cache.
+
+        Args:
+            terrain_cache_dir: The cache directory of the terrain.
+        """
+        # create the cache directory
+        os.makedirs(terrain_cache_dir, exist_ok=True)
+        # save the data
+        # note: the faces are written last, so their existence indicates a complete cache entry
+        dump_yaml(os.path.join(terrain_cache_dir, "cfg.yaml"), self.cfg)
+        save_array(os.path.join(terrain_cache_dir, "origin.npy"), self.terrain_origins)
+        flat_patches = {name: value.cpu().numpy() for name, value in self.flat_patches.items()}
+        _save_arrays(os.path.join(terrain_cache_dir, "flat_patches.npz"), flat_patches)
+        if self.cfg.color_scheme != "none":
+            save_array(os.path.join(terrain_cache_dir, "vertex_colors.npy"), self.terrain_mesh.visual.vertex_colors)
+        save_array(os.path.join(terrain_cache_dir, "vertices.npy"), self.terrain_mesh.vertices)
+        save_array(os.path.join(terrain_cache_dir, "faces.npy"), self.terrain_mesh.faces)
+
     def _add_terrain_border(self):
         """Add a surrounding border over all the sub-terrains into the terrain meshes."""
         # border parameters
@@ -279,13 +425,60 @@ class TerrainGenerator:
         # add the border to the list of meshes
         self.terrain_meshes.append(border)
 
+    def _sample_flat_patches(self):
+        """Sample flat patches for all the sub-terrains on the combined terrain mesh.
+
+        The sub-terrains are grouped based on their flat patch sampling configurations. The patches of each
+        group are sampled simultaneously for all its sub-terrains, with the sampling region of each
+        sub-terrain bounded by its extents in the grid.
+        """
+        # group the sub-terrains based on their flat patch sampling configuration
+        groups: dict[tuple[str, int], tuple[str, FlatPatchSamplingCfg, list[tuple[int, int]]]] = dict()
+        for (row, col), sub_terrain_cfg in self._sub_terrain_cfgs.items():
+            if sub_terrain_cfg.flat_patch_sampling is None:
+                continue
+            for name, patch_cfg in sub_terrain_cfg.flat_patch_sampling.items():
+                groups.setdefault((name, id(patch_cfg)), (name, patch_cfg, list()))[2].append((row, col))
+        # check if there is anything to sample
+        if len(groups) == 0:
+            return
+
+        omni.log.info(f"Sampling flat patches for {len(self._sub_terrain_cfgs)} sub-terrains.")
+        # convert the combined mesh to warp mesh
+        wp_mesh = convert_to_warp_mesh(self.terrain_mesh.vertices, self.terrain_mesh.faces, device=self.device)
+        # sample flat patches based on each patch configuration
+        for name, patch_cfg, cells in groups.values():
+            # create the flat patches tensor (if not already created)
+            if name not in self.flat_patches:
+                self.flat_patches[name] = torch.zeros(
+                    (self.cfg.num_rows, self.cfg.num_cols, patch_cfg.num_patches, 3), device=self.device
+                )
+            # extents of the sub-terrains in the grid
+            # dim: (num_cells, 2, 2)
+            rows, cols = np.array(cells).T
+            lower = np.stack([rows * self.cfg.size[0], cols * self.cfg.size[1]], axis=-1)
+            bounds = np.stack([lower, lower + np.asarray(self.cfg.size)], axis=-1)
+            # add the flat patches to the tensor
+            self.flat_patches[name][torch.from_numpy(rows), torch.from_numpy(cols)] = find_flat_patches_batched(
+                wp_mesh=wp_mesh,
+                num_patches=patch_cfg.num_patches,
+                patch_radius=patch_cfg.patch_radius,
+                origins=self.terrain_origins[rows, cols],
+                x_range=patch_cfg.x_range,
+                y_range=patch_cfg.y_range,
+                z_range=patch_cfg.z_range,
+                max_height_diff=patch_cfg.max_height_diff,
+                bounds=bounds,
+            )
+
     def _add_sub_terrain(
         self, mesh: trimesh.Trimesh, origin: np.ndarray, row: int, col: int, sub_terrain_cfg: SubTerrainBaseCfg
     ):
         """Add input sub-terrain to the list of sub-terrains.
 
         This function adds the input sub-terrain mesh to the list of sub-terrains and updates the origin
-        of the sub-terrain in the list of origins. It also samples flat patches if specified.
+        of the sub-terrain in the list of origins. The flat patches are sampled later on the combined
+        terrain mesh (see :meth:`_sample_flat_patches`).
 
         Args:
             mesh: The mesh of the sub-terrain.
@@ -293,30 +486,8 @@ class TerrainGenerator:
             row: The row index of the sub-terrain.
             col: The column index of the sub-terrain.
         """
-        # sample flat patches if specified
-        if sub_terrain_cfg.flat_patch_sampling is not None:
-            omni.log.info(f"Sampling flat patches for sub-terrain at (row, col):  ({row}, {col})")
-            # convert the mesh to warp mesh
-            wp_mesh = convert_to_warp_mesh(mesh.vertices, mesh.faces, device=self.device)
-            # sample flat patches based on each patch configuration for that sub-terrain
-            for name, patch_cfg in sub_terrain_cfg.flat_patch_sampling.items():
-                patch_cfg: FlatPatchSamplingCfg
-                # create the flat patches tensor (if not already created)
-                if name not in self.flat_patches:
-                    self.flat_patches[name] = torch.zeros(
-                        (self.cfg.num_rows, self.cfg.num_cols, patch_cfg.num_patches, 3), device=self.device
-                    )
-                # add the flat patches to the tensor
-                self.flat_patches[name][row, col] = find_flat_patches(
-                    wp_mesh=wp_mesh,
-                    origin=origin,
-                    num_patches=patch_cfg.num_patches,
-                    patch_radius=patch_cfg.patch_radius,
-                    x_range=patch_cfg.x_range,
-                    y_range=patch_cfg.y_range,
-                    z_range=patch_cfg.z_range,
-                    max_height_diff=patch_cfg.max_height_diff,
-                )
+        # store the configuration for sampling flat patches on the combined mesh
+        self._sub_terrain_cfgs[(row, col)] = sub_terrain_cfg
 
         # transform the mesh to the correct position
         transform = np.eye(4)
@@ -344,44 +515,106 @@ class TerrainGenerator:
         Returns:
             The sub-terrain mesh and origin.
         """
-        # copy the configuration
-        cfg = cfg.copy()
-        # add other parameters to the sub-terrain configuration
-        cfg.difficulty = float(difficulty)
-        cfg.seed = self.cfg.seed
-        # generate hash for the sub-terrain
-        sub_terrain_hash = dict_to_md5_hash(cfg.to_dict())
-        # generate the file name
-        sub_terrain_cache_dir = os.path.join(self.cfg.cache_dir, sub_terrain_hash)
-        sub_terrain_obj_filename = os.path.join(sub_terrain_cache_dir, "mesh.obj")
-        sub_terrain_csv_filename = os.path.join(sub_terrain_cache_dir, "origin.csv")
-        sub_terrain_meta_filename = os.path.join(sub_terrain_cache_dir, "cfg.yaml")
-
-        # check if hash exists - if true, load the mesh and origin and return
-        if self.cfg.use_cache and os.path.exists(sub_terrain_obj_filename):
-            # load existing mesh
-            mesh = trimesh.load_mesh(sub_terrain_obj_filename, process=False)
-            origin = np.loadtxt(sub_terrain_csv_filename, delimiter=",")
-            # return the generated mesh
-            return mesh, origin
-
-        # generate the terrain
-        meshes, origin = cfg.function(difficulty, cfg)
-        mesh = trimesh.util.concatenate(meshes)
-        # offset mesh such that they are in their center
-        transform = np.eye(4)
-        transform[0:2, -1] = -cfg.size[0] * 0.5, -cfg.size[1] * 0.5
-        mesh.apply_transform(transform)
-        # change origin to be in the center of the sub-terrain
-        origin += transform[0:3, -1]
+        return generate_terrain_mesh(difficulty, cfg, self.cfg, self.cfg.seed, parallel=False)
 
-        # if caching is enabled, save the mesh and origin
-        if self.cfg.use_cache:
-            # create the cache directory
-            os.makedirs(sub_terrain_cache_dir, exist_ok=True)
-            # save the data
-            mesh.export(sub_terrain_obj_filename)
-            np.savetxt(sub_terrain_csv_filename, origin, delimiter=",", header="x,y,z")
-            dump_yaml(sub_terrain_meta_filename, cfg)
-        # return the generated mesh
-        return mesh, origin
+
+"""
+Helper functions.
+"""
+
+
+def _save_arrays(filename: str, arrays: dict[str, np.ndarray]):
+    """Save a dictionary of arrays into an uncompressed binary NumPy archive.
+
+    Similar to :func:`~omni.isaac.lab.terrains.terrain_generator_worker.save_array`, the archive is first
+    written into a temporary file which is then renamed.
+
+    Args:
+        filename: The path of the file.
+        arrays: The arrays to save.
+    """
+    tmp_filename = f"{filename}.{os.getpid()}.tmp"
+    with open(tmp_filename, "wb") as f:
+        np.savez(f, **arrays)
+    os.replace(tmp_filename, filename)
+
+
+def _evict_cache_entries(cache_dir: str, max_size: float, keep_entry_dir: str | None = None):
+    """Remove the least recently used entries from the cache directory until it fits the maximum size.
+
+    Each sub-directory of the cache directory is an entry. The entries are ordered based on their
+    modification time, which is updated whenever an entry is written or loaded.
+
+    Args:
+        cache_dir: The cache directory.
+        max_size: The maximum size of the cache directory (in MB).
+        keep_entry_dir: The cache entry that is never removed, i.e. the entry of the current terrain.
+            Defaults to None.
+    """
+    # collect the entries and their sizes
+    entries = list()
+    for name in os.listdir(cache_dir):
+        entry_dir = os.path.abspath(os.path.join(cache_dir, name))
+        if not os.path.isdir(entry_dir):
+            continue
+        entry_size = 0
+        for root, _, filenames in os.walk(entry_dir):
+            entry_size += sum(os.path.getsize(os.path.join(root, filename)) for filename in filenames)
+        entries.append((os.path.getmtime(entry_dir), entry_size, entry_dir))
+    # check that the current entry fits into the cache
+    if keep_entry_dir is not None:
+        keep_entry_dir = os.path.abspath(keep_entry_dir)
+        keep_entry_size = sum(entry_size for _, entry_size, entry_dir in entries if entry_dir == keep_entry_dir)
+        if keep_entry_size > max_size * 1024**2:
+            omni.log.warn(
+                f"The terrain cache entry '{keep_entry_dir}' ({keep_entry_size / 1024**2:.2f} MB) is larger than the"
+                f" maximum size of the cache ({max_size} MB). Only this entry is kept in the cache."
+            )
+    # remove the oldest entries until the cache fits the maximum size
+    cache_size = sum(entry_size for _, entry_size, _ in entries)
+    for _, entry_size, entry_dir in sorted(entries):
+        if cache_size <= max_size * 1024**2:
+            break
+        if entry_dir == keep_entry_dir:
+            continue
+        omni.log.info(f"Removing terrain cache entry: {entry_dir}")
+        shutil.rmtree(entry_dir, ignore_errors=True)
+        cache_size -= entry_size
+
+
+def _run_sub_terrain_workers(tasks: list[tuple], num_workers: int) -> list[str]:
+    """Generate the sub-terrains in a pool of worker processes.
+
+    The worker processes are started with the ``"spawn"`` method, since forking a multithreaded process
+    (such as the simulator application) is not safe. A spawned process usually runs the ``__main__`` module
+    of the parent process again, which would launch the application in every worker. The main module is
+    therefore hidden while the workers are started. The workers are initialized by
+    :mod:`~omni.isaac.lab.terrains.terrain_generator_worker`, which makes the sub-terrain modules importable
+    without the application.
+
+    Args:
+        tasks: The arguments of :func:`~omni.isaac.lab.terrains.terrain_generator_worker.generate_sub_terrain`
+            for each sub-terrain.
+        num_workers: The number of worker processes.
+
+    Returns:
+        The directories containing the arrays of the sub-terrains, in the order of the tasks.
+
+    Raises:
+        BrokenProcessPool: When a worker process terminated abruptly.
+    """
+    executor = ProcessPoolExecutor(
+        max_workers=num_workers,
+        mp_context=mp.get_context("spawn"),
+        initializer=runpy.run_path,
+        initargs=(terrain_generator_worker.__file__, None, terrain_generator_worker.WORKER_INIT_RUN_NAME),
+    )
+    with executor:
+        # note: the worker processes are started when the tasks are submitted
+        main_module = sys.modules["__main__"]
+        sys.modules["__main__"] = types.ModuleType("__main__")
+        try:
+            futures = [executor.submit(generate_sub_terrain, *task) for task in tasks]
+        finally:
+            sys.modules["__main__"] = main_module
+        return [future.result() for future in futures]
@@ -194,7 +194,38 @@ class TerrainGeneratorCfg:
     If enabled, the generated terrains are stored in the cache directory. When generating terrains, the cache
     is checked to see if the terrain already exists. If it does, the terrain is loaded from the cache. Otherwise,
     the terrain is generated and stored in the cache. Caching can be used to speed up terrain generation.
+
+    If the :attr:`seed` is set, the combined terrain (mesh, origins and flat patches) is also cached based on
+    the parameters of the generator configuration that affect the terrain. The caching parameters and the
+    number of workers (apart from whether it is zero) are not part of the key. In this case, the sub-terrains
+    are not processed at all on a warm start.
     """
 
     cache_dir: str = "/tmp/isaaclab/terrains"
     """The directory where the terrain cache is stored. Defaults to "/tmp/isaaclab/terrains"."""
+
+    cache_max_size: float | None = None
+    """The maximum size of the cache directory (in MB). Defaults to None, in which case the size is unbounded.
+
+    If set, the least recently used cache entries are removed after the terrain is generated
+    until the size of the cache directory is within the limit. The entry of the current terrain is never
+    removed, even if it is larger than the limit.
+    """
+
+    num_workers: int = 0
+    """Number of worker processes used to generate the sub-terrains. Defaults to 0, in which case the
+    sub-terrains are generated sequentially in the main process.
+
+    If greater than zero, the sub-terrain meshes are generated in a pool of worker processes and assembled
+    in the main process in the same row and column order as the sequential generation. Each sub-terrain is
+    generated with a random seed derived from :attr:`seed` and its (row, column) index. This makes the
+    generated terrain independent of the number of workers. However, it differs from the terrain generated
+    sequentially, where all the sub-terrains share the global NumPy random state.
+
+    Note:
+        The worker processes are started with the ``"spawn"`` method and do not run the simulator application.
+        The sub-terrain configurations are sent to them, so their generation functions must be picklable
+        (i.e. defined at the module level of an importable module) and must not import modules that require
+        the application. If the worker processes fail to start, the sub-terrains are generated in the main
+        process with the same seeds.
+    """
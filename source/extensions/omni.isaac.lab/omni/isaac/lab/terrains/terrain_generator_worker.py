@@ -0,0 +1,189 @@
+# Copyright (c) 2022-2024, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Generation of the sub-terrain meshes in the worker processes of the terrain generator.
+
+The worker processes of :class:`omni.isaac.lab.terrains.TerrainGenerator` do not run the simulator application.
+Thus, this module and the sub-terrain functions it calls only depend on NumPy, trimesh, SciPy and the utilities
+in :mod:`omni.isaac.lab.utils`, which do not require the application.
+
+The ``__init__`` module of the :mod:`omni.isaac.lab.terrains` package imports the terrain importer, which requires
+the application. The worker processes therefore run this module as their initializer (see
+:func:`register_terrains_package`), which registers the package without running its ``__init__`` module. The
+sub-terrain functions and configurations sent to the workers are then imported from their own modules.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import os
+import sys
+import trimesh
+import types
+from typing import TYPE_CHECKING
+
+from omni.isaac.lab.utils.dict import dict_to_md5_hash
+from omni.isaac.lab.utils.io import dump_yaml
+
+if TYPE_CHECKING:
+    from .terrain_generator_cfg import SubTerrainBaseCfg, TerrainGeneratorCfg
+
+TERRAINS_PACKAGE_NAME = "omni.isaac.lab.terrains"
+"""The name of the package containing the sub-terrain functions and configurations."""
+
+WORKER_INIT_RUN_NAME = "__terrain_generator_worker__"
+"""The module name this file is executed with when it initializes a worker process."""
+
+
+def register_terrains_package():
+    """Registers the :mod:`omni.isaac.lab.terrains` package without running its ``__init__`` module.
+
+    The sub-modules of the package are imported from the package directory as usual. This function does nothing
+    if the package is already imported.
+    """
+    if TERRAINS_PACKAGE_NAME in sys.modules:
+        return
+    package = types.ModuleType(TERRAINS_PACKAGE_NAME)
+    package.__path__ = [os.path.dirname(os.path.abspath(__file__))]
+    package.__package__ = TERRAINS_PACKAGE_NAME
+    sys.modules[TERRAINS_PACKAGE_NAME] = package
+
+
+def generate_sub_terrain(
+    difficulty: float, cfg: SubTerrainBaseCfg, generator_cfg: TerrainGeneratorCfg, seed: int, output_dir: str
+) -> str:
+    """Generate a sub-terrain mesh and save its arrays into the output directory.
+
+    The global NumPy random state is seeded before generating the sub-terrain so that the result does not
+    depend on the previous sub-terrains generated by the worker. The vertices, faces and origin of the
+    sub-terrain are saved as ``vertices.npy``, ``faces.npy`` and ``origin.npy`` respectively.
+
+    Args:
+        difficulty: The difficulty parameter.
+        cfg: The configuration of the sub-terrain.
+        generator_cfg: The configuration of the terrain generator.
+        seed: The seed for the random number generator.
+        output_dir: The directory to save the arrays of the sub-terrain into.
+
+    Returns:
+        The directory containing the arrays of the sub-terrain.
+    """
+    # seed the global random state used by the sub-terrain functions
+    np.random.seed(seed)
+    # generate the terrain
+    mesh, origin = generate_terrain_mesh(difficulty, cfg, generator_cfg, seed, parallel=True)
+    # save the arrays
+    os.makedirs(output_dir, exist_ok=True)
+    save_array(os.path.join(output_dir, "origin.npy"), origin)
+    save_array(os.path.join(output_dir, "vertices.npy"), mesh.vertices)
+    save_array(os.path.join(output_dir, "faces.npy"), mesh.faces)
+    return output_dir
+
+
+def load_sub_terrain(output_dir: str) -> tuple[trimesh.Trimesh, np.ndarray]:
+    """Load a sub-terrain saved by :func:`generate_sub_terrain`.
+
+    Args:
+        output_dir: The directory containing the arrays of the sub-terrain.
+
+    Returns:
+        The sub-terrain mesh and origin.
+    """
+    vertices = np.load(os.path.join(output_dir, "vertices.npy"))
+    faces = np.load(os.path.join(output_dir, "faces.npy"))
+    origin = np.load(os.path.join(output_dir, "origin.npy"))
+    return trimesh.Trimesh(vertices=vertices, faces=faces, process=False), origin
+
+
+def generate_terrain_mesh(
+    difficulty: float, cfg: SubTerrainBaseCfg, generator_cfg: TerrainGeneratorCfg, seed: int | None, parallel: bool
+) -> tuple[trimesh.Trimesh, np.ndarray]:
+    """Generate a sub-terrain mesh based on the input difficulty parameter.
+
+    The cache entry of the sub-terrain is identified by its configuration, the seed and the generation mode.
+    The sub-terrains generated in parallel are seeded individually, so their meshes differ from the ones
+    generated sequentially with the same configuration.
+
+    Args:
+        difficulty: The difficulty parameter.
+        cfg: The configuration of the sub-terrain.
+        generator_cfg: The configuration of the terrain generator.
+        seed: The seed the sub-terrain is generated with. This is the generator seed for the sequential
+            generation and the seed derived for the sub-terrain for the parallel generation.
+        parallel: Whether the sub-terrain is generated in a worker process.
+
+    Returns:
+        The sub-terrain mesh and origin.
+    """
+    # copy the configuration
+    cfg = cfg.copy()
+    # add other parameters to the sub-terrain configuration
+    cfg.difficulty = float(difficulty)
+    cfg.seed = seed
+    # generate hash for the sub-terrain
+    sub_terrain_hash = dict_to_md5_hash({"cfg": cfg.to_dict(), "parallel": parallel})
+    # generate the file name
+    sub_terrain_cache_dir = os.path.join(generator_cfg.cache_dir, sub_terrain_hash)
+    sub_terrain_vertices_filename = os.path.join(sub_terrain_cache_dir, "vertices.npy")
+    sub_terrain_faces_filename = os.path.join(sub_terrain_cache_dir, "faces.npy")
+    sub_terrain_origin_filename = os.path.join(sub_terrain_cache_dir, "origin.npy")
+    sub_terrain_meta_filename = os.path.join(sub_terrain_cache_dir, "cfg.yaml")
+
+    # check if hash exists - if true, load the mesh and origin and return
+    # note: the faces are written last, so their existence indicates a complete cache entry
+    if generator_cfg.use_cache and os.path.exists(sub_terrain_faces_filename):
+        # load existing mesh
+        # note: the arrays are memory-mapped, so the data is only read from disk when it is accessed
+        vertices = np.load(sub_terrain_vertices_filename, mmap_mode="r")
+        faces = np.load(sub_terrain_faces_filename, mmap_mode="r")
+        mesh = trimesh.Trimesh(vertices=vertices, faces=faces, process=False)
+        origin = np.load(sub_terrain_origin_filename)
+        # mark the cache entry as recently used
+        os.utime(sub_terrain_cache_dir)
+        # return the generated mesh
+        return mesh, origin
+
+    # generate the terrain
+    meshes, origin = cfg.function(difficulty, cfg)
+    mesh = trimesh.util.concatenate(meshes)
+    # offset mesh such that they are in their center
+    transform = np.eye(4)
+    transform[0:2, -1] = -cfg.size[0] * 0.5, -cfg.size[1] * 0.5
+    mesh.apply_transform(transform)
+    # change origin to be in the center of the sub-terrain
+    origin += transform[0:3, -1]
+
+    # if caching is enabled, save the mesh and origin
+    if generator_cfg.use_cache:
+        # create the cache directory
+        os.makedirs(sub_terrain_cache_dir, exist_ok=True)
+        # save the data
+        dump_yaml(sub_terrain_meta_filename, cfg)
+        save_array(sub_terrain_origin_filename, origin)
+        save_array(sub_terrain_vertices_filename, mesh.vertices)
+        save_array(sub_terrain_faces_filename, mesh.faces)
+    # return the generated mesh
+    return mesh, origin
+
+
+def save_array(filename: str, array: np.ndarray):
+    """Save an array into a binary NumPy file.
+
+    The array is first written into a temporary file which is then renamed. This ensures that
+    a partially written file is never loaded from the cache.
+
+    Args:
+        filename: The path of the file.
+        array: The array to save.
+    """
+    tmp_filename = f"{filename}.{os.getpid()}.tmp"
+    with open(tmp_filename, "wb") as f:
+        np.save(f, np.ascontiguousarray(array))
+    os.replace(tmp_filename, filename)
+
+
+# register the package when the module initializes a worker process
+if __name__ == WORKER_INIT_RUN_NAME:
+    register_terrains_package()
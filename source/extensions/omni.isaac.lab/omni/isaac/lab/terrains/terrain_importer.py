@@ -16,7 +16,7 @@ from pxr import UsdGeom
 import omni.isaac.lab.sim as sim_utils
 from omni.isaac.lab.markers import VisualizationMarkers
 from omni.isaac.lab.markers.config import FRAME_MARKER_CFG
-from omni.isaac.lab.utils.warp import convert_to_warp_mesh
+from omni.isaac.lab.utils.warp import convert_to_warp_mesh, raycast_mesh
 
 from .terrain_generator import TerrainGenerator
 from .trimesh.utils import make_plane
@@ -54,6 +54,12 @@ class TerrainImporter:
     """
     env_origins: torch.Tensor
     """The origins of the environments. Shape is (num_envs, 3)."""
+    height_map: torch.Tensor | None
+    """The height map rasterized from the terrain mesh. Shape is (num_x, num_y).
+
+    If None, then the height map is not configured. Please refer to
+    :attr:`TerrainImporterCfg.height_map_resolution` for more information.
+    """
 
     def __init__(self, cfg: TerrainImporterCfg):
         """Initialize the terrain importer.
@@ -78,6 +84,7 @@ class TerrainImporter:
         self.warp_meshes = dict()
         self.env_origins = None
         self.terrain_origins = None
+        self.height_map = None
         # private variables
         self._terrain_flat_patches = dict()
 
@@ -109,6 +116,15 @@ class TerrainImporter:
         else:
             raise ValueError(f"Terrain type '{self.cfg.terrain_type}' not available.")
 
+        # rasterize the terrain into a height map
+        if self.cfg.height_map_resolution is not None:
+            if self.cfg.terrain_type == "plane":
+                # the ground plane is flat: a single cell covers it
+                resolution = float(np.max(self.meshes["terrain"].extents[:2]))
+            else:
+                resolution = self.cfg.height_map_resolution
+            self._build_height_map("terrain", resolution)
+
         # set initial state of debug visualization
         self.set_debug_vis(self.cfg.debug_vis)
 
@@ -277,6 +293,51 @@ class TerrainImporter:
         device = "cuda" if "cuda" in self.device else "cpu"
         self.warp_meshes[key] = convert_to_warp_mesh(vertices, faces, device=device)
 
+    """
+    Operations - Height map.
+    """
+
+    def sample_height(self, xy: torch.Tensor) -> torch.Tensor:
+        """Sample the terrain height at the given positions from the height map.
+
+        The height is bilinearly interpolated between the four closest grid points of the height map.
+        Positions outside the height map are clamped to its border.
+
+        Args:
+            xy: The positions (in world frame) to query. Shape is (..., 2). Additional columns
+                (such as the z-coordinate) are ignored.
+
+        Returns:
+            The terrain heights at the positions. Shape is (...).
+
+        Raises:
+            RuntimeError: If the height map is not configured.
+        """
+        # check that the height map exists
+        if self.height_map is None:
+            raise RuntimeError(
+                "Height map is not configured. Please set 'height_map_resolution' in the terrain importer config."
+            )
+        num_x, num_y = self.height_map.shape
+        # convert positions to continuous grid coordinates
+        u = ((xy[..., 0].to(self.device) - self._height_map_origin[0]) / self._height_map_resolution).clamp(
+            0, num_x - 1
+        )
+        v = ((xy[..., 1].to(self.device) - self._height_map_origin[1]) / self._height_map_resolution).clamp(
+            0, num_y - 1
+        )
+        # lower-left grid point of the cell containing the positions
+        i = u.floor().long().clamp(max=num_x - 2)
+        j = v.floor().long().clamp(max=num_y - 2)
+        fu = u - i
+        fv = v - j
+        # bilinear interpolation
+        h00 = self.height_map[i, j]
+        h10 = self.height_map[i + 1, j]
+        h01 = self.height_map[i, j + 1]
+        h11 = self.height_map[i + 1, j + 1]
+        return (h00 * (1 - fu) + h10 * fu) * (1 - fv) + (h01 * (1 - fu) + h11 * fu) * fv
+
     """
     Operations - Origins.
     """
@@ -325,6 +386,41 @@ class TerrainImporter:
     Internal helpers.
     """
 
+    def _build_height_map(self, key: str, resolution: float):
+        """Rasterize the mesh into a height map by ray-casting it downwards on a regular grid.
+
+        Grid points that do not hit the mesh are set to the lowest height of the mesh.
+
+        Args:
+            key: The key of the mesh to rasterize.
+            resolution: The spacing (in m) between the grid points.
+        """
+        mesh = self.meshes[key]
+        (x_min, y_min, z_min), (x_max, y_max, z_max) = mesh.bounds
+        # number of grid points along each axis (at least two for interpolation)
+        num_x = max(int(np.ceil((x_max - x_min) / resolution)) + 1, 2)
+        num_y = max(int(np.ceil((y_max - y_min) / resolution)) + 1, 2)
+        # create the grid of rays above the mesh
+        xs = x_min + resolution * torch.arange(num_x, device=self.device, dtype=torch.float)
+        ys = y_min + resolution * torch.arange(num_y, device=self.device, dtype=torch.float)
+        ray_starts = torch.empty(num_x, num_y, 3, device=self.device)
+        ray_starts[..., 0] = xs.unsqueeze(1)
+        ray_starts[..., 1] = ys.unsqueeze(0)
+        ray_starts[..., 2] = z_max + 1.0
+        ray_directions = torch.zeros_like(ray_starts)
+        ray_directions[..., 2] = -1.0
+        # cast the rays
+        ray_hits = raycast_mesh(
+            ray_starts.view(-1, 3), ray_directions.view(-1, 3), self.warp_meshes[key], max_dist=z_max - z_min + 2.0
+        )[0]
+        height_map = ray_hits[:, 2].view(num_x, num_y)
+        # fill the missed hits with the lowest height
+        height_map[~torch.isfinite(height_map)] = z_min
+        # store the height map
+        self.height_map = height_map.contiguous()
+        self._height_map_origin = (float(x_min), float(y_min))
+        self._height_map_resolution = float(resolution)
+
     def _compute_env_origins_curriculum(self, num_envs: int, origins: torch.Tensor) -> torch.Tensor:
         """Compute the origins of the environments defined by the sub-terrains origins."""
         # extract number of rows and cols
@@ -99,5 +99,16 @@ class TerrainImporterCfg:
       This parameter is used only when sub-terrain origins are defined.
     """
 
+    height_map_resolution: float | None = None
+    """The resolution (in m) of the height map rasterized from the terrain mesh. Defaults to None.
+
+    If None, then no height map is created and :meth:`TerrainImporter.sample_height` is not available.
+    Otherwise, the terrain mesh is ray-casted once on a regular grid with the given spacing and the
+    heights are stored as a tensor on the simulation device.
+
+    Note:
+      For the ``"plane"`` terrain type, the resolution is ignored since the ground is flat.
+    """
+
     debug_vis: bool = False
     """Whether to enable visualization of terrain origins for the terrain. Defaults to False."""
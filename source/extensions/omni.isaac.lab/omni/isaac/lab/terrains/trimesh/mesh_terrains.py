@@ -14,7 +14,7 @@ import trimesh
 from typing import TYPE_CHECKING
 
 from .utils import *  # noqa: F401, F403
-from .utils import make_border, make_plane
+from .utils import make_border, make_boxes, make_plane, make_repeated_objects
 
 if TYPE_CHECKING:
     from . import mesh_terrains_cfg
@@ -97,50 +97,22 @@ def pyramid_stairs_terrain(
     terrain_center = [0.5 * cfg.size[0], 0.5 * cfg.size[1], 0.0]
     terrain_size = (cfg.size[0] - 2 * cfg.border_width, cfg.size[1] - 2 * cfg.border_width)
     # -- generate the stair pattern
-    for k in range(num_steps):
-        # check if we need to add holes around the steps
-        if cfg.holes:
-            box_size = (cfg.platform_width, cfg.platform_width)
-        else:
-            box_size = (terrain_size[0] - 2 * k * cfg.step_width, terrain_size[1] - 2 * k * cfg.step_width)
-        # compute the quantities of the box
-        # -- location
-        box_z = terrain_center[2] + k * step_height / 2.0
-        box_offset = (k + 0.5) * cfg.step_width
-        # -- dimensions
-        box_height = (k + 2) * step_height
-        # generate the boxes
-        # top/bottom
-        box_dims = (box_size[0], cfg.step_width, box_height)
-        # -- top
-        box_pos = (terrain_center[0], terrain_center[1] + terrain_size[1] / 2.0 - box_offset, box_z)
-        box_top = trimesh.creation.box(box_dims, trimesh.transformations.translation_matrix(box_pos))
-        # -- bottom
-        box_pos = (terrain_center[0], terrain_center[1] - terrain_size[1] / 2.0 + box_offset, box_z)
-        box_bottom = trimesh.creation.box(box_dims, trimesh.transformations.translation_matrix(box_pos))
-        # right/left
-        if cfg.holes:
-            box_dims = (cfg.step_width, box_size[1], box_height)
-        else:
-            box_dims = (cfg.step_width, box_size[1] - 2 * cfg.step_width, box_height)
-        # -- right
-        box_pos = (terrain_center[0] + terrain_size[0] / 2.0 - box_offset, terrain_center[1], box_z)
-        box_right = trimesh.creation.box(box_dims, trimesh.transformations.translation_matrix(box_pos))
-        # -- left
-        box_pos = (terrain_center[0] - terrain_size[0] / 2.0 + box_offset, terrain_center[1], box_z)
-        box_left = trimesh.creation.box(box_dims, trimesh.transformations.translation_matrix(box_pos))
-        # add the boxes to the list of meshes
-        meshes_list += [box_top, box_bottom, box_right, box_left]
-
+    k = np.arange(num_steps)
+    # compute the quantities of the boxes
+    # -- location
+    box_z = terrain_center[2] + k * step_height / 2.0
+    # -- dimensions
+    box_height = (k + 2) * step_height
+    box_dims, box_pos = _make_stairs_boxes(cfg, terrain_center, terrain_size, box_z, box_height)
     # generate final box for the middle of the terrain
-    box_dims = (
+    box_dims.append([
         terrain_size[0] - 2 * num_steps * cfg.step_width,
         terrain_size[1] - 2 * num_steps * cfg.step_width,
         (num_steps + 2) * step_height,
-    )
-    box_pos = (terrain_center[0], terrain_center[1], terrain_center[2] + num_steps * step_height / 2)
-    box_middle = trimesh.creation.box(box_dims, trimesh.transformations.translation_matrix(box_pos))
-    meshes_list.append(box_middle)
+    ])
+    box_pos.append([terrain_center[0], terrain_center[1], terrain_center[2] + num_steps * step_height / 2])
+    # generate all the boxes as a single mesh
+    meshes_list.append(make_boxes(np.array(box_dims), np.array(box_pos)))
     # origin of the terrain
     origin = np.array([terrain_center[0], terrain_center[1], (num_steps + 1) * step_height])
 
@@ -198,49 +170,22 @@ def inverted_pyramid_stairs_terrain(
     terrain_center = [0.5 * cfg.size[0], 0.5 * cfg.size[1], 0.0]
     terrain_size = (cfg.size[0] - 2 * cfg.border_width, cfg.size[1] - 2 * cfg.border_width)
     # -- generate the stair pattern
-    for k in range(num_steps):
-        # check if we need to add holes around the steps
-        if cfg.holes:
-            box_size = (cfg.platform_width, cfg.platform_width)
-        else:
-            box_size = (terrain_size[0] - 2 * k * cfg.step_width, terrain_size[1] - 2 * k * cfg.step_width)
-        # compute the quantities of the box
-        # -- location
-        box_z = terrain_center[2] - total_height / 2 - (k + 1) * step_height / 2.0
-        box_offset = (k + 0.5) * cfg.step_width
-        # -- dimensions
-        box_height = total_height - (k + 1) * step_height
-        # generate the boxes
-        # top/bottom
-        box_dims = (box_size[0], cfg.step_width, box_height)
-        # -- top
-        box_pos = (terrain_center[0], terrain_center[1] + terrain_size[1] / 2.0 - box_offset, box_z)
-        box_top = trimesh.creation.box(box_dims, trimesh.transformations.translation_matrix(box_pos))
-        # -- bottom
-        box_pos = (terrain_center[0], terrain_center[1] - terrain_size[1] / 2.0 + box_offset, box_z)
-        box_bottom = trimesh.creation.box(box_dims, trimesh.transformations.translation_matrix(box_pos))
-        # right/left
-        if cfg.holes:
-            box_dims = (cfg.step_width, box_size[1], box_height)
-        else:
-            box_dims = (cfg.step_width, box_size[1] - 2 * cfg.step_width, box_height)
-        # -- right
-        box_pos = (terrain_center[0] + terrain_size[0] / 2.0 - box_offset, terrain_center[1], box_z)
-        box_right = trimesh.creation.box(box_dims, trimesh.transformations.translation_matrix(box_pos))
-        # -- left
-        box_pos = (terrain_center[0] - terrain_size[0] / 2.0 + box_offset, terrain_center[1], box_z)
-        box_left = trimesh.creation.box(box_dims, trimesh.transformations.translation_matrix(box_pos))
-        # add the boxes to the list of meshes
-        meshes_list += [box_top, box_bottom, box_right, box_left]
+    k = np.arange(num_steps)
+    # compute the quantities of the boxes
+    # -- location
+    box_z = terrain_center[2] - total_height / 2 - (k + 1) * step_height / 2.0
+    # -- dimensions
+    box_height = total_height - (k + 1) * step_height
+    box_dims, box_pos = _make_stairs_boxes(cfg, terrain_center, terrain_size, box_z, box_height)
     # generate final box for the middle of the terrain
-    box_dims = (
+    box_dims.append([
         terrain_size[0] - 2 * num_steps * cfg.step_width,
         terrain_size[1] - 2 * num_steps * cfg.step_width,
         step_height,
-    )
-    box_pos = (terrain_center[0], terrain_center[1], terrain_center[2] - total_height - step_height / 2)
-    box_middle = trimesh.creation.box(box_dims, trimesh.transformations.translation_matrix(box_pos))
-    meshes_list.append(box_middle)
+    ])
+    box_pos.append([terrain_center[0], terrain_center[1], terrain_center[2] - total_height - step_height / 2])
+    # generate all the boxes as a single mesh
+    meshes_list.append(make_boxes(np.array(box_dims), np.array(box_pos)))
     # origin of the terrain
     origin = np.array([terrain_center[0], terrain_center[1], -(num_steps + 1) * step_height])
 
@@ -685,27 +630,19 @@ def star_terrain(
     )
     meshes_list.append(platform)
     # Generate bars to connect the platform to the terrain
-    transform = np.eye(4)
-    transform[:3, -1] = np.asarray(platform_center)
-    yaw = 0.0
-    for _ in range(cfg.num_bars):
-        # compute the length of the bar based on the yaw
-        # length changes since the bar is connected to a square border
-        bar_length = cfg.size[0]
-        if yaw < 0.25 * np.pi:
-            bar_length /= np.math.cos(yaw)
-        elif yaw < 0.75 * np.pi:
-            bar_length /= np.math.sin(yaw)
-        else:
-            bar_length /= np.math.cos(np.pi - yaw)
-        # compute the transform of the bar
-        transform[0:3, 0:3] = tf.Rotation.from_euler("z", yaw).as_matrix()
-        # add the bar to the mesh
-        dim = [bar_length - bar_width, bar_width, bar_height]
-        bar = trimesh.creation.box(dim, transform)
-        meshes_list.append(bar)
-        # increment the yaw
-        yaw += np.pi / cfg.num_bars
+    # -- the bars are evenly spaced around the platform
+    yaw = np.concatenate([[0.0], np.cumsum(np.full(cfg.num_bars - 1, np.pi / cfg.num_bars))])
+    # compute the length of the bars based on the yaw
+    # length changes since the bar is connected to a square border
+    bar_length = cfg.size[0] / np.where(
+        yaw < 0.25 * np.pi, np.cos(yaw), np.where(yaw < 0.75 * np.pi, np.sin(yaw), np.cos(np.pi - yaw))
+    )
+    # compute the dimensions and poses of the bars
+    dims = np.stack([bar_length - bar_width, np.full_like(yaw, bar_width), np.full_like(yaw, bar_height)], axis=-1)
+    positions = np.tile(np.asarray(platform_center), (cfg.num_bars, 1))
+    rotations = tf.Rotation.from_euler("z", yaw).as_matrix()
+    # add the bars to the mesh
+    meshes_list.append(make_boxes(dims, positions, rotations))
     # Generate the exterior border
     inner_size = (cfg.size[0] - 2 * bar_width, cfg.size[1] - 2 * bar_width)
     meshes_list += make_border(cfg.size, inner_size, bar_height, platform_center)
@@ -816,10 +753,13 @@ def repeated_objects_terrain(
     platform_corners[0, :] *= 1 - platform_clearance
     platform_corners[1, :] *= 1 + platform_clearance
     # sample center for objects
-    while True:
-        object_centers = np.zeros((num_objects, 3))
-        object_centers[:, 0] = np.random.uniform(0, cfg.size[0], num_objects)
-        object_centers[:, 1] = np.random.uniform(0, cfg.size[1], num_objects)
+    # note: only the centers that are on the platform are resampled
+    object_centers = np.zeros((num_objects, 3))
+    masks = np.ones(num_objects, dtype=bool)
+    while np.any(masks):
+        num_samples = np.count_nonzero(masks)
+        object_centers[masks, 0] = np.random.uniform(0, cfg.size[0], num_samples)
+        object_centers[masks, 1] = np.random.uniform(0, cfg.size[1], num_samples)
         # filter out the centers that are on the platform
         is_within_platform_x = np.logical_and(
             object_centers[:, 0] >= platform_corners[0, 0], object_centers[:, 0] <= platform_corners[1, 0]
@@ -828,17 +768,20 @@ def repeated_objects_terrain(
             object_centers[:, 1] >= platform_corners[0, 1], object_centers[:, 1] <= platform_corners[1, 1]
         )
         masks = np.logical_and(is_within_platform_x, is_within_platform_y)
-        # if there are no objects on the platform, break
-        if not np.any(masks):
-            break
 
     # generate obstacles (but keep platform clean)
-    for index in range(len(object_centers)):
-        # randomize the height of the object
-        ob_height = height + np.random.uniform(-cfg.max_height_noise, cfg.max_height_noise)
-        if ob_height > 0.0:
-            object_mesh = object_func(center=object_centers[index], height=ob_height, **object_kwargs)
-            meshes_list.append(object_mesh)
+    # -- randomize the height of the objects
+    object_heights = height + np.random.uniform(-cfg.max_height_noise, cfg.max_height_noise, num_objects)
+    # -- keep only the objects with a positive height
+    object_centers = object_centers[object_heights > 0.0]
+    object_heights = object_heights[object_heights > 0.0]
+    if len(object_centers) > 0:
+        if isinstance(cfg.object_type, str):
+            # generate all the objects as a single mesh
+            meshes_list.append(make_repeated_objects(cfg.object_type, object_centers, object_heights, **object_kwargs))
+        else:
+            for center, ob_height in zip(object_centers, object_heights):
+                meshes_list.append(object_func(center=center, height=ob_height, **object_kwargs))
 
     # generate a ground plane for the terrain
     ground_plane = make_plane(cfg.size, height=0.0, center_zero=False)
@@ -850,3 +793,61 @@ def repeated_objects_terrain(
     meshes_list.append(platform)
 
     return meshes_list, origin
+
+
+"""
+Helper functions.
+"""
+
+
+def _make_stairs_boxes(
+    cfg: mesh_terrains_cfg.MeshPyramidStairsTerrainCfg,
+    terrain_center: list[float],
+    terrain_size: tuple[float, float],
+    box_z: np.ndarray,
+    box_height: np.ndarray,
+) -> tuple[list[list[float]], list[list[float]]]:
+    """Compute the dimensions and positions of the boxes forming the steps of the pyramid stairs terrains.
+
+    Each step is made of four boxes (top, bottom, right and left) around the center of the terrain.
+
+    Args:
+        cfg: The configuration for the terrain.
+        terrain_center: The center of the terrain (in m).
+        terrain_size: The size of the terrain without the border (in m).
+        box_z: The z-position of the center of the boxes of each step (in m). Shape is (num_steps,).
+        box_height: The height of the boxes of each step (in m). Shape is (num_steps,).
+
+    Returns:
+        A tuple containing the list of dimensions and positions of the boxes, ordered by step.
+    """
+    k = np.arange(len(box_z))
+    # check if we need to add holes around the steps
+    if cfg.holes:
+        box_size = (np.full(len(k), cfg.platform_width), np.full(len(k), cfg.platform_width))
+    else:
+        box_size = (terrain_size[0] - 2 * k * cfg.step_width, terrain_size[1] - 2 * k * cfg.step_width)
+    # compute the offset of the boxes from the border
+    box_offset = (k + 0.5) * cfg.step_width
+    step_width = np.full(len(k), cfg.step_width)
+    center_x = np.full(len(k), terrain_center[0])
+    center_y = np.full(len(k), terrain_center[1])
+    # top/bottom
+    dims_top_bottom = np.stack([box_size[0], step_width, box_height], axis=-1)
+    # -- top
+    pos_top = np.stack([center_x, terrain_center[1] + terrain_size[1] / 2.0 - box_offset, box_z], axis=-1)
+    # -- bottom
+    pos_bottom = np.stack([center_x, terrain_center[1] - terrain_size[1] / 2.0 + box_offset, box_z], axis=-1)
+    # right/left
+    if cfg.holes:
+        dims_right_left = np.stack([step_width, box_size[1], box_height], axis=-1)
+    else:
+        dims_right_left = np.stack([step_width, box_size[1] - 2 * cfg.step_width, box_height], axis=-1)
+    # -- right
+    pos_right = np.stack([terrain_center[0] + terrain_size[0] / 2.0 - box_offset, center_y, box_z], axis=-1)
+    # -- left
+    pos_left = np.stack([terrain_center[0] - terrain_size[0] / 2.0 + box_offset, center_y, box_z], axis=-1)
+    # order the boxes by step: (num_steps, 4, 3)
+    dims = np.stack([dims_top_bottom, dims_top_bottom, dims_right_left, dims_right_left], axis=1)
+    positions = np.stack([pos_top, pos_bottom, pos_right, pos_left], axis=1)
+    return dims.reshape(-1, 3).tolist(), positions.reshape(-1, 3).tolist()
@@ -3,6 +3,8 @@
 #
 # SPDX-License-Identifier: BSD-3-Clause
 
+from __future__ import annotations
+
 import numpy as np
 import scipy.spatial.transform as tf
 import trimesh
@@ -192,3 +194,115 @@ def make_cone(
     transform[0:3, 0:3] = tf.Rotation.from_euler("zyx", euler_zyx).as_matrix()
     # create the cone
     return trimesh.creation.cone(radius, height, sections=np.random.randint(4, 6), transform=transform)
+
+
+"""
+Batched primitive functions to generate meshes.
+"""
+
+
+def make_boxes(dims: np.ndarray, positions: np.ndarray, rotations: np.ndarray | None = None) -> trimesh.Trimesh:
+    """Generate a single mesh containing multiple boxes.
+
+    The boxes are created from a template unit box whose vertices are scaled, rotated and translated
+    for all the boxes at once. This is equivalent to concatenating the boxes created one by one with
+    :func:`trimesh.creation.box`, but avoids creating an intermediate mesh for each box.
+
+    Args:
+        dims: The dimensions of the boxes (in m). Shape is (N, 3).
+        positions: The centers of the boxes (in m). Shape is (N, 3).
+        rotations: The rotation matrices of the boxes. Shape is (N, 3, 3).
+            Defaults to None, in which case the boxes are axis-aligned.
+
+    Returns:
+        A trimesh.Trimesh object for all the boxes.
+    """
+    template = trimesh.creation.box((1.0, 1.0, 1.0))
+    return _repeat_template(template, np.asarray(dims), np.asarray(positions), rotations)
+
+
+def make_repeated_objects(
+    object_type: str,
+    centers: np.ndarray,
+    heights: np.ndarray,
+    max_yx_angle: float = 0,
+    degrees: bool = True,
+    **kwargs,
+) -> trimesh.Trimesh:
+    """Generate a single mesh containing multiple objects of the same type with random orientations.
+
+    This is the batched version of the functions :func:`make_box`, :func:`make_cylinder` and :func:`make_cone`.
+    The objects are created from a template mesh that is scaled along the z-axis to the height of each object,
+    rotated and translated for all the objects at once.
+
+    Args:
+        object_type: The type of the objects. It must be either ``"box"``, ``"cylinder"`` or ``"cone"``.
+        centers: The centers of the objects (in m). Shape is (N, 3).
+        heights: The heights of the objects (in m). Shape is (N,).
+        max_yx_angle: The maximum angle along the y and x axis. Defaults to 0.
+        degrees: Whether the angle is in degrees. Defaults to True.
+        **kwargs: The parameters of the object type. These are ``length`` and ``width`` for boxes,
+            and ``radius`` for cylinders and cones.
+
+    Returns:
+        A trimesh.Trimesh object for all the objects.
+
+    Raises:
+        ValueError: If the object type is not supported.
+    """
+    num_objects = len(centers)
+    # -- create random rotations
+    euler_zyx = tf.Rotation.random(num_objects).as_euler("zyx").reshape(-1, 3)
+    # -- cap the rotation along the y and x axis
+    if degrees:
+        max_yx_angle = max_yx_angle / 180.0
+    euler_zyx[:, 1:] *= max_yx_angle
+    rotations = tf.Rotation.from_euler("zyx", euler_zyx).as_matrix().reshape(-1, 3, 3)
+    # scale of the template for each object
+    dims = np.ones((num_objects, 3))
+    dims[:, 2] = heights
+    # create the templates with unit height
+    if object_type == "box":
+        templates = [(trimesh.creation.box((kwargs["length"], kwargs["width"], 1.0)), np.arange(num_objects))]
+    elif object_type in ["cylinder", "cone"]:
+        create_fn = trimesh.creation.cylinder if object_type == "cylinder" else trimesh.creation.cone
+        # the number of sections of each object is randomized
+        sections = np.random.randint(4, 6, size=num_objects)
+        templates = [
+            (create_fn(kwargs["radius"], 1.0, sections=num_sections), np.nonzero(sections == num_sections)[0])
+            for num_sections in np.unique(sections)
+        ]
+    else:
+        raise ValueError(f"Unknown object type: '{object_type}'. Must be 'box', 'cylinder' or 'cone'.")
+    # create the objects for each template
+    meshes = [
+        _repeat_template(template, dims[ids], centers[ids], rotations[ids]) for template, ids in templates if len(ids)
+    ]
+    return trimesh.util.concatenate(meshes)
+
+
+def _repeat_template(
+    template: trimesh.Trimesh, scales: np.ndarray, positions: np.ndarray, rotations: np.ndarray | None = None
+) -> trimesh.Trimesh:
+    """Repeat a template mesh with different scales and poses into a single mesh.
+
+    Args:
+        template: The template mesh.
+        scales: The scale of the template along each axis. Shape is (N, 3).
+        positions: The positions of the repeated templates (in m). Shape is (N, 3).
+        rotations: The rotation matrices of the repeated templates. Shape is (N, 3, 3).
+            Defaults to None, in which case no rotation is applied.
+
+    Returns:
+        A trimesh.Trimesh object for all the repeated templates.
+    """
+    num_vertices = len(template.vertices)
+    # scale the template vertices: (N, num_vertices, 3)
+    vertices = template.vertices[None, :, :] * scales[:, None, :]
+    # rotate and translate the vertices
+    if rotations is not None:
+        vertices = np.einsum("nij,nvj->nvi", rotations, vertices)
+    vertices += positions[:, None, :]
+    # offset the template faces for each repetition: (N, num_faces, 3)
+    faces = template.faces[None, :, :] + num_vertices * np.arange(len(scales))[:, None, None]
+    return trimesh.Trimesh(vertices=vertices.reshape(-1, 3), faces=faces.reshape(-1, 3), process=False)
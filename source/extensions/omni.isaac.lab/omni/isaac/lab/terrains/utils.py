@@ -172,6 +172,68 @@ def find_flat_patches(
     Returns:
         A tensor of shape (num_patches, 3) containing the flat patches. The patches are defined in the mesh frame.
 
+    Raises:
+        RuntimeError: If the function fails to find valid patches. This can happen if the input parameters
+            are not suitable for finding valid patches and maximum number of iterations is reached.
+    """
+    return find_flat_patches_batched(
+        wp_mesh=wp_mesh,
+        num_patches=num_patches,
+        patch_radius=patch_radius,
+        origins=origin,
+        x_range=x_range,
+        y_range=y_range,
+        z_range=z_range,
+        max_height_diff=max_height_diff,
+    )[0]
+
+
+def find_flat_patches_batched(
+    wp_mesh: wp.Mesh,
+    num_patches: int,
+    patch_radius: float | list[float],
+    origins: np.ndarray | torch.Tensor,
+    x_range: tuple[float, float],
+    y_range: tuple[float, float],
+    z_range: tuple[float, float],
+    max_height_diff: float,
+    bounds: np.ndarray | torch.Tensor | None = None,
+    max_iterations: int = 10000,
+    check_interval: int = 10,
+) -> torch.Tensor:
+    """Finds flat patches of given radius in the input mesh for multiple origins simultaneously.
+
+    This function performs the same rejection sampling as :func:`find_flat_patches`, but for all the
+    patches of all the origins at once. This allows sampling the flat patches of all the sub-terrains
+    on the combined terrain mesh with a single ray-casting call per iteration.
+
+    The sampling runs on the device of the mesh. At each iteration, new candidates are sampled only for
+    the patches that are not yet valid. The invalid patches are gathered every :attr:`check_interval`
+    iterations, which is the only point where the host synchronizes with the device.
+
+    Args:
+        wp_mesh: The warp mesh to find patches in.
+        num_patches: The desired number of patches to find for each origin.
+        patch_radius: The radii used to form patches. If a list is provided, multiple patch sizes are checked.
+            This is useful to deal with holes or other artifacts in the mesh.
+        origins: The origins defining the center of the search spaces. Shape is (N, 3).
+            These are specified in the mesh frame.
+        x_range: The range of X coordinates to sample from, relative to the origins.
+        y_range: The range of Y coordinates to sample from, relative to the origins.
+        z_range: The range of valid Z coordinates used for filtering patches, relative to the origins.
+        max_height_diff: The maximum allowable distance between the lowest and highest points
+            on a patch to consider it as valid. If the difference is greater than this value,
+            the patch is rejected.
+        bounds: The bounds of the region to sample in for each origin. Shape is (N, 2, 2), where the
+            last two dimensions are the (min, max) values of the X and Y coordinates respectively.
+            Defaults to None, in which case the bounding box of the mesh is used.
+        max_iterations: The maximum number of sampling iterations. Defaults to 10000.
+        check_interval: The number of iterations between checks for the invalid patches. Defaults to 10.
+
+    Returns:
+        A tensor of shape (N, num_patches, 3) containing the flat patches. The patches are defined in the
+        mesh frame relative to their origin.
+
     Raises:
         RuntimeError: If the function fails to find valid patches. This can happen if the input parameters
             are not suitable for finding valid patches and maximum number of iterations is reached.
@@ -183,28 +245,27 @@ def find_flat_patches(
     # -- patch radii
     if isinstance(patch_radius, float):
         patch_radius = [patch_radius]
-    # -- origin
-    if isinstance(origin, np.ndarray):
-        origin = torch.from_numpy(origin).to(torch.float).to(device)
-    elif isinstance(origin, torch.Tensor):
-        origin = origin.to(device)
-    else:
-        origin = torch.tensor(origin, dtype=torch.float, device=device)
-
-    # create ranges for the x and y coordinates around the origin.
-    # The provided ranges are bounded by the mesh's bounding box.
-    x_range = (
-        max(x_range[0] + origin[0].item(), wp_mesh.points.numpy()[:, 0].min()),
-        min(x_range[1] + origin[0].item(), wp_mesh.points.numpy()[:, 0].max()),
-    )
-    y_range = (
-        max(y_range[0] + origin[1].item(), wp_mesh.points.numpy()[:, 1].min()),
-        min(y_range[1] + origin[1].item(), wp_mesh.points.numpy()[:, 1].max()),
-    )
-    z_range = (
-        z_range[0] + origin[2].item(),
-        z_range[1] + origin[2].item(),
-    )
+    # -- origins
+    if isinstance(origins, np.ndarray):
+        origins = torch.from_numpy(origins)
+    origins = torch.as_tensor(origins, dtype=torch.float, device=device).view(-1, 3)
+    num_origins = origins.shape[0]
+    # -- bounds
+    if bounds is None:
+        mesh_points = wp.to_torch(wp_mesh.points)[:, :2]
+        bounds = torch.stack([mesh_points.min(dim=0)[0], mesh_points.max(dim=0)[0]], dim=-1)
+    elif isinstance(bounds, np.ndarray):
+        bounds = torch.from_numpy(bounds)
+    bounds = torch.as_tensor(bounds, dtype=torch.float, device=device).expand(num_origins, 2, 2)
+
+    # create ranges for the x and y coordinates around the origins.
+    # The provided ranges are bounded by the input bounds.
+    # dim: (N, 2)
+    sample_lower = torch.maximum(origins[:, :2] + torch.tensor([x_range[0], y_range[0]], device=device), bounds[..., 0])
+    sample_upper = torch.minimum(origins[:, :2] + torch.tensor([x_range[1], y_range[1]], device=device), bounds[..., 1])
+    # dim: (N,)
+    z_lower = origins[:, 2] + z_range[0]
+    z_upper = origins[:, 2] + z_range[1]
 
     # create a circle of points around (0, 0) to query validity of the patches
     # the ring of points is uniformly distributed around the circle
@@ -214,53 +275,61 @@ def find_flat_patches(
     for radius in patch_radius:
         query_x.append(radius * torch.cos(angle))
         query_y.append(radius * torch.sin(angle))
-    query_x = torch.cat(query_x).unsqueeze(1)  # dim: (num_radii * 10, 1)
-    query_y = torch.cat(query_y).unsqueeze(1)  # dim: (num_radii * 10, 1)
-    # dim: (num_radii * 10, 3)
-    query_points = torch.cat([query_x, query_y, torch.zeros_like(query_x)], dim=-1)
+    # dim: (num_radii * 10, 2)
+    query_points = torch.stack([torch.cat(query_x), torch.cat(query_y)], dim=-1)
+    num_queries = query_points.shape[0]
 
     # create buffers
-    # -- a buffer to store indices of points that are not valid
-    points_ids = torch.arange(num_patches, device=device)
+    # -- a buffer to store the origin and patch indices of points that are not valid
+    origin_ids, points_ids = torch.meshgrid(
+        torch.arange(num_origins, device=device), torch.arange(num_patches, device=device), indexing="ij"
+    )
+    origin_ids, points_ids = origin_ids.flatten(), points_ids.flatten()
+    # -- a buffer to store the validity of the patches
+    valid = torch.zeros(num_origins, num_patches, dtype=torch.bool, device=device)
     # -- a buffer to store the flat patches locations
-    flat_patches = torch.zeros(num_patches, 3, device=device)
+    flat_patches = torch.zeros(num_origins, num_patches, 3, device=device)
 
     # sample points and raycast to find the height.
     # 1. Reject points that are outside the z_range or have a height difference that is too large.
-    # 2. Keep sampling until all points are valid.
+    # 2. Keep sampling until all points are valid or the maximum number of iterations is reached.
     iter_count = 0
-    while len(points_ids) > 0 and iter_count < 10000:
-        # sample points in the 2D region around the origin
-        pos_x = torch.empty(len(points_ids), device=device).uniform_(*x_range)
-        pos_y = torch.empty(len(points_ids), device=device).uniform_(*y_range)
-        flat_patches[points_ids, :2] = torch.stack([pos_x, pos_y], dim=-1)
-
-        # define the query points to check validity of the patch
-        # dim: (num_patches, num_radii * 10, 3)
-        points = flat_patches[points_ids].unsqueeze(1) + query_points
-        points[..., 2] = 100.0
-        # ray-cast direction is downwards
-        dirs = torch.zeros_like(points)
-        dirs[..., 2] = -1.0
-
-        # ray-cast to find the height of the patches
-        ray_hits = raycast_mesh(points.view(-1, 3), dirs.view(-1, 3), wp_mesh)[0]
-        heights = ray_hits.view(points.shape)[..., 2]
-        # set the height of the patches
-        # note: for invalid patches, they would be overwritten in the next iteration
-        #   so it's safe to set the height to the last value
-        flat_patches[points_ids, 2] = heights[..., -1]
-
-        # check validity
-        # -- height is within the z range
-        not_valid = torch.any(torch.logical_or(heights < z_range[0], heights > z_range[1]), dim=1)
-        # -- height difference is within the max height difference
-        not_valid = torch.logical_or(not_valid, (heights.max(dim=1)[0] - heights.min(dim=1)[0]) > max_height_diff)
-
-        # remove invalid patches indices
-        points_ids = points_ids[not_valid]
-        # increment count
-        iter_count += 1
+    while len(points_ids) > 0 and iter_count < max_iterations:
+        # buffers for the invalid patches
+        lower = sample_lower[origin_ids]
+        upper = sample_upper[origin_ids]
+        # note: the ray-casting direction is downwards from a fixed height
+        ray_starts = torch.full((len(points_ids), num_queries, 3), 100.0, device=device)
+        ray_directions = torch.zeros_like(ray_starts)
+        ray_directions[..., 2] = -1.0
+        # sample the invalid patches until the next check
+        for _ in range(min(check_interval, max_iterations - iter_count)):
+            # sample points in the 2D region around the origin
+            # dim: (num_invalid, 2)
+            positions = lower + (upper - lower) * torch.rand_like(lower)
+            # define the query points to check validity of the patch
+            ray_starts[..., :2] = positions.unsqueeze(1) + query_points
+            # ray-cast to find the height of the patches
+            ray_hits = raycast_mesh(ray_starts.view(-1, 3), ray_directions.view(-1, 3), wp_mesh)[0]
+            heights = ray_hits.view(ray_starts.shape)[..., 2]
+            # check validity
+            # -- height is within the z range
+            is_valid = torch.all((heights >= z_lower[origin_ids, None]) & (heights <= z_upper[origin_ids, None]), dim=1)
+            # -- height difference is within the max height difference
+            is_valid &= (heights.max(dim=1)[0] - heights.min(dim=1)[0]) <= max_height_diff
+            # only update the patches that were not valid before
+            is_valid &= ~valid[origin_ids, points_ids]
+            # set the location of the newly found patches
+            # note: the height of the patch is set to the height of the last query point
+            patches = torch.cat([positions, heights[:, -1:]], dim=-1)
+            current_patches = flat_patches[origin_ids, points_ids]
+            flat_patches[origin_ids, points_ids] = torch.where(is_valid.unsqueeze(-1), patches, current_patches)
+            valid[origin_ids, points_ids] |= is_valid
+            # increment count
+            iter_count += 1
+        # remove valid patches indices
+        not_valid = ~valid[origin_ids, points_ids]
+        origin_ids, points_ids = origin_ids[not_valid], points_ids[not_valid]
 
     # check all patches are valid
     if len(points_ids) > 0:
@@ -272,4 +341,4 @@ def find_flat_patches(
         )
 
     # return the flat patches (in the mesh frame)
-    return flat_patches - origin
+    return flat_patches - origins.unsqueeze(1)
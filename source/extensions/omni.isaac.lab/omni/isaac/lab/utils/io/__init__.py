@@ -7,5 +7,6 @@
 Submodules for files IO operations.
 """
 
+from .async_writer import AsyncWriter
 from .pkl import dump_pickle, load_pickle
 from .yaml import dump_yaml, load_yaml
@@ -0,0 +1,380 @@
+# Copyright (c) 2022-2024, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Utilities for writing images and sensor data to files asynchronously."""
+
+from __future__ import annotations
+
+import numpy as np
+import os
+import queue
+import threading
+import torch
+from dataclasses import dataclass, field
+from typing import Literal
+
+
+@dataclass
+class _WriteRequest:
+    """A request to write data to a file, queued for the worker threads."""
+
+    file_path: str
+    """The path to the file without extension."""
+
+    data: dict[str, np.ndarray | torch.Tensor]
+    """The staged data to write. The tensors are pinned CPU tensors that may still be filled asynchronously."""
+
+    event: torch.cuda.Event | None = None
+    """The CUDA event recorded after the copies into the pinned tensors. Defaults to None."""
+
+    pinned_tensors: list[torch.Tensor] = field(default_factory=list)
+    """The pinned tensors to release to the pool after writing."""
+
+
+class AsyncWriter:
+    """Writer for saving images and sensor data to files on background threads.
+
+    Writing data to files involves a device-to-host copy, an optional encoding and the file I/O. Done on the
+    stepping thread, these operations block the simulation. This class stages the data on the calling thread
+    and queues it for a pool of worker threads, which encode and write it. The encoding and file I/O of
+    numpy and Pillow release the GIL, so the writes overlap with the simulation.
+
+    The data is written in one of the following formats:
+
+    - ``"npy"``: Raw numpy array files. Each entry of a dictionary is saved to its own file.
+    - ``"npz"``: Compressed numpy archive files. The entries of a dictionary are saved to the same archive.
+    - ``"png"``: Image files. The data must be images of shape (H, W) or (H, W, C) with C in (1, 3, 4), or
+      batches of images of shape (N, H, W, C), which are saved to one file per image. Float images are
+      assumed to be in the range [0, 1].
+
+    The queue of pending writes is bounded. When it is full, the :attr:`drop_policy` decides what happens:
+
+    - ``"block"``: The call to :meth:`write` blocks until a write is completed (backpressure).
+    - ``"drop_newest"``: The incoming data is discarded.
+    - ``"drop_oldest"``: The oldest pending write is discarded to make room for the incoming data.
+
+    CUDA tensors can be staged into pinned host memory with non-blocking copies. The pinned tensors are
+    reused across writes of data with the same shape and type, and the workers wait for the copies to
+    complete before writing.
+
+    Example:
+
+    .. code-block:: python
+
+        with AsyncWriter("output/camera", file_format="png", drop_policy="drop_oldest") as writer:
+            for step in range(num_steps):
+                sim.step()
+                camera.update(dt)
+                writer.write(f"rgb_{step:04d}", camera.data.output["rgb"])
+
+    """
+
+    def __init__(
+        self,
+        output_dir: str,
+        file_format: Literal["npy", "npz", "png"] = "npy",
+        num_workers: int = 2,
+        max_queue_size: int = 16,
+        drop_policy: Literal["block", "drop_newest", "drop_oldest"] = "block",
+        pin_memory: bool = True,
+    ):
+        """Initializes the writer and starts the worker threads.
+
+        Args:
+            output_dir: The directory to write the files to. It is created if it does not exist.
+            file_format: The format of the written files. Defaults to "npy".
+            num_workers: The number of worker threads. Defaults to 2.
+            max_queue_size: The maximum number of pending writes. Defaults to 16.
+            drop_policy: The policy when the queue of pending writes is full. Defaults to "block".
+            pin_memory: Whether to stage CUDA tensors into pinned host memory. Defaults to True.
+
+        Raises:
+            ValueError: If the file format or the drop policy is not supported.
+            ValueError: If the number of workers or the maximum queue size is less than one.
+        """
+        # check inputs
+        if file_format not in ("npy", "npz", "png"):
+            raise ValueError(f"Unsupported file format: '{file_format}'. Valid formats are: 'npy', 'npz', 'png'.")
+        if drop_policy not in ("block", "drop_newest", "drop_oldest"):
+            raise ValueError(
+                f"Unsupported drop policy: '{drop_policy}'. Valid policies are: 'block', 'drop_newest', 'drop_oldest'."
+            )
+        if num_workers < 1 or max_queue_size < 1:
+            raise ValueError(
+                f"The number of workers ({num_workers}) and the maximum queue size ({max_queue_size}) should be"
+                " greater than zero."
+            )
+        # store inputs
+        self._output_dir = output_dir
+        self._file_format = file_format
+        self._drop_policy = drop_policy
+        self._pin_memory = pin_memory and torch.cuda.is_available()
+        os.makedirs(output_dir, exist_ok=True)
+
+        # pool of pinned tensors, indexed by shape and data type
+        self._pinned_pool: dict[tuple[tuple[int, ...], torch.dtype], list[torch.Tensor]] = dict()
+        self._pool_lock = threading.Lock()
+        # statistics
+        self._num_written = 0
+        self._num_dropped = 0
+        self._stats_lock = threading.Lock()
+        # first error raised by the workers
+        self._error: Exception | None = None
+
+        # create the queue and start the workers
+        self._queue: queue.Queue[_WriteRequest | None] = queue.Queue(maxsize=max_queue_size)
+        self._workers = [
+            threading.Thread(target=self._run_worker, name=f"AsyncWriter-{index}", daemon=True)
+            for index in range(num_workers)
+        ]
+        for worker in self._workers:
+            worker.start()
+        self._is_closed = False
+
+    def __del__(self):
+        """Stops the workers when the writer is deleted.
+
+        Errors raised by the workers are logged since exceptions cannot be raised during garbage collection.
+        """
+        if not getattr(self, "_is_closed", True):
+            try:
+                self.close()
+            except RuntimeError as e:
+                # note: imported here to keep the module independent of the application
+                import omni.log
+
+                omni.log.error(f"Failed to close the writer to '{self._output_dir}': {e}")
+
+    def __enter__(self) -> AsyncWriter:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __str__(self) -> str:
+        """Returns: A string containing information about the instance."""
+        msg = f"AsyncWriter writing to '{self._output_dir}':\n"
+        msg += f"\tFile format       : {self._file_format}\n"
+        msg += f"\tNumber of workers : {len(self._workers)}\n"
+        msg += f"\tDrop policy       : {self._drop_policy}\n"
+        msg += f"\tPending writes    : {self.num_pending}/{self._queue.maxsize}\n"
+        msg += f"\tWritten / dropped : {self.num_written}/{self.num_dropped}"
+        return msg
+
+    """
+    Properties
+    """
+
+    @property
+    def output_dir(self) -> str:
+        """The directory the files are written to."""
+        return self._output_dir
+
+    @property
+    def num_written(self) -> int:
+        """The number of completed writes."""
+        return self._num_written
+
+    @property
+    def num_dropped(self) -> int:
+        """The number of writes discarded because the queue was full."""
+        return self._num_dropped
+
+    @property
+    def num_pending(self) -> int:
+        """The approximate number of pending writes in the queue."""
+        return self._queue.qsize()
+
+    """
+    Operations
+    """
+
+    def write(self, name: str, data: torch.Tensor | np.ndarray | dict[str, torch.Tensor | np.ndarray]) -> bool:
+        """Queues data to be written to a file in the output directory.
+
+        The data is copied before this function returns, so the input buffers can be modified afterwards.
+        For dictionaries with the "npy" and "png" formats, the entries are written to the files
+        ``{name}_{key}``. For batches of images with the "png" format, the images are written to the
+        files ``{name}_{index}``.
+
+        Args:
+            name: The name of the file relative to the output directory, without extension.
+            data: The data to write.
+
+        Returns:
+            True if the data was queued, False if it was dropped.
+
+        Raises:
+            RuntimeError: If the writer is closed or a previous write failed.
+        """
+        self._check_state()
+        # stage the data on the host
+        request = self._stage(os.path.join(self._output_dir, name), data)
+        # queue the request according to the drop policy
+        if self._drop_policy == "block":
+            self._queue.put(request)
+            return True
+        while True:
+            try:
+                self._queue.put_nowait(request)
+                return True
+            except queue.Full:
+                if self._drop_policy == "drop_newest":
+                    self._discard(request)
+                    return False
+            # remove the oldest request to make room for the new one
+            try:
+                oldest_request = self._queue.get_nowait()
+            except queue.Empty:
+                continue
+            self._discard(oldest_request)
+            self._queue.task_done()
+
+    def flush(self):
+        """Blocks until all the pending writes are completed.
+
+        Raises:
+            RuntimeError: If a write failed.
+        """
+        self._queue.join()
+        self._check_state()
+
+    def close(self):
+        """Completes the pending writes and stops the workers.
+
+        Raises:
+            RuntimeError: If a write failed.
+        """
+        if self._is_closed:
+            return
+        self._is_closed = True
+        # signal the workers to stop after the pending writes
+        for _ in self._workers:
+            self._queue.put(None)
+        for worker in self._workers:
+            worker.join()
+        # raise any error from the workers
+        if self._error is not None:
+            raise RuntimeError(f"Failed to write data asynchronously: {self._error}") from self._error
+
+    """
+    Internal helpers.
+    """
+
+    def _check_state(self):
+        """Raises an error if the writer is closed or a worker failed."""
+        if self._error is not None:
+            raise RuntimeError(f"Failed to write data asynchronously: {self._error}") from self._error
+        if self._is_closed:
+            raise RuntimeError("Cannot write data with a closed writer.")
+
+    def _stage(self, file_path: str, data: torch.Tensor | np.ndarray | dict) -> _WriteRequest:
+        """Copies the data to the host and creates the write request."""
+        if not isinstance(data, dict):
+            data = {"": data}
+        request = _WriteRequest(file_path=file_path, data=dict())
+        for key, value in data.items():
+            if isinstance(value, np.ndarray):
+                request.data[key] = value.copy()
+            elif value.device.type == "cuda" and self._pin_memory:
+                pinned_tensor = self._acquire_pinned_tensor(value.shape, value.dtype)
+                pinned_tensor.copy_(value, non_blocking=True)
+                request.data[key] = pinned_tensor
+                request.pinned_tensors.append(pinned_tensor)
+            else:
+                request.data[key] = value.detach().to("cpu", copy=True)
+        # record the completion of the non-blocking copies
+        if request.pinned_tensors:
+            request.event = torch.cuda.Event()
+            request.event.record()
+        return request
+
+    def _acquire_pinned_tensor(self, shape: torch.Size, dtype: torch.dtype) -> torch.Tensor:
+        """Returns a free pinned tensor of the given shape and type from the pool."""
+        with self._pool_lock:
+            pool = self._pinned_pool.get((tuple(shape), dtype))
+            if pool:
+                return pool.pop()
+        return torch.empty(shape, dtype=dtype, pin_memory=True)
+
+    def _discard(self, request: _WriteRequest):
+        """Discards a request that is not written."""
+        if request.event is not None:
+            request.event.synchronize()
+        self._release(request)
+        with self._stats_lock:
+            self._num_dropped += 1
+
+    def _release(self, request: _WriteRequest):
+        """Returns the pinned tensors of a request to the pool."""
+        with self._pool_lock:
+            for pinned_tensor in request.pinned_tensors:
+                self._pinned_pool.setdefault((tuple(pinned_tensor.shape), pinned_tensor.dtype), []).append(
+                    pinned_tensor
+                )
+
+    def _run_worker(self):
+        """Writes the queued requests until the stop signal is received."""
+        while True:
+            request = self._queue.get()
+            # check for the stop signal
+            if request is None:
+                self._queue.task_done()
+                break
+            try:
+                # wait for the copies to the pinned tensors
+                if request.event is not None:
+                    request.event.synchronize()
+                self._save(request)
+                with self._stats_lock:
+                    self._num_written += 1
+            except Exception as e:
+                # keep the first error to raise it on the main thread
+                if self._error is None:
+                    self._error = e
+            finally:
+                self._release(request)
+                self._queue.task_done()
+
+    def _save(self, request: _WriteRequest):
+        """Writes the data of a request to files."""
+        # convert to numpy arrays
+        arrays = {
+            key: value.numpy() if isinstance(value, torch.Tensor) else value for key, value in request.data.items()
+        }
+        # resolve the file paths
+        if self._file_format == "npz":
+            np.savez_compressed(request.file_path + ".npz", **{key or "data": value for key, value in arrays.items()})
+            return
+        for key, array in arrays.items():
+            file_path = f"{request.file_path}_{key}" if key else request.file_path
+            if self._file_format == "npy":
+                np.save(file_path + ".npy", array)
+            elif array.ndim == 4:
+                for index, image in enumerate(array):
+                    _save_png(f"{file_path}_{index}.png", image)
+            else:
+                _save_png(file_path + ".png", array)
+
+
+def _save_png(file_path: str, image: np.ndarray):
+    """Saves an image of shape (H, W) or (H, W, C) with C in (1, 3, 4) to a PNG file.
+
+    Raises:
+        ValueError: If the image is not of a supported shape.
+    """
+    from PIL import Image
+
+    # check the shape of the image
+    if image.ndim == 3 and image.shape[-1] == 1:
+        image = image[..., 0]
+    if image.ndim not in (2, 3) or (image.ndim == 3 and image.shape[-1] not in (3, 4)):
+        raise ValueError(f"Expected an image of shape (H, W) or (H, W, C) with C in (1, 3, 4): got {image.shape}.")
+    # convert float images in [0, 1] to 8-bit images
+    if np.issubdtype(image.dtype, np.floating):
+        image = (np.clip(image, 0.0, 1.0) * 255.0).round().astype(np.uint8)
+    elif image.dtype != np.uint8:
+        image = image.astype(np.uint8)
+    Image.fromarray(image).save(file_path)
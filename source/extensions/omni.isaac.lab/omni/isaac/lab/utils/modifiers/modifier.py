@@ -5,6 +5,7 @@
 
 from __future__ import annotations
 
+import math
 import torch
 from collections.abc import Sequence
 from typing import TYPE_CHECKING
@@ -150,9 +151,58 @@ class DigitalFilter(ModifierBase):
         self.A = torch.tensor(self._cfg.A, device=self._device).unsqueeze(1)
         self.B = torch.tensor(self._cfg.B, device=self._device).unsqueeze(1)
 
-        # create buffer for input and output history
-        self.x_n = torch.zeros(self._data_dim + (self.B.shape[0],), device=self._device)
-        self.y_n = torch.zeros(self._data_dim + (self.A.shape[0],), device=self._device)
+        # lengths of the input and output history windows
+        self._num_x = self.B.shape[0]
+        self._num_y = self.A.shape[0]
+        # create a single buffer for input and output history
+        # note: the first part of the last dimension stores the inputs and the second part stores the outputs.
+        #   Both parts are used as circular buffers, so that no data is moved when new values are added.
+        self._history = torch.zeros(self._data_dim + (self._num_x + self._num_y,), device=self._device)
+        # number of calls since the last full cycle of the circular buffers
+        self._step: int = 0
+
+        # pre-compute the filter coefficients for every position of the heads of the circular buffers
+        # note: rather than shifting the history window at every call, we shift the coefficients. Since both
+        #   heads advance by one at every call, the coefficients repeat after lcm(N + 1, M) calls.
+        self._num_phases = math.lcm(self._num_x, self._num_y)
+        self._coeffs = torch.zeros(self._num_phases, self._num_x + self._num_y, device=self._device)
+        for k in range(self._num_phases):
+            for j in range(self._num_x):
+                # input x_{i-j} is stored at position (k - j) % (N + 1)
+                self._coeffs[k, (k - j) % self._num_x] = self._cfg.B[j]
+            for j in range(1, self._num_y + 1):
+                # output y_{i-j} is stored at position (k - j) % M
+                self._coeffs[k, self._num_x + (k - j) % self._num_y] = -self._cfg.A[j - 1]
+
+    """
+    Properties.
+    """
+
+    @property
+    def x_n(self) -> torch.Tensor:
+        """The history of inputs to the filter. Shape is (*data_dim, N + 1).
+
+        The first element of the last dimension is the most recent input. The returned tensor is a copy
+        of the internal circular buffer.
+        """
+        # the most recent input is stored at the position before the current head
+        indices = (self._step - 1 - torch.arange(self._num_x, device=self._device)) % self._num_x
+        return self._history[..., indices]
+
+    @property
+    def y_n(self) -> torch.Tensor:
+        """The history of outputs of the filter. Shape is (*data_dim, M).
+
+        The first element of the last dimension is the most recent output. The returned tensor is a copy
+        of the internal circular buffer.
+        """
+        # the most recent output is stored at the position before the current head
+        indices = (self._step - 1 - torch.arange(self._num_y, device=self._device)) % self._num_y
+        return self._history[..., self._num_x + indices]
+
+    """
+    Operations.
+    """
 
     def reset(self, env_ids: Sequence[int] | None = None):
         """Resets digital filter history.
@@ -164,8 +214,9 @@ class DigitalFilter(ModifierBase):
         if env_ids is None:
             env_ids = slice(None)
         # reset history buffers
-        self.x_n[env_ids] = 0.0
-        self.y_n[env_ids] = 0.0
+        # note: the heads of the circular buffers are shared across environments. Since the history is
+        #   zeroed out, the position of the heads does not affect the filter output.
+        self._history[env_ids] = 0.0
 
     def __call__(self, data: torch.Tensor) -> torch.Tensor:
         """Applies digital filter modification with a rolling history window inputs and outputs.
@@ -176,17 +227,17 @@ class DigitalFilter(ModifierBase):
         Returns:
             Filtered data. Shape is the same as data.
         """
-        # move history window for input
-        self.x_n = torch.roll(self.x_n, shifts=1, dims=-1)
-        self.x_n[..., 0] = data
+        # add current input to the circular buffer of inputs
+        self._history[..., self._step % self._num_x] = data
 
-        # calculate current filter value: y[i] = Y*A - X*B
-        y_i = torch.matmul(self.x_n, self.B) - torch.matmul(self.y_n, self.A)
-        y_i.squeeze_(-1)
+        # calculate current filter value: y[i] = X*B - Y*A
+        # note: this is a single dot-product over the joint history of inputs and outputs
+        y_i = torch.matmul(self._history, self._coeffs[self._step])
 
-        # move history window for output and add current filter value to history
-        self.y_n = torch.roll(self.y_n, shifts=1, dims=-1)
-        self.y_n[..., 0] = y_i
+        # add current filter value to the circular buffer of outputs
+        self._history[..., self._num_x + self._step % self._num_y] = y_i
+        # move the heads of the circular buffers
+        self._step = (self._step + 1) % self._num_phases
 
         return y_i
 
@@ -5,4 +5,17 @@
 
 """Sub-module containing operations based on warp."""
 
-from .ops import convert_to_warp_mesh, raycast_mesh
+from .ops import (
+    combine_frame_transforms,
+    convert_to_warp_mesh,
+    quat_apply,
+    quat_error_magnitude,
+    quat_mul,
+    quat_rotate,
+    quat_rotate_inverse,
+    raycast_mesh,
+    reshape_tiled_image,
+    solve_damped_least_squares,
+    subtract_frame_transforms,
+    update_contact_time,
+)
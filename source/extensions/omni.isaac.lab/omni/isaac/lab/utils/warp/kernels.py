@@ -76,27 +76,387 @@ def raycast_mesh_kernel(
 
 
 @wp.kernel(enable_backward=False)
-def reshape_tiled_image(
+def raycast_sensor_kernel(
+    mesh: wp.uint64,
+    env_ids: wp.array(dtype=wp.int32),
+    sensor_pos: wp.array(dtype=wp.vec3),
+    sensor_quat: wp.array(dtype=wp.vec4),
+    ray_starts: wp.array(dtype=wp.vec3, ndim=2),
+    ray_directions: wp.array(dtype=wp.vec3, ndim=2),
+    ray_hits: wp.array(dtype=wp.vec3, ndim=2),
+    ray_mesh_ids: wp.array(dtype=wp.int32, ndim=2),
+    face_mesh_ids: wp.array(dtype=wp.int32),
+    max_dist: float,
+    attach_yaw_only: int,
+    return_mesh_id: int,
+):
+    """Transforms the rays of a batch of sensors into the world frame and ray-casts them against a mesh.
+
+    Each thread processes one ray of one sensor. The ray is transformed with the pose of the sensor and
+    the hit position is written into the rows of :obj:`ray_hits` given by :obj:`env_ids`. Missed rays are
+    set to :obj:`inf`.
+
+    Args:
+        mesh: The input mesh. The ray-casting is performed against this mesh on the device specified by the
+            `mesh`'s `device` attribute.
+        env_ids: The indices of the sensors to update. Shape is (M,).
+        sensor_pos: The positions of the sensors in the world frame. Shape is (N, 3).
+        sensor_quat: The orientations of the sensors in the world frame as (w, x, y, z). Shape is (N, 4).
+        ray_starts: The ray start positions in the sensor frames. Shape is (N, B, 3).
+        ray_directions: The ray directions in the sensor frames. Shape is (N, B, 3).
+        ray_hits: The output ray hit positions in the world frame. Shape is (N, B, 3).
+        ray_mesh_ids: The output mesh ids of the hit faces. Shape is (N, B), if `return_mesh_id` is True.
+            Otherwise, this array is not used. Missed rays are set to -1.
+        face_mesh_ids: The mesh id of each face of the mesh. Shape is (F,), if `return_mesh_id` is True.
+            Otherwise, this array is not used.
+        max_dist: The maximum ray-cast distance.
+        attach_yaw_only: Whether only the yaw of the sensor orientation is applied to the ray start positions.
+            In this case, the ray directions are not rotated.
+        return_mesh_id: Whether to return the mesh ids of the hit faces.
+    """
+    # get the thread id
+    tid, ray_id = wp.tid()
+    env_id = env_ids[tid]
+
+    # convert the orientation into warp convention (x, y, z, w)
+    q = sensor_quat[env_id]
+    rot = wp.quat(q[1], q[2], q[3], q[0])
+    if attach_yaw_only == 1:
+        yaw = wp.atan2(2.0 * (q[0] * q[3] + q[1] * q[2]), 1.0 - 2.0 * (q[2] * q[2] + q[3] * q[3]))
+        rot = wp.quat(0.0, 0.0, wp.sin(0.5 * yaw), wp.cos(0.5 * yaw))
+    # transform the ray into the world frame
+    start = wp.quat_rotate(rot, ray_starts[env_id, ray_id]) + sensor_pos[env_id]
+    direction = ray_directions[env_id, ray_id]
+    if attach_yaw_only == 0:
+        direction = wp.quat_rotate(rot, direction)
+
+    t = float(0.0)  # hit distance along ray
+    u = float(0.0)  # hit face barycentric u
+    v = float(0.0)  # hit face barycentric v
+    sign = float(0.0)  # hit face sign
+    n = wp.vec3()  # hit face normal
+    f = int(0)  # hit face index
+
+    # ray cast against the mesh and store the hit position
+    hit_success = wp.mesh_query_ray(mesh, start, direction, max_dist, t, u, v, sign, n, f)
+    if hit_success:
+        ray_hits[env_id, ray_id] = start + t * direction
+        if return_mesh_id == 1:
+            ray_mesh_ids[env_id, ray_id] = face_mesh_ids[f]
+    else:
+        ray_hits[env_id, ray_id] = wp.vec3(wp.inf, wp.inf, wp.inf)
+        if return_mesh_id == 1:
+            ray_mesh_ids[env_id, ray_id] = -1
+
+
+@wp.kernel(enable_backward=False)
+def update_contact_time_kernel(
+    env_ids: wp.array(dtype=wp.int32),
+    net_forces_w: wp.array(dtype=wp.vec3, ndim=2),
+    elapsed_time: wp.array(dtype=wp.float32),
+    force_threshold: float,
+    current_air_time: wp.array(dtype=wp.float32, ndim=2),
+    last_air_time: wp.array(dtype=wp.float32, ndim=2),
+    current_contact_time: wp.array(dtype=wp.float32, ndim=2),
+    last_contact_time: wp.array(dtype=wp.float32, ndim=2),
+):
+    """Updates the air and contact times of bodies based on their net contact forces.
+
+    Each thread processes one body of one environment. A body is in contact if the norm of its net contact
+    force is above the threshold. When a body makes contact, the time it spent in the air is stored as the last
+    air time. When it breaks contact, the time it spent in contact is stored as the last contact time.
+
+    Args:
+        env_ids: The indices of the environments to update. Shape is (M,).
+        net_forces_w: The net contact forces on the bodies. Shape is (N, B, 3).
+        elapsed_time: The time elapsed since the last update of each environment. Shape is (N,).
+        force_threshold: The threshold on the norm of the contact force to detect a contact.
+        current_air_time: The time spent in the air since the last detach. Shape is (N, B).
+        last_air_time: The time spent in the air before the last contact. Shape is (N, B).
+        current_contact_time: The time spent in contact since the last contact. Shape is (N, B).
+        last_contact_time: The time spent in contact before the last detach. Shape is (N, B).
+    """
+    # get the thread id
+    tid, body_id = wp.tid()
+    env_id = env_ids[tid]
+
+    dt = elapsed_time[env_id]
+    air_time = current_air_time[env_id, body_id]
+    contact_time = current_contact_time[env_id, body_id]
+    # check the contact state of the body
+    if wp.length(net_forces_w[env_id, body_id]) > force_threshold:
+        # update the last air time if the body has just made contact
+        if air_time > 0.0:
+            last_air_time[env_id, body_id] = air_time + dt
+        current_air_time[env_id, body_id] = 0.0
+        current_contact_time[env_id, body_id] = contact_time + dt
+    else:
+        # update the last contact time if the body has just detached
+        if contact_time > 0.0:
+            last_contact_time[env_id, body_id] = contact_time + dt
+        current_air_time[env_id, body_id] = air_time + dt
+        current_contact_time[env_id, body_id] = 0.0
+
+
+@wp.kernel(enable_backward=False)
+def frame_transformer_kernel(
+    env_ids: wp.array(dtype=wp.int32),
+    transforms: wp.array(dtype=wp.transformf),
+    source_ids: wp.array(dtype=wp.int32),
+    target_ids: wp.array(dtype=wp.int32, ndim=2),
+    source_offset: wp.transformf,
+    target_offsets: wp.array(dtype=wp.transformf),
+    apply_source_offset: int,
+    apply_target_offset: int,
+    source_pos_w: wp.array(dtype=wp.vec3),
+    source_quat_w: wp.array(dtype=wp.vec4),
+    target_pos_w: wp.array(dtype=wp.vec3, ndim=2),
+    target_quat_w: wp.array(dtype=wp.vec4, ndim=2),
+    target_pos_source: wp.array(dtype=wp.vec3, ndim=2),
+    target_quat_source: wp.array(dtype=wp.vec4, ndim=2),
+):
+    """Computes the poses of target frames with respect to a source frame from the body transforms.
+
+    Each thread processes one target frame of one environment. The body transforms are read in the PhysX
+    layout (x, y, z, qx, qy, qz, qw), which matches the warp transforms. The offsets are applied to the body
+    poses and the pose of the target frame is expressed in the source frame. The output quaternions are
+    written as (w, x, y, z). The source frame pose is written by the thread of the first target frame.
+
+    Args:
+        env_ids: The indices of the environments to update. Shape is (K,).
+        transforms: The transforms of all the tracked bodies. Shape is (B,).
+        source_ids: The index of the source body in :obj:`transforms` for each environment. Shape is (N,).
+        target_ids: The index of the body of each target frame in :obj:`transforms`. Shape is (N, M).
+        source_offset: The offset of the source frame from its body.
+        target_offsets: The offsets of the target frames from their bodies. Shape is (M,).
+        apply_source_offset: Whether to apply the source frame offset.
+        apply_target_offset: Whether to apply the target frame offsets.
+        source_pos_w: The output positions of the source frame in the world frame. Shape is (N, 3).
+        source_quat_w: The output orientations of the source frame in the world frame. Shape is (N, 4).
+        target_pos_w: The output positions of the target frames in the world frame. Shape is (N, M, 3).
+        target_quat_w: The output orientations of the target frames in the world frame. Shape is (N, M, 4).
+        target_pos_source: The output positions of the target frames in the source frame. Shape is (N, M, 3).
+        target_quat_source: The output orientations of the target frames in the source frame. Shape is (N, M, 4).
+    """
+    # get the thread id
+    tid, frame_id = wp.tid()
+    env_id = env_ids[tid]
+
+    # compute the poses of the frames in the world frame
+    source = transforms[source_ids[env_id]]
+    if apply_source_offset == 1:
+        source = wp.transform_multiply(source, source_offset)
+    target = transforms[target_ids[env_id, frame_id]]
+    if apply_target_offset == 1:
+        target = wp.transform_multiply(target, target_offsets[frame_id])
+    source_pos = wp.transform_get_translation(source)
+    source_quat = wp.transform_get_rotation(source)
+    target_pos = wp.transform_get_translation(target)
+    target_quat = wp.transform_get_rotation(target)
+
+    # compute the pose of the target frame in the source frame
+    source_quat_inv = wp.normalize(wp.quat_inverse(source_quat))
+    pos_source = wp.quat_rotate(source_quat_inv, target_pos - source_pos)
+    quat_source = wp.mul(source_quat_inv, target_quat)
+
+    # store the poses
+    if frame_id == 0:
+        source_pos_w[env_id] = source_pos
+        source_quat_w[env_id] = wp.vec4(source_quat[3], source_quat[0], source_quat[1], source_quat[2])
+    target_pos_w[env_id, frame_id] = target_pos
+    target_quat_w[env_id, frame_id] = wp.vec4(target_quat[3], target_quat[0], target_quat[1], target_quat[2])
+    target_pos_source[env_id, frame_id] = pos_source
+    target_quat_source[env_id, frame_id] = wp.vec4(quat_source[3], quat_source[0], quat_source[1], quat_source[2])
+
+
+@wp.kernel(enable_backward=False)
+def imu_kernel(
+    env_ids: wp.array(dtype=wp.int32),
+    transforms: wp.array(dtype=wp.transformf),
+    velocities: wp.array(dtype=wp.vec3, ndim=2),
+    coms: wp.array(dtype=wp.transformf),
+    offsets: wp.array(dtype=wp.transformf),
+    gravity_bias_w: wp.array(dtype=wp.vec3),
+    gravity_dir_w: wp.vec3,
+    dt: float,
+    prev_lin_vel_w: wp.array(dtype=wp.vec3),
+    prev_ang_vel_w: wp.array(dtype=wp.vec3),
+    pos_w: wp.array(dtype=wp.vec3),
+    quat_w: wp.array(dtype=wp.vec4),
+    lin_vel_b: wp.array(dtype=wp.vec3),
+    ang_vel_b: wp.array(dtype=wp.vec3),
+    lin_acc_b: wp.array(dtype=wp.vec3),
+    ang_acc_b: wp.array(dtype=wp.vec3),
+    projected_gravity_b: wp.array(dtype=wp.vec3),
+):
+    """Computes the outputs of the IMU sensors from the body transforms and velocities.
+
+    Each thread processes the sensor of one environment. The body transforms, the centers of mass and the
+    sensor offsets are read in the PhysX layout (x, y, z, qx, qy, qz, qw), which matches the warp transforms.
+    The linear velocity of the body center of mass is transferred to the sensor origin and the accelerations are
+    computed by finite differencing against the velocities of the previous update, which are overwritten with
+    the current velocities. The output quaternions are written as (w, x, y, z).
+
+    Args:
+        env_ids: The indices of the environments to update. Shape is (K,).
+        transforms: The transforms of the bodies. Shape is (N,).
+        velocities: The linear and angular velocities of the body centers of mass. Shape is (N, 2, 3).
+        coms: The transforms of the centers of mass in the body frames. Shape is (N,).
+        offsets: The offsets of the sensor frames from the bodies. Shape is (N,).
+        gravity_bias_w: The gravity bias added to the linear accelerations in the world frame. Shape is (N, 3).
+        gravity_dir_w: The direction of gravity in the world frame.
+        dt: The time step used for the finite differencing.
+        prev_lin_vel_w: The linear velocities of the sensors at the previous update. Shape is (N, 3).
+        prev_ang_vel_w: The angular velocities of the sensors at the previous update. Shape is (N, 3).
+        pos_w: The output positions of the sensors in the world frame. Shape is (N, 3).
+        quat_w: The output orientations of the sensors in the world frame. Shape is (N, 4).
+        lin_vel_b: The output linear velocities in the sensor frames. Shape is (N, 3).
+        ang_vel_b: The output angular velocities in the sensor frames. Shape is (N, 3).
+        lin_acc_b: The output linear accelerations in the sensor frames. Shape is (N, 3).
+        ang_acc_b: The output angular accelerations in the sensor frames. Shape is (N, 3).
+        projected_gravity_b: The output gravity directions in the sensor frames. Shape is (N, 3).
+    """
+    # get the thread id
+    tid = wp.tid()
+    env_id = env_ids[tid]
+
+    # compute the pose of the sensor in the world frame
+    body = transforms[env_id]
+    offset = offsets[env_id]
+    sensor = wp.transform_multiply(body, offset)
+    sensor_quat = wp.transform_get_rotation(sensor)
+
+    # transfer the linear velocity from the center of mass to the sensor origin
+    lin_vel_w = velocities[env_id, 0]
+    ang_vel_w = velocities[env_id, 1]
+    com_to_sensor = wp.transform_get_translation(offset) - wp.transform_get_translation(coms[env_id])
+    lin_vel_w = lin_vel_w + wp.cross(ang_vel_w, wp.quat_rotate(wp.transform_get_rotation(body), com_to_sensor))
+
+    # numerical derivative
+    lin_acc_w = (lin_vel_w - prev_lin_vel_w[env_id]) / dt + gravity_bias_w[env_id]
+    ang_acc_w = (ang_vel_w - prev_ang_vel_w[env_id]) / dt
+
+    # store the outputs
+    pos_w[env_id] = wp.transform_get_translation(sensor)
+    quat_w[env_id] = wp.vec4(sensor_quat[3], sensor_quat[0], sensor_quat[1], sensor_quat[2])
+    lin_vel_b[env_id] = wp.quat_rotate_inv(sensor_quat, lin_vel_w)
+    ang_vel_b[env_id] = wp.quat_rotate_inv(sensor_quat, ang_vel_w)
+    lin_acc_b[env_id] = wp.quat_rotate_inv(sensor_quat, lin_acc_w)
+    ang_acc_b[env_id] = wp.quat_rotate_inv(sensor_quat, ang_acc_w)
+    projected_gravity_b[env_id] = wp.quat_rotate_inv(sensor_quat, gravity_dir_w)
+    # store the velocities for the next update
+    prev_lin_vel_w[env_id] = lin_vel_w
+    prev_ang_vel_w[env_id] = ang_vel_w
+
+
+@wp.kernel(enable_backward=False)
+def solve_damped_least_squares_kernel(
+    jacobian: wp.array(dtype=wp.float32, ndim=3),
+    delta_pose: wp.array(dtype=wp.float32, ndim=2),
+    lambda_sq: float,
+    factor: wp.array(dtype=wp.float32, ndim=3),
+    solution: wp.array(dtype=wp.float32, ndim=2),
+    delta_joint_pos: wp.array(dtype=wp.float32, ndim=2),
+    compute_factor: int = 1,
+):
+    r"""Solves the damped least-squares problem for a batch of small Jacobian matrices.
+
+    Each thread processes one Jacobian matrix :math:`J` of shape (M, N), where M is typically 3 or 6. It computes
+    the Cholesky factor :math:`L` of the matrix :math:`J J^T + \lambda^2 I` and solves the system with a forward
+    and a backward substitution. The delta in joint space is then given by :math:`J^T (J J^T + \lambda^2 I)^{-1} dx`.
+
+    Args:
+        jacobian: The input Jacobian matrices. Shape is (B, M, N).
+        delta_pose: The input desired change in pose. Shape is (B, M).
+        lambda_sq: The squared damping coefficient.
+        factor: The lower-triangular Cholesky factors. Shape is (B, M, M). If `compute_factor` is 1, this
+            is an output. Otherwise, the factors are read from this array.
+        solution: A buffer to store the solution of the M x M system. Shape is (B, M).
+        delta_joint_pos: The output delta in joint space. Shape is (B, N).
+        compute_factor: Whether to compute the Cholesky factors (1) or read them from :attr:`factor` (0).
+            Defaults to 1.
+    """
+    # get the thread id
+    tid = wp.tid()
+    # resolve the dimensions
+    num_rows = jacobian.shape[1]
+    num_cols = jacobian.shape[2]
+
+    # compute the Cholesky factor of J J^T + lambda^2 I
+    if compute_factor == 1:
+        for i in range(num_rows):
+            for j in range(i + 1):
+                # entry of J J^T + lambda^2 I
+                s = float(0.0)
+                for k in range(num_cols):
+                    s += jacobian[tid, i, k] * jacobian[tid, j, k]
+                if i == j:
+                    s += lambda_sq
+                # subtract the contribution of the previous columns of the factor
+                for k in range(j):
+                    s -= factor[tid, i, k] * factor[tid, j, k]
+                if i == j:
+                    factor[tid, i, i] = wp.sqrt(wp.max(s, 1.0e-12))
+                else:
+                    factor[tid, i, j] = s / factor[tid, j, j]
+
+    # solve L z = dx with forward substitution
+    for i in range(num_rows):
+        s = float(delta_pose[tid, i])
+        for k in range(i):
+            s -= factor[tid, i, k] * solution[tid, k]
+        solution[tid, i] = s / factor[tid, i, i]
+    # solve L^T y = z with backward substitution
+    for ii in range(num_rows):
+        i = num_rows - 1 - ii
+        s = float(solution[tid, i])
+        for k in range(i + 1, num_rows):
+            s -= factor[tid, k, i] * solution[tid, k]
+        solution[tid, i] = s / factor[tid, i, i]
+
+    # compute the delta in joint space: J^T y
+    for j in range(num_cols):
+        s = float(0.0)
+        for i in range(num_rows):
+            s += jacobian[tid, i, j] * solution[tid, i]
+        delta_joint_pos[tid, j] = s
+
+
+@wp.kernel(enable_backward=False)
+def reshape_tiled_image_kernel(
     tiled_image_buffer: Any,
     batched_image: Any,
     image_height: int,
     image_width: int,
     num_channels: int,
+    num_tiled_channels: int,
     num_tiles_x: int,
+    max_value: float,
+    fill_value: float,
+    scale: float,
+    offset: float,
+    process_values: int,
 ):
-    """Reshapes a tiled image into a batch of images.
+    """Reshapes a tiled image into a batch of images and post-processes the pixel values.
 
-    This function reshapes the input tiled image buffer into a batch of images. The input image buffer
-    is assumed to be tiled in the x and y directions. The output image is a batch of images with the
-    specified height, width, and number of channels.
+    The number of channels of the output can be lower than the one of the tiled image, in which case only
+    the first channels are copied (for instance, RGBA to RGB).
+    If :attr:`process_values` is True, the pixel values greater than :attr:`max_value` (including infinite
+    values) are replaced by :attr:`fill_value`, and the result is normalized as ``value * scale + offset``.
 
     Args:
-        tiled_image_buffer: The input image buffer. Shape is (height * width * num_channels * num_cameras,).
+        tiled_image_buffer: The input image buffer. Shape is (height * width * num_tiled_channels * num_tiles,).
         batched_image: The output image. Shape is (num_cameras, height, width, num_channels).
-        image_width: The width of the image.
         image_height: The height of the image.
-        num_channels: The number of channels in the image.
+        image_width: The width of the image.
+        num_channels: The number of channels in the output image.
+        num_tiled_channels: The number of channels in the tiled image.
         num_tiles_x: The number of tiles in x-direction.
+        max_value: The maximum pixel value before replacement.
+        fill_value: The value replacing the pixel values greater than :attr:`max_value`.
+        scale: The scale applied to the pixel values.
+        offset: The offset applied to the pixel values after scaling.
+        process_values: Whether to replace and normalize the pixel values.
     """
     # get the thread id
     camera_id, height_id, width_id = wp.tid()
@@ -105,29 +465,238 @@ def reshape_tiled_image(
     tile_x_id = camera_id % num_tiles_x
     tile_y_id = camera_id // num_tiles_x
     # compute the start index of the pixel in the tiled image buffer
-    pixel_start = (
-        num_channels * num_tiles_x * image_width * (image_height * tile_y_id + height_id)
-        + num_channels * tile_x_id * image_width
-        + num_channels * width_id
+    pixel_start = num_tiled_channels * (
+        num_tiles_x * image_width * (image_height * tile_y_id + height_id) + tile_x_id * image_width + width_id
     )
 
     # copy the pixel values into the batched image
     for i in range(num_channels):
-        batched_image[camera_id, height_id, width_id, i] = batched_image.dtype(tiled_image_buffer[pixel_start + i])
+        if process_values:
+            value = float(tiled_image_buffer[pixel_start + i])
+            if value > max_value:
+                value = fill_value
+            batched_image[camera_id, height_id, width_id, i] = batched_image.dtype(value * scale + offset)
+        else:
+            batched_image[camera_id, height_id, width_id, i] = batched_image.dtype(tiled_image_buffer[pixel_start + i])
 
 
 # uint32 -> int32 conversion is required for non-colored segmentation annotators
 wp.overload(
-    reshape_tiled_image,
-    {"tiled_image_buffer": wp.array(dtype=wp.uint32), "batched_image": wp.array(dtype=wp.uint32, ndim=4)},
+    reshape_tiled_image_kernel,
+    {"tiled_image_buffer": wp.array(dtype=wp.uint32), "batched_image": wp.array(dtype=wp.int32, ndim=4)},
 )
 # uint8 is used for 4 channel annotators
 wp.overload(
-    reshape_tiled_image,
+    reshape_tiled_image_kernel,
     {"tiled_image_buffer": wp.array(dtype=wp.uint8), "batched_image": wp.array(dtype=wp.uint8, ndim=4)},
 )
-# float32 is used for single channel annotators
+# uint8 -> float32 conversion is used for normalized color images
 wp.overload(
-    reshape_tiled_image,
+    reshape_tiled_image_kernel,
+    {"tiled_image_buffer": wp.array(dtype=wp.uint8), "batched_image": wp.array(dtype=wp.float32, ndim=4)},
+)
+# float32 is used for depth, normals and motion vectors annotators
+wp.overload(
+    reshape_tiled_image_kernel,
     {"tiled_image_buffer": wp.array(dtype=wp.float32), "batched_image": wp.array(dtype=wp.float32, ndim=4)},
 )
+
+
+##
+# Quaternion operations.
+##
+
+
+@wp.func
+def _quat_mul(q1: wp.vec4, q2: wp.vec4):
+    """Multiplies two quaternions in (w, x, y, z) as :func:`omni.isaac.lab.utils.math.quat_mul`."""
+    w1 = q1[0]
+    x1 = q1[1]
+    y1 = q1[2]
+    z1 = q1[3]
+    w2 = q2[0]
+    x2 = q2[1]
+    y2 = q2[2]
+    z2 = q2[3]
+    ww = (z1 + x1) * (x2 + y2)
+    yy = (w1 - y1) * (w2 + z2)
+    zz = (w1 + y1) * (w2 - z2)
+    xx = ww + yy + zz
+    qq = 0.5 * (xx + (z1 - x1) * (x2 - y2))
+    w = qq - ww + (z1 - y1) * (y2 - z2)
+    x = qq - xx + (x1 + w1) * (x2 + w2)
+    y = qq - yy + (w1 - x1) * (y2 + z2)
+    z = qq - zz + (z1 + y1) * (w2 - x2)
+    return wp.vec4(w, x, y, z)
+
+
+@wp.func
+def _quat_apply(q: wp.vec4, v: wp.vec3):
+    """Rotates a vector by a quaternion in (w, x, y, z) as :func:`omni.isaac.lab.utils.math.quat_apply`."""
+    xyz = wp.vec3(q[1], q[2], q[3])
+    t = wp.cross(xyz, v) * 2.0
+    return v + q[0] * t + wp.cross(xyz, t)
+
+
+@wp.func
+def _quat_inv(q: wp.vec4):
+    """Inverts a quaternion in (w, x, y, z) as :func:`omni.isaac.lab.utils.math.quat_inv`."""
+    scale = 1.0 / wp.max(wp.length(q), 1.0e-9)
+    return wp.vec4(q[0] * scale, -q[1] * scale, -q[2] * scale, -q[3] * scale)
+
+
+@wp.kernel(enable_backward=False)
+def quat_mul_kernel(q1: wp.array(dtype=wp.vec4), q2: wp.array(dtype=wp.vec4), q: wp.array(dtype=wp.vec4)):
+    """Multiplies two batches of quaternions in (w, x, y, z).
+
+    Args:
+        q1: The first quaternions. Shape is (N, 4).
+        q2: The second quaternions. Shape is (N, 4).
+        q: The output products of the quaternions. Shape is (N, 4).
+    """
+    tid = wp.tid()
+    q[tid] = _quat_mul(q1[tid], q2[tid])
+
+
+@wp.kernel(enable_backward=False)
+def quat_apply_kernel(q: wp.array(dtype=wp.vec4), v: wp.array(dtype=wp.vec3), out: wp.array(dtype=wp.vec3)):
+    """Rotates a batch of vectors by quaternions in (w, x, y, z).
+
+    Args:
+        q: The quaternions. Shape is (N, 4).
+        v: The vectors. Shape is (N, 3).
+        out: The output rotated vectors. Shape is (N, 3).
+    """
+    tid = wp.tid()
+    out[tid] = _quat_apply(q[tid], v[tid])
+
+
+@wp.kernel(enable_backward=False)
+def quat_rotate_kernel(
+    q: wp.array(dtype=wp.vec4), v: wp.array(dtype=wp.vec3), inverse: int, out: wp.array(dtype=wp.vec3)
+):
+    """Rotates a batch of vectors by quaternions in (w, x, y, z) or their inverses.
+
+    The rotation uses the same formula as :func:`omni.isaac.lab.utils.math.quat_rotate` and
+    :func:`omni.isaac.lab.utils.math.quat_rotate_inverse`.
+
+    Args:
+        q: The quaternions. Shape is (N, 4).
+        v: The vectors. Shape is (N, 3).
+        inverse: Whether to rotate the vectors by the inverse of the quaternions.
+        out: The output rotated vectors. Shape is (N, 3).
+    """
+    tid = wp.tid()
+    quat = q[tid]
+    vec = v[tid]
+    q_w = quat[0]
+    q_vec = wp.vec3(quat[1], quat[2], quat[3])
+    a = vec * (2.0 * q_w * q_w - 1.0)
+    b = wp.cross(q_vec, vec) * q_w * 2.0
+    c = q_vec * wp.dot(q_vec, vec) * 2.0
+    if inverse == 1:
+        out[tid] = a - b + c
+    else:
+        out[tid] = a + b + c
+
+
+@wp.kernel(enable_backward=False)
+def combine_frame_transforms_kernel(
+    t01: wp.array(dtype=wp.vec3),
+    q01: wp.array(dtype=wp.vec4),
+    t12: wp.array(dtype=wp.vec3),
+    q12: wp.array(dtype=wp.vec4),
+    has_t12: int,
+    has_q12: int,
+    t02: wp.array(dtype=wp.vec3),
+    q02: wp.array(dtype=wp.vec4),
+):
+    """Combines a batch of transformations between two reference frames.
+
+    Args:
+        t01: The positions of frame 1 w.r.t. frame 0. Shape is (N, 3).
+        q01: The orientations of frame 1 w.r.t. frame 0 in (w, x, y, z). Shape is (N, 4).
+        t12: The positions of frame 2 w.r.t. frame 1. Shape is (N, 3).
+        q12: The orientations of frame 2 w.r.t. frame 1 in (w, x, y, z). Shape is (N, 4).
+        has_t12: Whether the positions of frame 2 are provided. Otherwise, they are assumed to be zero.
+        has_q12: Whether the orientations of frame 2 are provided. Otherwise, they are assumed to be identity.
+        t02: The output positions of frame 2 w.r.t. frame 0. Shape is (N, 3).
+        q02: The output orientations of frame 2 w.r.t. frame 0 in (w, x, y, z). Shape is (N, 4).
+    """
+    tid = wp.tid()
+    # compute orientation
+    if has_q12 == 1:
+        q02[tid] = _quat_mul(q01[tid], q12[tid])
+    else:
+        q02[tid] = q01[tid]
+    # compute translation
+    if has_t12 == 1:
+        t02[tid] = t01[tid] + _quat_apply(q01[tid], t12[tid])
+    else:
+        t02[tid] = t01[tid]
+
+
+@wp.kernel(enable_backward=False)
+def subtract_frame_transforms_kernel(
+    t01: wp.array(dtype=wp.vec3),
+    q01: wp.array(dtype=wp.vec4),
+    t02: wp.array(dtype=wp.vec3),
+    q02: wp.array(dtype=wp.vec4),
+    has_t02: int,
+    has_q02: int,
+    t12: wp.array(dtype=wp.vec3),
+    q12: wp.array(dtype=wp.vec4),
+):
+    """Subtracts a batch of transformations between two reference frames.
+
+    Args:
+        t01: The positions of frame 1 w.r.t. frame 0. Shape is (N, 3).
+        q01: The orientations of frame 1 w.r.t. frame 0 in (w, x, y, z). Shape is (N, 4).
+        t02: The positions of frame 2 w.r.t. frame 0. Shape is (N, 3).
+        q02: The orientations of frame 2 w.r.t. frame 0 in (w, x, y, z). Shape is (N, 4).
+        has_t02: Whether the positions of frame 2 are provided. Otherwise, they are assumed to be zero.
+        has_q02: Whether the orientations of frame 2 are provided. Otherwise, they are assumed to be identity.
+        t12: The output positions of frame 2 w.r.t. frame 1. Shape is (N, 3).
+        q12: The output orientations of frame 2 w.r.t. frame 1 in (w, x, y, z). Shape is (N, 4).
+    """
+    tid = wp.tid()
+    # compute orientation
+    q10 = _quat_inv(q01[tid])
+    if has_q02 == 1:
+        q12[tid] = _quat_mul(q10, q02[tid])
+    else:
+        q12[tid] = q10
+    # compute translation
+    if has_t02 == 1:
+        t12[tid] = _quat_apply(q10, t02[tid] - t01[tid])
+    else:
+        t12[tid] = _quat_apply(q10, -t01[tid])
+
+
+@wp.kernel(enable_backward=False)
+def quat_error_magnitude_kernel(
+    q1: wp.array(dtype=wp.vec4), q2: wp.array(dtype=wp.vec4), eps: float, error: wp.array(dtype=wp.float32)
+):
+    """Computes the rotation difference between two batches of quaternions in (w, x, y, z).
+
+    The angle of the difference is computed as in :func:`omni.isaac.lab.utils.math.axis_angle_from_quat`,
+    including the Taylor approximation for small angles.
+
+    Args:
+        q1: The first quaternions. Shape is (N, 4).
+        q2: The second quaternions. Shape is (N, 4).
+        eps: The tolerance for the Taylor approximation.
+        error: The output angular errors in radians. Shape is (N,).
+    """
+    tid = wp.tid()
+    quat = q2[tid]
+    quat_diff = _quat_mul(q1[tid], wp.vec4(quat[0], -quat[1], -quat[2], -quat[3]))
+    # compute the angle of the difference
+    mag = wp.length(wp.vec3(quat_diff[1], quat_diff[2], quat_diff[3]))
+    half_angle = wp.atan2(mag, wp.abs(quat_diff[0]))
+    angle = 2.0 * half_angle
+    # check whether to apply Taylor approximation
+    sin_half_angle_over_angle = 0.5 - angle * angle / 48.0
+    if wp.abs(angle) > eps:
+        sin_half_angle_over_angle = wp.sin(half_angle) / angle
+    error[tid] = mag / wp.abs(sin_half_angle_over_angle)
@@ -8,6 +8,7 @@
 # needed to import for allowing type-hinting: torch.Tensor | None
 from __future__ import annotations
 
+import math
 import numpy as np
 import torch
 
@@ -127,6 +128,218 @@ def raycast_mesh(
     return ray_hits.to(device).view(shape), ray_distance, ray_normal, ray_face_id
 
 
+def solve_damped_least_squares(
+    jacobian: torch.Tensor,
+    delta_pose: torch.Tensor,
+    lambda_val: float,
+    factor: torch.Tensor | None = None,
+    solution: torch.Tensor | None = None,
+    delta_joint_pos: torch.Tensor | None = None,
+    compute_factor: bool = True,
+) -> torch.Tensor:
+    r"""Solves the damped least-squares problem for a batch of Jacobian matrices.
+
+    The delta in joint space is computed as :math:`J^T (J J^T + \lambda^2 I)^{-1} dx` using a Cholesky
+    factorization of the (small) M x M matrix. All the operations for a single Jacobian are performed in a
+    single thread of a warp kernel.
+
+    The optional buffers can be provided to avoid allocating memory at every call. If :attr:`compute_factor`
+    is False, the Cholesky factors stored in :attr:`factor` from a previous call are reused.
+
+    Args:
+        jacobian: The Jacobian matrices. Shape is (B, M, N).
+        delta_pose: The desired change in pose. Shape is (B, M).
+        lambda_val: The damping coefficient.
+        factor: The buffer for the Cholesky factors. Shape is (B, M, M). Defaults to None,
+            in which case a new buffer is allocated.
+        solution: The buffer for the solution of the M x M system. Shape is (B, M). Defaults to None,
+            in which case a new buffer is allocated.
+        delta_joint_pos: The buffer for the output. Shape is (B, N). Defaults to None,
+            in which case a new buffer is allocated.
+        compute_factor: Whether to compute the Cholesky factors. Defaults to True.
+
+    Returns:
+        The delta in joint space. Shape is (B, N).
+
+    Raises:
+        ValueError: If :attr:`compute_factor` is False and no :attr:`factor` buffer is provided.
+    """
+    # extract shape information
+    num_envs, num_rows, num_cols = jacobian.shape
+    device = jacobian.device
+    # create the buffers if not provided
+    if factor is None:
+        if not compute_factor:
+            raise ValueError("The Cholesky factors must be provided when they are not computed.")
+        factor = torch.zeros(num_envs, num_rows, num_rows, device=device)
+    if solution is None:
+        solution = torch.zeros(num_envs, num_rows, device=device)
+    if delta_joint_pos is None:
+        delta_joint_pos = torch.zeros(num_envs, num_cols, device=device)
+
+    # launch the warp kernel
+    wp.launch(
+        kernel=kernels.solve_damped_least_squares_kernel,
+        dim=num_envs,
+        inputs=[
+            wp.from_torch(jacobian.float().contiguous()),
+            wp.from_torch(delta_pose.float().contiguous()),
+            float(lambda_val**2),
+            wp.from_torch(factor),
+            wp.from_torch(solution),
+            wp.from_torch(delta_joint_pos),
+            int(compute_factor),
+        ],
+        device=wp.device_from_torch(device),
+    )
+
+    return delta_joint_pos
+
+
+def update_contact_time(
+    net_forces_w: torch.Tensor,
+    elapsed_time: torch.Tensor,
+    force_threshold: float,
+    current_air_time: torch.Tensor,
+    last_air_time: torch.Tensor,
+    current_contact_time: torch.Tensor,
+    last_contact_time: torch.Tensor,
+    env_ids: torch.Tensor | None = None,
+):
+    """Updates the air and contact times of bodies in-place based on their net contact forces.
+
+    All the buffers are updated in a single kernel launch. A body is in contact if the norm of its net contact
+    force is above the threshold. The time buffers must be contiguous float32 tensors on the same device.
+
+    Args:
+        net_forces_w: The net contact forces on the bodies. Shape is (N, B, 3).
+        elapsed_time: The time elapsed since the last update of each environment. Shape is (N,).
+        force_threshold: The threshold on the norm of the contact force to detect a contact.
+        current_air_time: The time spent in the air since the last detach. Shape is (N, B).
+        last_air_time: The time spent in the air before the last contact. Shape is (N, B).
+        current_contact_time: The time spent in contact since the last contact. Shape is (N, B).
+        last_contact_time: The time spent in contact before the last detach. Shape is (N, B).
+        env_ids: The indices of the environments to update. Shape is (M,). Defaults to None,
+            in which case all the environments are updated.
+    """
+    # extract shape information
+    num_envs, num_bodies = current_air_time.shape
+    device = current_air_time.device
+    # resolve the environment indices
+    if env_ids is None:
+        env_ids = torch.arange(num_envs, dtype=torch.int32, device=device)
+    else:
+        env_ids = env_ids.to(dtype=torch.int32)
+
+    # launch the warp kernel
+    wp.launch(
+        kernel=kernels.update_contact_time_kernel,
+        dim=(len(env_ids), num_bodies),
+        inputs=[
+            wp.from_torch(env_ids),
+            wp.from_torch(net_forces_w.contiguous(), dtype=wp.vec3),
+            wp.from_torch(elapsed_time.contiguous()),
+            float(force_threshold),
+            wp.from_torch(current_air_time),
+            wp.from_torch(last_air_time),
+            wp.from_torch(current_contact_time),
+            wp.from_torch(last_contact_time),
+        ],
+        device=wp.device_from_torch(device),
+    )
+
+
+def reshape_tiled_image(
+    tiled_image: wp.array | torch.Tensor | np.ndarray,
+    batched_image: torch.Tensor,
+    num_tiles_x: int,
+    max_value: float | None = None,
+    fill_value: float | None = None,
+    scale: float = 1.0,
+    offset: float = 0.0,
+) -> torch.Tensor:
+    """Reshapes a tiled image into a preallocated batch of images in a single kernel launch.
+
+    The tiled image contains the images of all the cameras, laid out row-major on a grid with :attr:`num_tiles_x`
+    columns. The number of channels of the tiled image is inferred from its size. If the batched image has fewer
+    channels, only the first channels of every pixel are copied (for instance, RGBA to RGB).
+
+    The pixel values can optionally be post-processed in the same launch: the values greater than
+    :attr:`max_value` (including infinite values) are replaced by :attr:`fill_value`, and the result is
+    normalized as ``value * scale + offset``.
+
+    Tiled images on the same device as the batched image are wrapped without copying. This includes numpy
+    arrays when the batched image is on the CPU.
+
+    Args:
+        tiled_image: The tiled image. Shape is (num_tiles_y * H, num_tiles_x * W) or
+            (num_tiles_y * H, num_tiles_x * W, C), where C is the number of channels.
+        batched_image: The buffer for the batch of images. Shape is (N, H, W, C'), where C' <= C.
+        num_tiles_x: The number of tiles in x-direction.
+        max_value: The maximum pixel value before replacement. Defaults to None, in which case
+            the values are not replaced.
+        fill_value: The value replacing the pixel values greater than :attr:`max_value`. Defaults to None,
+            in which case the values are clipped to :attr:`max_value`.
+        scale: The scale applied to the pixel values. Defaults to 1.0.
+        offset: The offset applied to the pixel values after scaling. Defaults to 0.0.
+
+    Returns:
+        The batch of images. Shape is (N, H, W, C').
+
+    Raises:
+        ValueError: If the batched image does not have four dimensions.
+        ValueError: If the batched image has more channels than the tiled image.
+    """
+    # extract shape information
+    if batched_image.dim() != 4:
+        raise ValueError(f"Expected the batched image to have shape (N, H, W, C), but got {batched_image.shape}.")
+    num_images, height, width, num_channels = batched_image.shape
+    device = wp.device_from_torch(batched_image.device)
+    # map the memory of the tiled image to a flat warp array
+    if isinstance(tiled_image, np.ndarray):
+        tiled_image = wp.array(np.ascontiguousarray(tiled_image).reshape(-1), device=device, copy=False)
+    elif isinstance(tiled_image, torch.Tensor):
+        tiled_image = wp.from_torch(tiled_image.to(batched_image.device).contiguous().view(-1))
+    else:
+        tiled_image = tiled_image.to(device).flatten()
+    # infer the number of channels of the tiled image
+    num_tiles_y = math.ceil(num_images / num_tiles_x)
+    num_tiled_channels = tiled_image.size // (num_tiles_x * num_tiles_y * height * width)
+    if num_channels > num_tiled_channels:
+        raise ValueError(
+            f"The batched image has more channels ({num_channels}) than the tiled image ({num_tiled_channels})."
+        )
+    # resolve the post-processing of the pixel values
+    process_values = max_value is not None or scale != 1.0 or offset != 0.0
+    if max_value is None:
+        max_value = float("inf")
+    if fill_value is None:
+        fill_value = max_value
+
+    # launch the warp kernel
+    wp.launch(
+        kernel=kernels.reshape_tiled_image_kernel,
+        dim=(num_images, height, width),
+        inputs=[
+            tiled_image,
+            wp.from_torch(batched_image),
+            height,
+            width,
+            num_channels,
+            num_tiled_channels,
+            num_tiles_x,
+            float(max_value),
+            float(fill_value),
+            float(scale),
+            float(offset),
+            int(process_values),
+        ],
+        device=device,
+    )
+
+    return batched_image
+
+
 def convert_to_warp_mesh(points: np.ndarray, indices: np.ndarray, device: str) -> wp.Mesh:
     """Create a warp mesh object with a mesh defined from vertices and triangles.
 
@@ -143,3 +356,242 @@ def convert_to_warp_mesh(points: np.ndarray, indices: np.ndarray, device: str) -
         points=wp.array(points.astype(np.float32), dtype=wp.vec3, device=device),
         indices=wp.array(indices.astype(np.int32).flatten(), dtype=wp.int32, device=device),
     )
+
+
+"""
+Quaternion operations.
+
+The following functions have the same signatures as their counterparts in :mod:`omni.isaac.lab.utils.math`,
+but compute all the operations for an element of the batch in a single thread of a warp kernel. This avoids the
+intermediate tensors created by the chains of element-wise torch operations. The leading dimensions of the
+inputs are broadcast against each other. The operations are computed in single precision and do not support
+the computation of gradients.
+"""
+
+
+def quat_mul(q1: torch.Tensor, q2: torch.Tensor) -> torch.Tensor:
+    """Multiply two quaternions together.
+
+    Fused implementation of :func:`omni.isaac.lab.utils.math.quat_mul`.
+
+    Args:
+        q1: The first quaternion in (w, x, y, z). Shape is (..., 4).
+        q2: The second quaternion in (w, x, y, z). Shape is (..., 4).
+
+    Returns:
+        The product of the two quaternions in (w, x, y, z). Shape is (..., 4).
+
+    Raises:
+        ValueError: Input shapes of ``q1`` and ``q2`` are not matching.
+    """
+    # check input is correct
+    if q1.shape != q2.shape:
+        raise ValueError(f"Expected input quaternion shape mismatch: {q1.shape} != {q2.shape}.")
+    q = torch.empty(q1.shape, device=q1.device)
+    _launch_batched_kernel(
+        kernels.quat_mul_kernel, q1.shape[:-1], q1.device, [(q1, wp.vec4), (q2, wp.vec4)], [], [(q, wp.vec4)]
+    )
+    return q
+
+
+def quat_apply(quat: torch.Tensor, vec: torch.Tensor) -> torch.Tensor:
+    """Apply a quaternion rotation to a vector.
+
+    Fused implementation of :func:`omni.isaac.lab.utils.math.quat_apply`.
+
+    Args:
+        quat: The quaternion in (w, x, y, z). Shape is (..., 4).
+        vec: The vector in (x, y, z). Shape is (..., 3).
+
+    Returns:
+        The rotated vector in (x, y, z). Shape is (..., 3).
+    """
+    batch_shape = torch.broadcast_shapes(quat.shape[:-1], vec.shape[:-1])
+    out = torch.empty(*batch_shape, 3, device=vec.device)
+    _launch_batched_kernel(
+        kernels.quat_apply_kernel, batch_shape, vec.device, [(quat, wp.vec4), (vec, wp.vec3)], [], [(out, wp.vec3)]
+    )
+    return out
+
+
+def quat_rotate(q: torch.Tensor, v: torch.Tensor) -> torch.Tensor:
+    """Rotate a vector by a quaternion along the last dimension of q and v.
+
+    Fused implementation of :func:`omni.isaac.lab.utils.math.quat_rotate`.
+
+    Args:
+        q: The quaternion in (w, x, y, z). Shape is (..., 4).
+        v: The vector in (x, y, z). Shape is (..., 3).
+
+    Returns:
+        The rotated vector in (x, y, z). Shape is (..., 3).
+    """
+    batch_shape = torch.broadcast_shapes(q.shape[:-1], v.shape[:-1])
+    out = torch.empty(*batch_shape, 3, device=v.device)
+    _launch_batched_kernel(
+        kernels.quat_rotate_kernel, batch_shape, v.device, [(q, wp.vec4), (v, wp.vec3)], [0], [(out, wp.vec3)]
+    )
+    return out
+
+
+def quat_rotate_inverse(q: torch.Tensor, v: torch.Tensor) -> torch.Tensor:
+    """Rotate a vector by the inverse of a quaternion along the last dimension of q and v.
+
+    Fused implementation of :func:`omni.isaac.lab.utils.math.quat_rotate_inverse`.
+
+    Args:
+        q: The quaternion in (w, x, y, z). Shape is (..., 4).
+        v: The vector in (x, y, z). Shape is (..., 3).
+
+    Returns:
+        The rotated vector in (x, y, z). Shape is (..., 3).
+    """
+    batch_shape = torch.broadcast_shapes(q.shape[:-1], v.shape[:-1])
+    out = torch.empty(*batch_shape, 3, device=v.device)
+    _launch_batched_kernel(
+        kernels.quat_rotate_kernel, batch_shape, v.device, [(q, wp.vec4), (v, wp.vec3)], [1], [(out, wp.vec3)]
+    )
+    return out
+
+
+def quat_error_magnitude(q1: torch.Tensor, q2: torch.Tensor) -> torch.Tensor:
+    """Computes the rotation difference between two quaternions.
+
+    Fused implementation of :func:`omni.isaac.lab.utils.math.quat_error_magnitude`.
+
+    Args:
+        q1: The first quaternion in (w, x, y, z). Shape is (..., 4).
+        q2: The second quaternion in (w, x, y, z). Shape is (..., 4).
+
+    Returns:
+        Angular error between input quaternions in radians.
+    """
+    batch_shape = torch.broadcast_shapes(q1.shape[:-1], q2.shape[:-1])
+    error = torch.empty(batch_shape, device=q1.device)
+    _launch_batched_kernel(
+        kernels.quat_error_magnitude_kernel,
+        batch_shape,
+        q1.device,
+        [(q1, wp.vec4), (q2, wp.vec4)],
+        [1.0e-6],
+        [(error, wp.float32)],
+    )
+    return error
+
+
+def combine_frame_transforms(
+    t01: torch.Tensor, q01: torch.Tensor, t12: torch.Tensor | None = None, q12: torch.Tensor | None = None
+) -> tuple[torch.Tensor, torch.Tensor]:
+    r"""Combine transformations between two reference frames into a stationary frame.
+
+    Fused implementation of :func:`omni.isaac.lab.utils.math.combine_frame_transforms`.
+
+    Args:
+        t01: Position of frame 1 w.r.t. frame 0. Shape is (N, 3).
+        q01: Quaternion orientation of frame 1 w.r.t. frame 0 in (w, x, y, z). Shape is (N, 4).
+        t12: Position of frame 2 w.r.t. frame 1. Shape is (N, 3).
+            Defaults to None, in which case the position is assumed to be zero.
+        q12: Quaternion orientation of frame 2 w.r.t. frame 1 in (w, x, y, z). Shape is (N, 4).
+            Defaults to None, in which case the orientation is assumed to be identity.
+
+    Returns:
+        A tuple containing the position and orientation of frame 2 w.r.t. frame 0.
+        Shape of the tensors are (N, 3) and (N, 4) respectively.
+    """
+    # note: the missing inputs are replaced with the inputs of frame 1, which are ignored by the kernel
+    batch_shape = torch.broadcast_shapes(*[x.shape[:-1] for x in [t01, q01, t12, q12] if x is not None])
+    t02 = torch.empty(*batch_shape, 3, device=t01.device)
+    q02 = torch.empty(*batch_shape, 4, device=t01.device)
+    _launch_batched_kernel(
+        kernels.combine_frame_transforms_kernel,
+        batch_shape,
+        t01.device,
+        [
+            (t01, wp.vec3),
+            (q01, wp.vec4),
+            (t01 if t12 is None else t12, wp.vec3),
+            (q01 if q12 is None else q12, wp.vec4),
+        ],
+        [int(t12 is not None), int(q12 is not None)],
+        [(t02, wp.vec3), (q02, wp.vec4)],
+    )
+    return t02, q02
+
+
+def subtract_frame_transforms(
+    t01: torch.Tensor, q01: torch.Tensor, t02: torch.Tensor | None = None, q02: torch.Tensor | None = None
+) -> tuple[torch.Tensor, torch.Tensor]:
+    r"""Subtract transformations between two reference frames into a stationary frame.
+
+    Fused implementation of :func:`omni.isaac.lab.utils.math.subtract_frame_transforms`.
+
+    Args:
+        t01: Position of frame 1 w.r.t. frame 0. Shape is (N, 3).
+        q01: Quaternion orientation of frame 1 w.r.t. frame 0 in (w, x, y, z). Shape is (N, 4).
+        t02: Position of frame 2 w.r.t. frame 0. Shape is (N, 3).
+            Defaults to None, in which case the position is assumed to be zero.
+        q02: Quaternion orientation of frame 2 w.r.t. frame 0 in (w, x, y, z). Shape is (N, 4).
+            Defaults to None, in which case the orientation is assumed to be identity.
+
+    Returns:
+        A tuple containing the position and orientation of frame 2 w.r.t. frame 1.
+        Shape of the tensors are (N, 3) and (N, 4) respectively.
+    """
+    # note: the missing inputs are replaced with the inputs of frame 1, which are ignored by the kernel
+    batch_shape = torch.broadcast_shapes(*[x.shape[:-1] for x in [t01, q01, t02, q02] if x is not None])
+    t12 = torch.empty(*batch_shape, 3, device=t01.device)
+    q12 = torch.empty(*batch_shape, 4, device=t01.device)
+    _launch_batched_kernel(
+        kernels.subtract_frame_transforms_kernel,
+        batch_shape,
+        t01.device,
+        [
+            (t01, wp.vec3),
+            (q01, wp.vec4),
+            (t01 if t02 is None else t02, wp.vec3),
+            (q01 if q02 is None else q02, wp.vec4),
+        ],
+        [int(t02 is not None), int(q02 is not None)],
+        [(t12, wp.vec3), (q12, wp.vec4)],
+    )
+    return t12, q12
+
+
+"""
+Internal helpers.
+"""
+
+
+def _launch_batched_kernel(
+    kernel: wp.Kernel,
+    batch_shape: torch.Size,
+    device: torch.device,
+    inputs: list[tuple[torch.Tensor, type]],
+    params: list,
+    outputs: list[tuple[torch.Tensor, type]],
+):
+    """Launches a kernel with one thread per element of the batch.
+
+    The input tensors are broadcast to the batch shape and converted to contiguous float32 tensors, which only
+    copies the tensors that do not already satisfy these conditions. The output tensors must be contiguous
+    float32 tensors of the batch shape.
+
+    Args:
+        kernel: The kernel to launch.
+        batch_shape: The shape of the batch, i.e. the leading dimensions of the outputs.
+        device: The device to launch the kernel on.
+        inputs: The input tensors and their warp data types.
+        params: The scalar parameters of the kernel, which follow the inputs.
+        outputs: The output tensors and their warp data types, which follow the parameters.
+    """
+    num_elements = math.prod(batch_shape)
+    if num_elements == 0:
+        return
+    # flatten the batch dimensions of the tensors
+    inputs = [
+        wp.from_torch(x.expand(*batch_shape, x.shape[-1]).reshape(num_elements, -1).float().contiguous(), dtype=dtype)
+        for x, dtype in inputs
+    ]
+    outputs = [wp.from_torch(x.view(num_elements, -1).squeeze(-1), dtype=dtype) for x, dtype in outputs]
+    # launch the warp kernel
+    wp.launch(kernel=kernel, dim=num_elements, inputs=[*inputs, *params, *outputs], device=wp.device_from_torch(device))
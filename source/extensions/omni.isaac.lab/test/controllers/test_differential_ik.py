@@ -109,6 +109,58 @@ class TestDifferentialIKController(unittest.TestCase):
         # Run the controller and check that it converges to the goal
         self._run_ik_controller(robot, diff_ik_controller, "ee_link", [".*"])
 
+    def test_dls_solvers(self):
+        """Test that the damped least-squares solvers compute the same delta in joint space."""
+        for device in ["cpu", "cuda:0"]:
+            for command_type in ["position", "pose"]:
+                with self.subTest(device=device, command_type=command_type):
+                    num_rows = 3 if command_type == "position" else 6
+                    # create random jacobians and pose errors
+                    jacobian = torch.randn(self.num_envs, num_rows, 7, device=device)
+                    delta_pose = torch.randn(self.num_envs, num_rows, device=device)
+
+                    # compute the delta in joint space for each solver
+                    delta_joint_pos = dict()
+                    for ik_method in ["dls", "dls_cholesky", "dls_warp"]:
+                        diff_ik_cfg = DifferentialIKControllerCfg(command_type=command_type, ik_method=ik_method)
+                        diff_ik_controller = DifferentialIKController(
+                            diff_ik_cfg, num_envs=self.num_envs, device=device
+                        )
+                        delta_joint_pos[ik_method] = diff_ik_controller._compute_delta_joint_pos(
+                            delta_pose=delta_pose, jacobian=jacobian
+                        ).clone()
+
+                    # check that the solvers agree
+                    torch.testing.assert_close(
+                        delta_joint_pos["dls_cholesky"], delta_joint_pos["dls"], atol=1e-4, rtol=1e-3
+                    )
+                    torch.testing.assert_close(
+                        delta_joint_pos["dls_warp"], delta_joint_pos["dls"], atol=1e-4, rtol=1e-3
+                    )
+
+    def test_dls_factorization_reuse(self):
+        """Test that the factorization of the damped least-squares solvers is reused over multiple calls."""
+        for ik_method in ["dls_cholesky", "dls_warp"]:
+            with self.subTest(ik_method=ik_method):
+                diff_ik_cfg = DifferentialIKControllerCfg(
+                    command_type="pose", ik_method=ik_method, ik_params={"factorization_period": 2}
+                )
+                diff_ik_controller = DifferentialIKController(
+                    diff_ik_cfg, num_envs=self.num_envs, device=self.sim.device
+                )
+                # create random jacobians and pose errors
+                jacobian = torch.randn(self.num_envs, 6, 7, device=self.sim.device)
+                delta_pose = torch.randn(self.num_envs, 6, device=self.sim.device)
+                # compute the factorization at the first call
+                diff_ik_controller._compute_delta_joint_pos(delta_pose=delta_pose, jacobian=jacobian)
+                factor = diff_ik_controller._dls_factor.clone()
+                # reuse the factorization at the second call
+                diff_ik_controller._compute_delta_joint_pos(delta_pose=delta_pose, jacobian=2.0 * jacobian)
+                torch.testing.assert_close(diff_ik_controller._dls_factor, factor)
+                # re-compute the factorization at the third call
+                diff_ik_controller._compute_delta_joint_pos(delta_pose=delta_pose, jacobian=2.0 * jacobian)
+                self.assertFalse(torch.allclose(diff_ik_controller._dls_factor, factor))
+
     """
     Helper functions.
     """
@@ -20,7 +20,7 @@ import unittest
 from collections import namedtuple
 
 from omni.isaac.lab.managers import ManagerTermBase, ObservationGroupCfg, ObservationManager, ObservationTermCfg
-from omni.isaac.lab.utils import configclass, modifiers
+from omni.isaac.lab.utils import configclass, modifiers, noise
 
 
 def grilled_chicken(env):
@@ -304,6 +304,114 @@ class TestObservationManager(unittest.TestCase):
         torch.testing.assert_close(obs_policy[:, 5:8], obs_critic[:, 0:3])
         torch.testing.assert_close(obs_policy[:, 8:11], obs_critic[:, 3:6])
 
+    def test_compute_with_group_buffer(self):
+        """Test the observation computation with a persistent group buffer."""
+
+        pos_scale_tuple = (2.0, 3.0, 1.0)
+
+        @configclass
+        class MyObservationManagerCfg:
+            """Test config class for observation manager."""
+
+            @configclass
+            class PolicyCfg(ObservationGroupCfg):
+                """Test config class for policy observation group."""
+
+                term_1 = ObservationTermCfg(func=grilled_chicken, scale=10, clip=(-5.0, 5.0))
+                term_2 = ObservationTermCfg(func=grilled_chicken_with_curry, scale=0.0, params={"hot": False})
+                term_3 = ObservationTermCfg(func=pos_w_data, scale=pos_scale_tuple)
+                term_4 = ObservationTermCfg(
+                    func=lin_vel_w_data,
+                    scale=1.5,
+                    modifiers=[modifiers.ModifierCfg(func=modifiers.bias, params={"value": 0.5})],
+                )
+
+            @configclass
+            class PolicyBufferCfg(PolicyCfg):
+                """Test config class for policy observation group with a persistent buffer."""
+
+                use_group_buffer = True
+
+            policy: ObservationGroupCfg = PolicyCfg()
+            policy_buffer: ObservationGroupCfg = PolicyBufferCfg()
+
+        # create observation manager
+        cfg = MyObservationManagerCfg()
+        self.obs_man = ObservationManager(cfg, self.env)
+
+        for _ in range(3):
+            # compute observation using manager
+            observations = self.obs_man.compute()
+            # check that the observations are the same in both modes
+            self.assertEqual((self.env.num_envs, 11), observations["policy_buffer"].shape)
+            torch.testing.assert_close(observations["policy"], observations["policy_buffer"])
+            # change the data
+            self.env.data.pos_w[:] = torch.rand_like(self.env.data.pos_w)
+
+        # check that the term data is not modified in place
+        torch.testing.assert_close(self.env.data.lin_vel_w * 1.5 + 0.75, observations["policy_buffer"][:, 8:11])
+        # check that the same buffer is reused
+        self.assertEqual(
+            observations["policy_buffer"].data_ptr(), self.obs_man.compute_group("policy_buffer").data_ptr()
+        )
+
+    def test_compute_with_group_buffer_noise(self):
+        """Test the vectorized noise with a persistent group buffer."""
+
+        @configclass
+        class MyObservationManagerCfg:
+            """Test config class for observation manager."""
+
+            @configclass
+            class PolicyCfg(ObservationGroupCfg):
+                """Test config class for policy observation group."""
+
+                use_group_buffer = True
+                enable_corruption = True
+
+                term_1 = ObservationTermCfg(func=grilled_chicken, noise=noise.UniformNoiseCfg(n_min=0.1, n_max=0.2))
+                term_2 = ObservationTermCfg(func=pos_w_data)
+                term_3 = ObservationTermCfg(
+                    func=lin_vel_w_data, noise=noise.GaussianNoiseCfg(mean=0.0, std=1.0), clip=(-1.0, 1.0)
+                )
+
+            policy: ObservationGroupCfg = PolicyCfg()
+
+        # create observation manager
+        cfg = MyObservationManagerCfg()
+        self.obs_man = ObservationManager(cfg, self.env)
+        # compute observation using manager
+        obs_policy = self.obs_man.compute_group("policy")
+
+        # check that the noise is applied only to the respective terms
+        self.assertTrue(torch.all(obs_policy[:, :4] >= 1.1) and torch.all(obs_policy[:, :4] <= 1.2))
+        torch.testing.assert_close(obs_policy[:, 4:7], self.env.data.pos_w)
+        self.assertTrue(torch.all(obs_policy[:, 7:10].abs() <= 1.0))
+
+    def test_invalid_group_buffer_config(self):
+        """Test that the persistent group buffer requires concatenated terms."""
+
+        @configclass
+        class MyObservationManagerCfg:
+            """Test config class for observation manager."""
+
+            @configclass
+            class PolicyCfg(ObservationGroupCfg):
+                """Test config class for policy observation group."""
+
+                concatenate_terms = False
+                use_group_buffer = True
+
+                term_1 = ObservationTermCfg(func=grilled_chicken)
+
+            policy: ObservationGroupCfg = PolicyCfg()
+
+        # create observation manager
+        cfg = MyObservationManagerCfg()
+        # check the invalid config
+        with self.assertRaises(ValueError):
+            self.obs_man = ObservationManager(cfg, self.env)
+
     def test_invalid_observation_config(self):
         """Test the invalid observation config."""
 
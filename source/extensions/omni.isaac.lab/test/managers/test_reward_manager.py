@@ -124,6 +124,35 @@ class TestRewardManager(unittest.TestCase):
         self.assertEqual(float(rewards[0]), expected_reward)
         self.assertEqual(tuple(rewards.shape), (self.env.num_envs,))
 
+    def test_compute_episode_sums(self):
+        """Test the accumulation of the episodic sums and their reset."""
+        env = namedtuple("ManagerBasedRLEnv", ["num_envs", "dt", "device", "max_episode_length_s"])(20, 0.1, "cpu", 2.0)
+        cfg = {
+            "term_1": RewardTermCfg(func=grilled_chicken, weight=10),
+            "term_2": RewardTermCfg(func=grilled_chicken_with_curry, weight=0.0, params={"hot": False}),
+            "term_3": RewardTermCfg(func=grilled_chicken, weight=-2.0),
+        }
+        self.rew_man = RewardManager(cfg, env)
+        # compute reward using manager
+        for _ in range(5):
+            rewards = self.rew_man.compute(dt=env.dt)
+        torch.testing.assert_close(rewards, torch.full((env.num_envs,), 0.8))
+        # change the weight of a term
+        term_cfg = self.rew_man.get_term_cfg("term_3")
+        term_cfg.weight = 0.0
+        self.rew_man.set_term_cfg("term_3", term_cfg)
+        rewards = self.rew_man.compute(dt=env.dt)
+        torch.testing.assert_close(rewards, torch.full((env.num_envs,), 1.0))
+
+        # reset some of the environments
+        extras = self.rew_man.reset(env_ids=[0, 1, 2])
+        self.assertAlmostEqual(float(extras["Episode_Reward/term_1"]), 6.0 / env.max_episode_length_s, places=5)
+        self.assertAlmostEqual(float(extras["Episode_Reward/term_2"]), 0.0)
+        self.assertAlmostEqual(float(extras["Episode_Reward/term_3"]), -1.0 / env.max_episode_length_s, places=5)
+        # check that only the reset environments are cleared
+        torch.testing.assert_close(self.rew_man._episode_sums["term_1"][:3], torch.zeros(3))
+        torch.testing.assert_close(self.rew_man._episode_sums["term_1"][3:], torch.full((env.num_envs - 3,), 6.0))
+
     def test_config_empty(self):
         """Test the creation of reward manager with empty config."""
         self.rew_man = RewardManager(None, self.env)
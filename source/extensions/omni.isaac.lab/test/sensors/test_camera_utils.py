@@ -0,0 +1,112 @@
+# Copyright (c) 2022-2024, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Launch Isaac Sim Simulator first."""
+
+from omni.isaac.lab.app import AppLauncher, run_tests
+
+# launch omniverse app
+simulation_app = AppLauncher(headless=True).app
+
+"""Rest everything follows."""
+
+import torch
+import unittest
+
+import omni.isaac.lab.utils.math as math_utils
+from omni.isaac.lab.sensors.camera.utils import (
+    create_pixel_rays,
+    create_pointcloud_from_depth,
+    create_pointclouds_from_depth,
+)
+
+
+class TestCameraUtils(unittest.TestCase):
+    """Test for the batched depth unprojection of the camera utilities."""
+
+    def setUp(self):
+        """Create random depth images and camera parameters."""
+        self.num_cameras, self.height, self.width = 4, 6, 8
+        generator = torch.Generator().manual_seed(0)
+        # intrinsics with different focal lengths and principal points
+        self.intrinsic_matrices = torch.zeros(self.num_cameras, 3, 3)
+        self.intrinsic_matrices[:, 0, 0] = 5.0 + 5.0 * torch.rand(self.num_cameras, generator=generator)
+        self.intrinsic_matrices[:, 1, 1] = 5.0 + 5.0 * torch.rand(self.num_cameras, generator=generator)
+        self.intrinsic_matrices[:, 0, 2] = self.width / 2
+        self.intrinsic_matrices[:, 1, 2] = self.height / 2
+        self.intrinsic_matrices[:, 2, 2] = 1.0
+        # poses of the cameras
+        self.position = torch.randn(self.num_cameras, 3, generator=generator)
+        self.orientation = math_utils.random_orientation(self.num_cameras, device="cpu")
+        # depth images with invalid values
+        self.depth = 0.5 + 4.0 * torch.rand(self.num_cameras, self.height, self.width, generator=generator)
+        self.depth[0, 0, 0] = 0.0
+        self.depth[1, 2, 3] = float("inf")
+        self.depth[2, 4, 5] = float("nan")
+        self.depth[3, 5, 7] = 4.4
+
+    """
+    Tests
+    """
+
+    def test_pointclouds_from_depth(self):
+        """Test that the batched pointclouds match the pointclouds of the individual cameras."""
+        points, valid_mask = create_pointclouds_from_depth(
+            self.intrinsic_matrices, self.depth, self.position, self.orientation, max_depth=4.0
+        )
+        self.assertEqual(points.shape, (self.num_cameras, self.height * self.width, 3))
+        self.assertEqual(valid_mask.shape, (self.num_cameras, self.height * self.width))
+
+        for index in range(self.num_cameras):
+            expected_points = create_pointcloud_from_depth(
+                self.intrinsic_matrices[index],
+                self.depth[index],
+                keep_invalid=True,
+                position=self.position[index],
+                orientation=self.orientation[index],
+            )
+            # convert the points from column-major to row-major order of the pixels
+            expected_points = expected_points.view(self.width, self.height, 3).transpose(0, 1).reshape(-1, 3)
+            expected_valid_mask = torch.isfinite(self.depth[index].view(-1)) & (self.depth[index].view(-1) > 0.0)
+            expected_valid_mask &= self.depth[index].view(-1) <= 4.0
+            # check the points
+            torch.testing.assert_close(valid_mask[index], expected_valid_mask)
+            torch.testing.assert_close(points[index][valid_mask[index]], expected_points[expected_valid_mask])
+            self.assertTrue(torch.all(points[index][~valid_mask[index]] == 0.0))
+
+    def test_perspective_depth(self):
+        """Test that perspective depth images are unprojected with normalized rays."""
+        # compute the orthogonal depth images
+        depth = self.depth.nan_to_num(posinf=1.0).clamp(min=0.5)
+        orthogonal_depth = math_utils.orthogonalize_perspective_depth(depth, self.intrinsic_matrices)
+        # unproject both depth images
+        points, _ = create_pointclouds_from_depth(self.intrinsic_matrices, depth, is_ortho=False)
+        expected_points, _ = create_pointclouds_from_depth(self.intrinsic_matrices, orthogonal_depth)
+        torch.testing.assert_close(points, expected_points)
+        # check the distance of the points to the cameras
+        torch.testing.assert_close(torch.norm(points, dim=-1), depth.view(self.num_cameras, -1))
+
+    def test_cached_pixel_rays(self):
+        """Test that the pointclouds computed with precomputed rays match."""
+        pixel_rays = create_pixel_rays(self.intrinsic_matrices, self.height, self.width)
+        # check the unit z-component of the rays
+        torch.testing.assert_close(pixel_rays[..., 2], torch.ones(self.num_cameras, self.height * self.width))
+        # compute the pointclouds with and without the rays
+        points, valid_mask = create_pointclouds_from_depth(
+            self.intrinsic_matrices, self.depth.unsqueeze(-1), pixel_rays=pixel_rays
+        )
+        expected_points, expected_valid_mask = create_pointclouds_from_depth(self.intrinsic_matrices, self.depth)
+        torch.testing.assert_close(points, expected_points)
+        torch.testing.assert_close(valid_mask, expected_valid_mask)
+        # check that the rays are cached per intrinsics
+        self.assertIs(create_pixel_rays(self.intrinsic_matrices.clone(), self.height, self.width), pixel_rays)
+        self.assertIsNot(create_pixel_rays(self.intrinsic_matrices * 2.0, self.height, self.width), pixel_rays)
+        self.assertIsNot(
+            create_pixel_rays(self.intrinsic_matrices, self.height, self.width, is_ortho=False), pixel_rays
+        )
+
+
+if __name__ == "__main__":
+    run_tests()
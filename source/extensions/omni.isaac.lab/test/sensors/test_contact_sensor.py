@@ -27,6 +27,7 @@ from omni.isaac.lab.sensors import ContactSensor, ContactSensorCfg
 from omni.isaac.lab.sim import build_simulation_context
 from omni.isaac.lab.terrains import HfRandomUniformTerrainCfg, TerrainGeneratorCfg, TerrainImporterCfg
 from omni.isaac.lab.utils import configclass
+from omni.isaac.lab.utils.warp import update_contact_time
 
 ##
 # Custom helper classes.
@@ -315,10 +316,132 @@ class TestContactSensor(unittest.TestCase):
             # print info
             print(scene.sensors["contact_sensor"])
 
+    def test_net_forces_history(self):
+        """Checks that the history of the net forces matches a shifted history of the reported forces."""
+        num_envs, history_length = 4, 3
+        for device in self.devices:
+            with self.subTest(device=device):
+                with build_simulation_context(device=device, dt=self.sim_dt, add_lighting=False) as sim:
+                    # Spawn things into stage
+                    scene_cfg = ContactSensorSceneCfg(num_envs=num_envs, env_spacing=1.0, lazy_sensor_update=False)
+                    scene_cfg.terrain = FLAT_TERRAIN_CFG.replace(prim_path="/World/ground")
+                    scene_cfg.shape = CUBE_CFG.replace(prim_path="{ENV_REGEX_NS}/Cube")
+                    scene_cfg.shape.init_state.pos = (0.0, 0.0, 0.3)
+                    # -- contact sensor with history
+                    scene_cfg.contact_sensor = ContactSensorCfg(
+                        prim_path="{ENV_REGEX_NS}/Cube", update_period=0.0, history_length=history_length
+                    )
+                    # -- contact sensor without history
+                    scene_cfg.contact_sensor_2 = ContactSensorCfg(
+                        prim_path="{ENV_REGEX_NS}/Cube", update_period=0.0, history_length=0
+                    )
+                    scene = InteractiveScene(scene_cfg)
+
+                    # Set variables internally for reference
+                    self.sim = sim
+                    self.scene = scene
+
+                    # Play the simulation
+                    self.sim.reset()
+
+                    # Extract from scene for type hinting
+                    contact_sensor: ContactSensor = self.scene["contact_sensor"]
+                    contact_sensor_2: ContactSensor = self.scene["contact_sensor_2"]
+                    # reference history which is shifted at every update
+                    expected_history = torch.zeros_like(contact_sensor.data.net_forces_w_history)
+                    partial_env_ids = torch.tensor([0, 2], device=device)
+
+                    # let the cubes fall onto the ground
+                    for step in range(60):
+                        # reset a subset of the environments
+                        if step == 30:
+                            contact_sensor.reset([1, 3])
+                            expected_history[[1, 3]] = 0.0
+                        # -- update all the environments
+                        self._perform_sim_step()
+                        expected_history[:, 1:] = expected_history[:, :-1].clone()
+                        expected_history[:, 0] = contact_sensor.data.net_forces_w
+                        # -- update a subset of the environments
+                        if step % 5 == 0:
+                            contact_sensor._update_buffers_impl(partial_env_ids)
+                            expected_history[partial_env_ids, 1:] = expected_history[partial_env_ids, :-1].clone()
+                            expected_history[partial_env_ids, 0] = contact_sensor.data.net_forces_w[partial_env_ids]
+
+                        # check the ordered history and the order-independent maximum
+                        torch.testing.assert_close(contact_sensor.data.net_forces_w_history, expected_history)
+                        torch.testing.assert_close(
+                            contact_sensor.data.net_forces_w_history_buffer.norm(dim=-1).max(dim=1)[0],
+                            expected_history.norm(dim=-1).max(dim=1)[0],
+                        )
+                        # check the history of the sensor without history
+                        torch.testing.assert_close(
+                            contact_sensor_2.data.net_forces_w_history, contact_sensor_2.data.net_forces_w.unsqueeze(1)
+                        )
+                    # check that the cubes are in contact with the ground
+                    self.assertTrue(torch.all(contact_sensor.data.net_forces_w_history.norm(dim=-1).amax(dim=1) > 0))
+
+    def test_contact_time_kernel(self):
+        """Checks that the fused update of the air and contact times matches the torch implementation."""
+        num_envs, num_bodies, force_threshold = 64, 4, 1.0
+        for device in self.devices:
+            with self.subTest(device=device):
+                # time buffers: current air, last air, current contact, last contact
+                times = [torch.zeros(num_envs, num_bodies, device=device) for _ in range(4)]
+                expected_times = [torch.zeros(num_envs, num_bodies, device=device) for _ in range(4)]
+                for _ in range(50):
+                    # random contact forces away from the threshold and a random subset of environments
+                    net_forces_w = torch.randn(num_envs, num_bodies, 3, device=device)
+                    net_forces_w *= torch.where(torch.rand(num_envs, num_bodies, 1, device=device) > 0.5, 0.1, 10.0)
+                    elapsed_time = torch.rand(num_envs, device=device) * 0.02
+                    env_ids = torch.randperm(num_envs, device=device)[: num_envs // 2]
+                    # -- fused kernel
+                    update_contact_time(net_forces_w, elapsed_time, force_threshold, *times, env_ids=env_ids)
+                    # -- torch implementation
+                    self._update_contact_time_torch(
+                        net_forces_w, elapsed_time, force_threshold, *expected_times, env_ids=env_ids
+                    )
+                    # check that the buffers are equal
+                    for time, expected_time in zip(times, expected_times):
+                        torch.testing.assert_close(time, expected_time)
+
     """
     Internal helpers.
     """
 
+    @staticmethod
+    def _update_contact_time_torch(
+        net_forces_w: torch.Tensor,
+        elapsed_time: torch.Tensor,
+        force_threshold: float,
+        current_air_time: torch.Tensor,
+        last_air_time: torch.Tensor,
+        current_contact_time: torch.Tensor,
+        last_contact_time: torch.Tensor,
+        env_ids: torch.Tensor,
+    ):
+        """Reference torch implementation of the update of the air and contact times."""
+        elapsed_time = elapsed_time[env_ids]
+        # -- check contact state of bodies
+        is_contact = torch.norm(net_forces_w[env_ids, :, :], dim=-1) > force_threshold
+        is_first_contact = (current_air_time[env_ids] > 0) * is_contact
+        is_first_detached = (current_contact_time[env_ids] > 0) * ~is_contact
+        # -- update the last contact time if body has just become in contact
+        last_air_time[env_ids] = torch.where(
+            is_first_contact, current_air_time[env_ids] + elapsed_time.unsqueeze(-1), last_air_time[env_ids]
+        )
+        # -- increment time for bodies that are not in contact
+        current_air_time[env_ids] = torch.where(
+            ~is_contact, current_air_time[env_ids] + elapsed_time.unsqueeze(-1), 0.0
+        )
+        # -- update the last contact time if body has just detached
+        last_contact_time[env_ids] = torch.where(
+            is_first_detached, current_contact_time[env_ids] + elapsed_time.unsqueeze(-1), last_contact_time[env_ids]
+        )
+        # -- increment time for bodies that are in contact
+        current_contact_time[env_ids] = torch.where(
+            is_contact, current_contact_time[env_ids] + elapsed_time.unsqueeze(-1), 0.0
+        )
+
     def _run_contact_sensor_test(self, shape_cfg: TestContactSensorRigidObjectCfg):
         """Runs a rigid body test for a given contact primitive configuration.
 
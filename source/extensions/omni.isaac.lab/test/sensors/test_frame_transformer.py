@@ -19,6 +19,7 @@ import torch
 import unittest
 
 import omni.isaac.core.utils.stage as stage_utils
+import warp as wp
 
 import omni.isaac.lab.sim as sim_utils
 import omni.isaac.lab.utils.math as math_utils
@@ -27,6 +28,7 @@ from omni.isaac.lab.scene import InteractiveScene, InteractiveSceneCfg
 from omni.isaac.lab.sensors import FrameTransformerCfg, OffsetCfg
 from omni.isaac.lab.terrains import TerrainImporterCfg
 from omni.isaac.lab.utils import configclass
+from omni.isaac.lab.utils.warp.kernels import frame_transformer_kernel
 
 ##
 # Pre-defined configs
@@ -579,6 +581,99 @@ class TestFrameTransformer(unittest.TestCase):
                 torch.testing.assert_close(bodies_pos_source_tf[:, index], body_pos_b)
                 torch.testing.assert_close(bodies_quat_source_tf[:, index], body_quat_b)
 
+    def test_frame_transformer_kernel(self):
+        """Test the kernel computing the frame transforms against the torch math functions."""
+        num_envs, num_bodies, num_frames, device = 16, 4, 3, "cpu"
+        # synthetic body transforms in the PhysX layout (x, y, z, qx, qy, qz, qw)
+        transforms = torch.cat(
+            [
+                torch.randn(num_envs * num_bodies, 3, device=device),
+                math_utils.convert_quat(math_utils.random_orientation(num_envs * num_bodies, device), to="xyzw"),
+            ],
+            dim=-1,
+        )
+        # random assignment of bodies to the frames
+        source_ids = torch.randint(0, num_envs * num_bodies, (num_envs,), dtype=torch.int32, device=device)
+        target_ids = torch.randint(0, num_envs * num_bodies, (num_envs, num_frames), dtype=torch.int32, device=device)
+        # random offsets
+        source_offset_pos = torch.randn(3, device=device)
+        source_offset_quat = math_utils.random_orientation(1, device)[0]
+        target_offset_pos = torch.randn(num_frames, 3, device=device)
+        target_offset_quat = math_utils.random_orientation(num_frames, device)
+        target_offsets = torch.cat([target_offset_pos, math_utils.convert_quat(target_offset_quat, to="xyzw")], dim=-1)
+        # update only a subset of the environments
+        env_ids = torch.arange(0, num_envs, 2, dtype=torch.int32, device=device)
+
+        # compute the frame transforms with the kernel
+        outputs = {
+            "source_pos_w": torch.zeros(num_envs, 3, device=device),
+            "source_quat_w": torch.zeros(num_envs, 4, device=device),
+            "target_pos_w": torch.zeros(num_envs, num_frames, 3, device=device),
+            "target_quat_w": torch.zeros(num_envs, num_frames, 4, device=device),
+            "target_pos_source": torch.zeros(num_envs, num_frames, 3, device=device),
+            "target_quat_source": torch.zeros(num_envs, num_frames, 4, device=device),
+        }
+        wp.launch(
+            kernel=frame_transformer_kernel,
+            dim=(len(env_ids), num_frames),
+            inputs=[
+                wp.from_torch(env_ids),
+                wp.from_torch(transforms, dtype=wp.transformf),
+                wp.from_torch(source_ids),
+                wp.from_torch(target_ids),
+                wp.transformf(
+                    wp.vec3(*source_offset_pos.tolist()),
+                    wp.quatf(*math_utils.convert_quat(source_offset_quat, to="xyzw").tolist()),
+                ),
+                wp.from_torch(target_offsets, dtype=wp.transformf),
+                1,
+                1,
+                *[wp.from_torch(value, dtype=wp.vec3 if "pos" in key else wp.vec4) for key, value in outputs.items()],
+            ],
+            device=device,
+        )
+
+        # compute the frame transforms with torch
+        env_ids = env_ids.long()
+        poses = transforms.clone()
+        poses[:, 3:] = math_utils.convert_quat(poses[:, 3:], to="wxyz")
+        source_poses = poses[source_ids[env_ids].long()]
+        source_pos_w, source_quat_w = math_utils.combine_frame_transforms(
+            source_poses[:, :3],
+            source_poses[:, 3:],
+            source_offset_pos.expand(len(env_ids), 3),
+            source_offset_quat.expand(len(env_ids), 4),
+        )
+        target_poses = poses[target_ids[env_ids].long()].view(-1, 7)
+        target_pos_w, target_quat_w = math_utils.combine_frame_transforms(
+            target_poses[:, :3],
+            target_poses[:, 3:],
+            target_offset_pos.repeat(len(env_ids), 1),
+            target_offset_quat.repeat(len(env_ids), 1),
+        )
+        target_pos_source, target_quat_source = math_utils.subtract_frame_transforms(
+            source_pos_w.repeat_interleave(num_frames, dim=0),
+            source_quat_w.repeat_interleave(num_frames, dim=0),
+            target_pos_w,
+            target_quat_w,
+        )
+        expected_outputs = {
+            "source_pos_w": source_pos_w,
+            "source_quat_w": source_quat_w,
+            "target_pos_w": target_pos_w.view(-1, num_frames, 3),
+            "target_quat_w": target_quat_w.view(-1, num_frames, 4),
+            "target_pos_source": target_pos_source.view(-1, num_frames, 3),
+            "target_quat_source": target_quat_source.view(-1, num_frames, 4),
+        }
+
+        # check the updated environments
+        for key, value in outputs.items():
+            torch.testing.assert_close(value[env_ids], expected_outputs[key], rtol=1e-5, atol=1e-5, msg=key)
+        # check that the other environments are not updated
+        other_env_ids = torch.arange(1, num_envs, 2, device=device)
+        for value in outputs.values():
+            self.assertTrue(torch.all(value[other_env_ids] == 0.0))
+
     def test_sensor_print(self):
         """Test sensor print is working correctly."""
         # Spawn things into stage
@@ -18,6 +18,7 @@ import torch
 import unittest
 
 import omni.isaac.core.utils.stage as stage_utils
+import warp as wp
 
 import omni.isaac.lab.sim as sim_utils
 import omni.isaac.lab.utils.math as math_utils
@@ -28,6 +29,7 @@ from omni.isaac.lab.scene import InteractiveScene, InteractiveSceneCfg
 from omni.isaac.lab.sensors.imu import ImuCfg
 from omni.isaac.lab.terrains import TerrainImporterCfg
 from omni.isaac.lab.utils import configclass
+from omni.isaac.lab.utils.warp.kernels import imu_kernel
 
 ##
 # Pre-defined configs
@@ -526,6 +528,105 @@ class TestImu(unittest.TestCase):
         # read data from sim
         self.scene.update(self.sim.get_physics_dt())
 
+    def test_imu_kernel(self):
+        """Test the kernel computing the IMU outputs against the torch math functions."""
+        num_envs, dt, device = 16, 0.01, "cpu"
+        # synthetic offsets and gravity in the PhysX layout (x, y, z, qx, qy, qz, qw)
+        offset_pos = torch.randn(num_envs, 3, device=device)
+        offset_quat = math_utils.random_orientation(num_envs, device)
+        offsets = torch.cat([offset_pos, math_utils.convert_quat(offset_quat, to="xyzw")], dim=-1)
+        coms = torch.cat([torch.randn(num_envs, 3, device=device), torch.zeros(num_envs, 4, device=device)], dim=-1)
+        coms[:, 6] = 1.0
+        gravity_bias_w = torch.randn(num_envs, 3, device=device)
+        gravity_dir_w = torch.tensor([0.0, 0.0, -1.0], device=device)
+        # update only a subset of the environments
+        env_ids = torch.arange(0, num_envs, 2, dtype=torch.int32, device=device)
+
+        # buffers of the kernel and the torch implementation
+        outputs = {
+            "pos_w": torch.zeros(num_envs, 3, device=device),
+            "quat_w": torch.zeros(num_envs, 4, device=device),
+            "lin_vel_b": torch.zeros(num_envs, 3, device=device),
+            "ang_vel_b": torch.zeros(num_envs, 3, device=device),
+            "lin_acc_b": torch.zeros(num_envs, 3, device=device),
+            "ang_acc_b": torch.zeros(num_envs, 3, device=device),
+            "projected_gravity_b": torch.zeros(num_envs, 3, device=device),
+        }
+        prev_lin_vel_w = torch.zeros(num_envs, 3, device=device)
+        prev_ang_vel_w = torch.zeros(num_envs, 3, device=device)
+        expected_prev_lin_vel_w = torch.zeros(num_envs, 3, device=device)
+        expected_prev_ang_vel_w = torch.zeros(num_envs, 3, device=device)
+
+        # check two updates to cover the finite differencing
+        for _ in range(2):
+            # synthetic body states
+            transforms = torch.cat(
+                [
+                    torch.randn(num_envs, 3, device=device),
+                    math_utils.convert_quat(math_utils.random_orientation(num_envs, device), to="xyzw"),
+                ],
+                dim=-1,
+            )
+            velocities = torch.randn(num_envs, 6, device=device)
+
+            # compute the outputs with the kernel
+            wp.launch(
+                kernel=imu_kernel,
+                dim=len(env_ids),
+                inputs=[
+                    wp.from_torch(env_ids),
+                    wp.from_torch(transforms, dtype=wp.transformf),
+                    wp.from_torch(velocities.view(-1, 2, 3), dtype=wp.vec3),
+                    wp.from_torch(coms, dtype=wp.transformf),
+                    wp.from_torch(offsets, dtype=wp.transformf),
+                    wp.from_torch(gravity_bias_w, dtype=wp.vec3),
+                    wp.vec3(*gravity_dir_w.tolist()),
+                    dt,
+                    wp.from_torch(prev_lin_vel_w, dtype=wp.vec3),
+                    wp.from_torch(prev_ang_vel_w, dtype=wp.vec3),
+                    *[
+                        wp.from_torch(value, dtype=wp.vec4 if "quat" in key else wp.vec3)
+                        for key, value in outputs.items()
+                    ],
+                ],
+                device=device,
+            )
+
+            # compute the outputs with torch
+            ids = env_ids.long()
+            body_pos_w = transforms[ids, :3]
+            body_quat_w = math_utils.convert_quat(transforms[ids, 3:], to="wxyz")
+            pos_w, quat_w = math_utils.combine_frame_transforms(
+                body_pos_w, body_quat_w, offset_pos[ids], offset_quat[ids]
+            )
+            lin_vel_w, ang_vel_w = velocities[ids].split([3, 3], dim=-1)
+            lin_vel_w = lin_vel_w + torch.linalg.cross(
+                ang_vel_w, math_utils.quat_rotate(body_quat_w, offset_pos[ids] - coms[ids, :3]), dim=-1
+            )
+            lin_acc_w = (lin_vel_w - expected_prev_lin_vel_w[ids]) / dt + gravity_bias_w[ids]
+            ang_acc_w = (ang_vel_w - expected_prev_ang_vel_w[ids]) / dt
+            expected_outputs = {
+                "pos_w": pos_w,
+                "quat_w": quat_w,
+                "lin_vel_b": math_utils.quat_rotate_inverse(quat_w, lin_vel_w),
+                "ang_vel_b": math_utils.quat_rotate_inverse(quat_w, ang_vel_w),
+                "lin_acc_b": math_utils.quat_rotate_inverse(quat_w, lin_acc_w),
+                "ang_acc_b": math_utils.quat_rotate_inverse(quat_w, ang_acc_w),
+                "projected_gravity_b": math_utils.quat_rotate_inverse(quat_w, gravity_dir_w.expand(len(ids), 3)),
+            }
+            expected_prev_lin_vel_w[ids] = lin_vel_w
+            expected_prev_ang_vel_w[ids] = ang_vel_w
+
+            # check the updated environments
+            for key, value in outputs.items():
+                torch.testing.assert_close(value[ids], expected_outputs[key], rtol=1e-4, atol=1e-3, msg=key)
+            torch.testing.assert_close(prev_lin_vel_w, expected_prev_lin_vel_w, rtol=1e-5, atol=1e-5)
+            torch.testing.assert_close(prev_ang_vel_w, expected_prev_ang_vel_w, rtol=1e-5, atol=1e-5)
+        # check that the other environments are not updated
+        other_env_ids = torch.arange(1, num_envs, 2, device=device)
+        for value in outputs.values():
+            self.assertTrue(torch.all(value[other_env_ids] == 0.0))
+
     def test_sensor_print(self):
         """Test sensor print is working correctly."""
         # Create sensor
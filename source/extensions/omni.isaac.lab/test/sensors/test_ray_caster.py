@@ -0,0 +1,155 @@
+# Copyright (c) 2022-2024, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+# ignore private usage of variables warning
+# pyright: reportPrivateUsage=none
+
+"""Launch Isaac Sim Simulator first."""
+
+from omni.isaac.lab.app import AppLauncher, run_tests
+
+# launch omniverse app
+simulation_app = AppLauncher(headless=True).app
+
+"""Rest everything follows."""
+
+import torch
+import unittest
+
+import omni.isaac.core.utils.prims as prim_utils
+import omni.isaac.core.utils.stage as stage_utils
+from omni.isaac.core.prims import XFormPrimView
+
+import omni.isaac.lab.sim as sim_utils
+from omni.isaac.lab.sensors.ray_caster import RayCaster, RayCasterCfg, patterns
+from omni.isaac.lab.terrains.trimesh.utils import make_plane
+from omni.isaac.lab.terrains.utils import create_prim_from_mesh
+from omni.isaac.lab.utils.math import quat_apply, quat_apply_yaw, quat_from_euler_xyz
+from omni.isaac.lab.utils.warp import raycast_mesh
+
+
+class TestRayCaster(unittest.TestCase):
+    """Test for the ray-caster sensor with multiple meshes."""
+
+    """
+    Test Setup and Teardown
+    """
+
+    def setUp(self):
+        """Create a blank new stage for each test."""
+        self.ray_caster_cfg = RayCasterCfg(
+            prim_path="/World/Sensor",
+            mesh_prim_paths=["/World/defaultGroundPlane", "/World/Box"],
+            update_period=0,
+            offset=RayCasterCfg.OffsetCfg(pos=(0.0, 0.0, 5.0)),
+            attach_yaw_only=True,
+            pattern_cfg=patterns.GridPatternCfg(resolution=0.4, size=(4.0, 4.0)),
+            track_mesh_ids=True,
+            debug_vis=False,
+        )
+        # Create a new stage
+        stage_utils.create_new_stage()
+        # create xform because placement of sensor directly under world is not supported
+        prim_utils.create_prim("/World/Sensor", "Xform")
+        # Simulation time-step
+        self.dt = 0.01
+        # Load kit helper
+        sim_cfg = sim_utils.SimulationCfg(dt=self.dt)
+        self.sim: sim_utils.SimulationContext = sim_utils.SimulationContext(sim_cfg)
+        # Ground-plane
+        mesh = make_plane(size=(100, 100), height=0.0, center_zero=True)
+        create_prim_from_mesh("/World/defaultGroundPlane", mesh)
+        # Box of unit size on the ground
+        box_cfg = sim_utils.MeshCuboidCfg(size=(1.0, 1.0, 1.0))
+        box_cfg.func("/World/Box", box_cfg, translation=(0.0, 0.0, 0.5))
+        # load stage
+        stage_utils.update_stage()
+
+    def tearDown(self):
+        """Stops simulator after each test."""
+        # stop simulation
+        self.sim.stop()
+        # clear the stage
+        self.sim.clear_all_callbacks()
+        self.sim.clear_instance()
+
+    """
+    Tests
+    """
+
+    def test_multi_mesh(self):
+        """Test that the rays hit the closest of the merged meshes and report its index."""
+        ray_caster = RayCaster(cfg=self.ray_caster_cfg)
+        # play sim
+        self.sim.reset()
+        self.sim.step()
+        ray_caster.update(self.dt)
+
+        # check the hits against the expected heights
+        ray_hits_w = ray_caster.data.ray_hits_w[0]
+        on_box = torch.all(torch.abs(ray_hits_w[:, :2]) < 0.5, dim=-1)
+        self.assertTrue(torch.any(on_box))
+        torch.testing.assert_close(ray_hits_w[:, 2], on_box.float(), atol=1e-4, rtol=0.0)
+        # check the mesh ids
+        torch.testing.assert_close(ray_caster.data.ray_mesh_ids[0], on_box.int())
+
+    def test_dynamic_mesh(self):
+        """Test that the rays follow a dynamic mesh after it is moved."""
+        ray_caster = RayCaster(cfg=self.ray_caster_cfg.replace(dynamic_mesh_prim_paths=["/World/Box"]))
+        box_view = XFormPrimView("/World/Box", reset_xform_properties=False)
+        # play sim
+        self.sim.reset()
+        self.sim.step()
+
+        # move the box along the x-axis
+        box_view.set_world_poses(positions=torch.tensor([[1.0, 0.0, 0.5]], device=self.sim.device))
+        self.sim.step()
+        ray_caster.update(self.dt, force_recompute=True)
+
+        # check the hits against the expected heights
+        ray_hits_w = ray_caster.data.ray_hits_w[0]
+        on_box = (torch.abs(ray_hits_w[:, 0] - 1.0) < 0.5) & (torch.abs(ray_hits_w[:, 1]) < 0.5)
+        self.assertTrue(torch.any(on_box))
+        torch.testing.assert_close(ray_hits_w[:, 2], on_box.float(), atol=1e-4, rtol=0.0)
+        torch.testing.assert_close(ray_caster.data.ray_mesh_ids[0], on_box.int())
+
+    def test_sensor_pose(self):
+        """Test that the fused ray-casting matches ray-casting the rays transformed with torch."""
+        for attach_yaw_only in [True, False]:
+            with self.subTest(attach_yaw_only=attach_yaw_only):
+                ray_caster = RayCaster(cfg=self.ray_caster_cfg.replace(attach_yaw_only=attach_yaw_only))
+                sensor_view = XFormPrimView("/World/Sensor", reset_xform_properties=False)
+                # play sim
+                self.sim.reset()
+                # rotate and move the sensor
+                quat = quat_from_euler_xyz(torch.tensor([0.2]), torch.tensor([-0.3]), torch.tensor([0.7])).to(
+                    self.sim.device
+                )
+                sensor_view.set_world_poses(
+                    positions=torch.tensor([[0.3, -0.2, 0.5]], device=self.sim.device), orientations=quat
+                )
+                self.sim.step()
+                ray_caster.update(self.dt, force_recompute=True)
+
+                # compute the hits with torch transforms and the ray-casting function
+                pos_w, quat_w = ray_caster.data.pos_w, ray_caster.data.quat_w
+                quat_w = quat_w.repeat(1, ray_caster.num_rays)
+                if attach_yaw_only:
+                    ray_starts_w = quat_apply_yaw(quat_w, ray_caster.ray_starts) + pos_w.unsqueeze(1)
+                    ray_directions_w = ray_caster.ray_directions
+                else:
+                    ray_starts_w = quat_apply(quat_w, ray_caster.ray_starts) + pos_w.unsqueeze(1)
+                    ray_directions_w = quat_apply(quat_w, ray_caster.ray_directions)
+                ray_hits_w = raycast_mesh(
+                    ray_starts_w, ray_directions_w, mesh=ray_caster.meshes["/World/Box"], max_dist=1e6
+                )[0]
+                # check that the hits match
+                torch.testing.assert_close(ray_caster.data.ray_hits_w, ray_hits_w, atol=1e-4, rtol=1e-5)
+                # stop the simulation for the next iteration
+                self.sim.stop()
+
+
+if __name__ == "__main__":
+    run_tests()
@@ -354,6 +354,54 @@ class TestWarpCamera(unittest.TestCase):
             # Check that matrix is correct
             torch.testing.assert_close(rs_intrinsic_matrix, camera.data.intrinsic_matrices)
 
+    def test_set_intrinsic_matrices(self):
+        """Checks that the rays of the cameras are updated for shared and distinct intrinsic matrices."""
+        num_cameras = 3
+        for i in range(num_cameras):
+            prim_utils.create_prim(f"/World/Origin_{i}/CameraSensor", "Xform")
+        camera_cfg = copy.deepcopy(self.camera_cfg)
+        camera_cfg.prim_path = "/World/Origin_.*/CameraSensor"
+        camera_cfg.pattern_cfg.height = 12
+        camera_cfg.pattern_cfg.width = 16
+        camera = RayCasterCamera(camera_cfg)
+        # play sim
+        self.sim.reset()
+        # intrinsic matrices with different focal lengths
+        intrinsic_matrices = torch.tensor(
+            [[[20.0 + 5.0 * i, 0.0, 8.0], [0.0, 20.0 + 5.0 * i, 6.0], [0.0, 0.0, 1.0]] for i in range(num_cameras)],
+            device=camera.device,
+        )
+
+        # -- shared intrinsics
+        camera.set_intrinsic_matrices(intrinsic_matrices[[0, 0, 0]])
+        # check that the rays are stored once
+        self.assertEqual(camera._ray_directions.shape[0], 1)
+        expected_ray_starts, expected_ray_directions = patterns.pinhole_camera_pattern(
+            camera_cfg.pattern_cfg, intrinsic_matrices[[0, 0, 0]], camera.device
+        )
+        torch.testing.assert_close(camera.ray_starts, expected_ray_starts)
+        torch.testing.assert_close(camera.ray_directions, expected_ray_directions)
+
+        # -- distinct intrinsics
+        camera.set_intrinsic_matrices(intrinsic_matrices)
+        # check that the rays are stored per camera
+        self.assertEqual(camera._ray_directions.shape[0], num_cameras)
+        expected_ray_starts, expected_ray_directions = patterns.pinhole_camera_pattern(
+            camera_cfg.pattern_cfg, intrinsic_matrices, camera.device
+        )
+        torch.testing.assert_close(camera.ray_starts, expected_ray_starts)
+        torch.testing.assert_close(camera.ray_directions, expected_ray_directions)
+
+        # -- partially shared intrinsics set for a subset of the cameras
+        camera.set_intrinsic_matrices(intrinsic_matrices[[0]], env_ids=[2])
+        self.assertEqual(camera._ray_directions.shape[0], 2)
+        expected_ray_starts, expected_ray_directions = patterns.pinhole_camera_pattern(
+            camera_cfg.pattern_cfg, intrinsic_matrices[[0, 1, 0]], camera.device
+        )
+        torch.testing.assert_close(camera.data.intrinsic_matrices, intrinsic_matrices[[0, 1, 0]])
+        torch.testing.assert_close(camera.ray_starts, expected_ray_starts)
+        torch.testing.assert_close(camera.ray_directions, expected_ray_directions)
+
     def test_throughput(self):
         """Checks that the single camera gets created properly with a rig."""
         # Create directory temp dir to dump the results
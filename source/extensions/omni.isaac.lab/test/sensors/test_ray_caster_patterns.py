@@ -0,0 +1,95 @@
+# Copyright (c) 2022-2024, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Launch Isaac Sim Simulator first."""
+
+from omni.isaac.lab.app import AppLauncher, run_tests
+
+# launch omniverse app
+simulation_app = AppLauncher(headless=True).app
+
+"""Rest everything follows."""
+
+import torch
+import unittest
+
+from omni.isaac.lab.sensors.ray_caster import patterns
+
+
+class TestRayCasterPatterns(unittest.TestCase):
+    """Test for the cached generation of the ray-casting patterns."""
+
+    def setUp(self):
+        """Clear the pattern cache before each test."""
+        patterns.clear_pattern_cache()
+
+    """
+    Tests
+    """
+
+    def test_cached_patterns(self):
+        """Test that equal configurations share the same rays, which match the generated rays."""
+        pattern_cfgs = [
+            patterns.GridPatternCfg(resolution=0.1, size=(1.0, 2.0)),
+            patterns.BpearlPatternCfg(),
+            patterns.LidarPatternCfg(
+                channels=16, vertical_fov_range=(-15.0, 15.0), horizontal_fov_range=(0.0, 360.0), horizontal_res=1.0
+            ),
+        ]
+        for pattern_cfg in pattern_cfgs:
+            with self.subTest(pattern=type(pattern_cfg).__name__):
+                ray_starts, ray_directions = patterns.get_cached_pattern(pattern_cfg, "cpu")
+                # check against the generated rays
+                expected_ray_starts, expected_ray_directions = pattern_cfg.func(pattern_cfg, "cpu")
+                torch.testing.assert_close(ray_starts, expected_ray_starts)
+                torch.testing.assert_close(ray_directions, expected_ray_directions)
+                # check that an equal configuration shares the rays
+                cached_ray_starts, cached_ray_directions = patterns.get_cached_pattern(pattern_cfg.replace(), "cpu")
+                self.assertIs(cached_ray_starts, ray_starts)
+                self.assertIs(cached_ray_directions, ray_directions)
+
+        # check that a different configuration does not share the rays
+        other_ray_directions = patterns.get_cached_pattern(pattern_cfgs[0].replace(resolution=0.2), "cpu")[1]
+        self.assertNotEqual(other_ray_directions.shape, patterns.get_cached_pattern(pattern_cfgs[0], "cpu")[1].shape)
+
+    def test_cached_camera_patterns(self):
+        """Test that the camera patterns are cached per intrinsic matrix."""
+        pattern_cfg = patterns.PinholeCameraPatternCfg(height=12, width=16)
+        intrinsic_matrices = torch.tensor([
+            [[20.0, 0.0, 8.0], [0.0, 20.0, 6.0], [0.0, 0.0, 1.0]],
+            [[30.0, 0.0, 8.0], [0.0, 30.0, 6.0], [0.0, 0.0, 1.0]],
+        ])
+        expected_ray_starts, expected_ray_directions = patterns.pinhole_camera_pattern(
+            pattern_cfg, intrinsic_matrices, "cpu"
+        )
+        for index, intrinsic_matrix in enumerate(intrinsic_matrices):
+            ray_starts, ray_directions = patterns.get_cached_pattern(pattern_cfg, "cpu", intrinsic_matrix)
+            self.assertEqual(ray_directions.shape, (pattern_cfg.height * pattern_cfg.width, 3))
+            torch.testing.assert_close(ray_starts, expected_ray_starts[index])
+            torch.testing.assert_close(ray_directions, expected_ray_directions[index])
+            # check that the same intrinsics share the rays
+            self.assertIs(patterns.get_cached_pattern(pattern_cfg, "cpu", intrinsic_matrix.clone())[1], ray_directions)
+        # check that the cache can be cleared
+        patterns.clear_pattern_cache()
+        self.assertIsNot(patterns.get_cached_pattern(pattern_cfg, "cpu", intrinsic_matrices[1])[1], ray_directions)
+
+    def test_pattern_cache_size(self):
+        """Test that the cache releases the least recently used patterns when it is full."""
+        pattern_cfgs = [
+            patterns.GridPatternCfg(resolution=0.1, size=(1.0, 1.0 + index))
+            for index in range(patterns.patterns._PATTERN_CACHE_MAX_SIZE + 1)
+        ]
+        # fill the cache and access the first pattern again
+        ray_directions = [patterns.get_cached_pattern(cfg, "cpu")[1] for cfg in pattern_cfgs[:-1]]
+        self.assertIs(patterns.get_cached_pattern(pattern_cfgs[0], "cpu")[1], ray_directions[0])
+        # add a new pattern: the least recently used pattern is released
+        patterns.get_cached_pattern(pattern_cfgs[-1], "cpu")
+        self.assertEqual(len(patterns.patterns._PATTERN_CACHE), patterns.patterns._PATTERN_CACHE_MAX_SIZE)
+        self.assertIs(patterns.get_cached_pattern(pattern_cfgs[0], "cpu")[1], ray_directions[0])
+        self.assertIsNot(patterns.get_cached_pattern(pattern_cfgs[1], "cpu")[1], ray_directions[1])
+
+
+if __name__ == "__main__":
+    run_tests()
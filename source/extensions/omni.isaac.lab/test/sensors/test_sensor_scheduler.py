@@ -0,0 +1,138 @@
+# Copyright (c) 2022-2024, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Launch Isaac Sim Simulator first."""
+
+from omni.isaac.lab.app import AppLauncher, run_tests
+
+# launch omniverse app
+simulation_app = AppLauncher(headless=True).app
+
+"""Rest everything follows."""
+
+import torch
+import unittest
+
+import omni.isaac.core.utils.prims as prim_utils
+
+from omni.isaac.lab.sensors import SensorBase, SensorBaseCfg, SensorScheduler
+from omni.isaac.lab.sim import build_simulation_context
+
+
+class DummySensor(SensorBase):
+    """Sensor that records the environments it is updated for, without any simulation handles."""
+
+    def __init__(self, cfg: SensorBaseCfg):
+        super().__init__(cfg)
+        # environments updated at each call
+        self.updated_env_ids = list()
+
+    @property
+    def data(self) -> list[list[int]]:
+        self._update_outdated_buffers()
+        return self.updated_env_ids
+
+    def _initialize_impl(self):
+        super()._initialize_impl()
+
+    def _update_buffers_impl(self, env_ids):
+        self.updated_env_ids.append(sorted(torch.as_tensor(env_ids).tolist()))
+
+
+class TestSensorScheduler(unittest.TestCase):
+    """Test for the batched scheduling of the sensor updates."""
+
+    num_envs = 8
+    """The number of environments."""
+
+    def _create_env_prims(self):
+        """Creates the prims of the environments the sensors are attached to."""
+        for index in range(self.num_envs):
+            prim_utils.create_prim(f"/World/envs/env_{index}", "Xform")
+
+    def _create_sensors(self) -> list[DummySensor]:
+        """Creates sensors with different update periods and history lengths."""
+        sensor_cfgs = [
+            SensorBaseCfg(prim_path="/World/envs/env_.*/sensor", update_period=0.0),
+            SensorBaseCfg(prim_path="/World/envs/env_.*/sensor", update_period=0.0, history_length=2),
+            SensorBaseCfg(prim_path="/World/envs/env_.*/sensor", update_period=0.02),
+            SensorBaseCfg(prim_path="/World/envs/env_.*/sensor", update_period=0.02),
+            SensorBaseCfg(prim_path="/World/envs/env_.*/sensor", update_period=0.05, history_length=1),
+            # a sensor outside of the environments
+            SensorBaseCfg(prim_path="/World/sensor", update_period=0.02),
+        ]
+        return [DummySensor(cfg) for cfg in sensor_cfgs]
+
+    """
+    Tests
+    """
+
+    def test_grouping(self):
+        """Test that the sensors with equal update periods share their buffers."""
+        for device in ["cpu", "cuda:0"]:
+            with self.subTest(device=device):
+                with build_simulation_context(device=device) as sim:
+                    self._create_env_prims()
+                    sensors = self._create_sensors()
+                    # initialize the sensors
+                    sim.reset()
+                    self.assertTrue(all(sensor.is_initialized for sensor in sensors))
+                    self.assertEqual(sensors[0].num_instances, self.num_envs)
+                    self.assertEqual(sensors[-1].num_instances, 1)
+
+                    scheduler = SensorScheduler()
+                    scheduler.update(sensors, dt=0.01)
+                    # check the groups
+                    self.assertEqual(len(scheduler._groups), 4)
+                    self.assertEqual(scheduler._groups[1].timestamp.shape, (2, self.num_envs))
+                    # check that the sensor buffers are views into the group buffers
+                    sensors[2]._timestamp += 1.0
+                    torch.testing.assert_close(scheduler._groups[1].timestamp[0], sensors[2]._timestamp)
+                    # check that the groups are rebuilt when the sensors change
+                    scheduler.update(sensors[:2], dt=0.01)
+                    self.assertEqual(len(scheduler._groups), 1)
+                    torch.testing.assert_close(sensors[0]._timestamp, torch.full((self.num_envs,), 0.02, device=device))
+
+    def test_update_equivalence(self):
+        """Test that the scheduled updates match the updates of the individual sensors."""
+        for device in ["cpu", "cuda:0"]:
+            for force_recompute in [True, False]:
+                with self.subTest(device=device, force_recompute=force_recompute):
+                    with build_simulation_context(device=device) as sim:
+                        self._create_env_prims()
+                        scheduled_sensors = self._create_sensors()
+                        expected_sensors = self._create_sensors()
+                        # initialize the sensors
+                        sim.reset()
+
+                        scheduler = SensorScheduler()
+                        generator = torch.Generator().manual_seed(0)
+                        for step in range(100):
+                            # reset a random subset of the environments
+                            if step % 7 == 3:
+                                env_ids = torch.randperm(self.num_envs, generator=generator)[:3].tolist()
+                                for sensors in [scheduled_sensors, expected_sensors]:
+                                    for sensor in sensors:
+                                        sensor.reset(env_ids if sensor.num_instances > 1 else None)
+                            # update the sensors
+                            scheduler.update(scheduled_sensors, dt=0.005, force_recompute=force_recompute)
+                            for sensor in expected_sensors:
+                                sensor.update(dt=0.005, force_recompute=force_recompute)
+                            # access the data of a lazy sensor
+                            if step % 11 == 5:
+                                scheduled_sensors[3].data
+                                expected_sensors[3].data
+                            # check the sensors
+                            for sensor, expected_sensor in zip(scheduled_sensors, expected_sensors):
+                                self.assertEqual(sensor.updated_env_ids, expected_sensor.updated_env_ids)
+                                torch.testing.assert_close(sensor._timestamp, expected_sensor._timestamp)
+                                torch.testing.assert_close(
+                                    sensor._timestamp_last_update, expected_sensor._timestamp_last_update
+                                )
+                                torch.testing.assert_close(sensor._is_outdated, expected_sensor._is_outdated)
+
+
+if __name__ == "__main__":
+    run_tests()
@@ -31,6 +31,7 @@ from pxr import Gf, UsdGeom
 import omni.isaac.lab.sim as sim_utils
 from omni.isaac.lab.sensors.camera import Camera, CameraCfg, TiledCamera, TiledCameraCfg
 from omni.isaac.lab.utils.timer import Timer
+from omni.isaac.lab.utils.warp import reshape_tiled_image
 
 
 class TestTiledCamera(unittest.TestCase):
@@ -1313,6 +1314,64 @@ class TestTiledCamera(unittest.TestCase):
         # print info
         print(sensor)
 
+    def test_depth_clipping(self):
+        """Test that the depth images are clipped to the far clipping distance."""
+        # Create camera with a far clipping distance closer than the ground
+        camera_cfg = copy.deepcopy(self.camera_cfg)
+        camera_cfg.data_types = ["distance_to_image_plane"]
+        camera_cfg.spawn.clipping_range = (0.1, 3.0)
+        camera_cfg.depth_clipping_behavior = "max"
+        camera = TiledCamera(camera_cfg)
+        # Play sim
+        self.sim.reset()
+        # Simulate for a few steps
+        for _ in range(5):
+            self.sim.step()
+        camera.update(self.dt)
+        # check that there are no values beyond the far clipping distance
+        im_data = camera.data.output["distance_to_image_plane"]
+        self.assertFalse(torch.any(torch.isinf(im_data)))
+        self.assertLessEqual(im_data.max().item(), 3.0)
+        del camera
+
+    def test_reshape_tiled_image(self):
+        """Test the de-tiling of synthetic tiled images on the CPU."""
+        num_cameras, height, width = 5, 4, 6
+        num_tiles_x, num_tiles_y = 3, 2
+        # create the tiled images of the cameras (the last tile is unused)
+        rng = np.random.default_rng(0)
+        images_rgba = rng.integers(0, 256, size=(num_tiles_y * num_tiles_x, height, width, 4), dtype=np.uint8)
+        images_depth = rng.uniform(0.0, 10.0, size=(num_tiles_y * num_tiles_x, height, width, 1)).astype(np.float32)
+        images_depth[images_depth > 8.0] = np.inf
+
+        def tile(images: np.ndarray) -> np.ndarray:
+            images = images.reshape(num_tiles_y, num_tiles_x, height, width, -1).transpose(0, 2, 1, 3, 4)
+            return np.ascontiguousarray(images.reshape(num_tiles_y * height, num_tiles_x * width, -1))
+
+        tiled_rgba, tiled_depth = tile(images_rgba), tile(images_depth)
+        expected_rgba = torch.from_numpy(images_rgba[:num_cameras])
+        expected_depth = torch.from_numpy(images_depth[:num_cameras])
+
+        # -- rgba
+        rgba = torch.zeros(num_cameras, height, width, 4, dtype=torch.uint8)
+        reshape_tiled_image(tiled_rgba, rgba, num_tiles_x)
+        torch.testing.assert_close(rgba, expected_rgba)
+        # -- rgb from the rgba tiles
+        rgb = torch.zeros(num_cameras, height, width, 3, dtype=torch.uint8)
+        reshape_tiled_image(tiled_rgba, rgb, num_tiles_x)
+        torch.testing.assert_close(rgb, expected_rgba[..., :3])
+        # -- normalized rgb
+        rgb_normalized = torch.zeros(num_cameras, height, width, 3)
+        reshape_tiled_image(tiled_rgba, rgb_normalized, num_tiles_x, scale=1.0 / 255.0)
+        torch.testing.assert_close(rgb_normalized, expected_rgba[..., :3].float() / 255.0)
+        # -- depth clipped to the maximum value
+        depth = torch.zeros(num_cameras, height, width, 1)
+        reshape_tiled_image(tiled_depth, depth, num_tiles_x, max_value=5.0)
+        torch.testing.assert_close(depth, expected_depth.clamp(max=5.0))
+        # -- depth with infinite values set to zero
+        reshape_tiled_image(tiled_depth, depth, num_tiles_x, max_value=5.0, fill_value=0.0)
+        torch.testing.assert_close(depth, torch.where(expected_depth > 5.0, 0.0, expected_depth))
+
     """
     Helper functions.
     """
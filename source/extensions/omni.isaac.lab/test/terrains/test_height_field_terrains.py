@@ -0,0 +1,199 @@
+# Copyright (c) 2022-2024, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Launch Isaac Sim Simulator first."""
+
+from omni.isaac.lab.app import AppLauncher, run_tests
+
+# launch omniverse app
+simulation_app = AppLauncher(headless=True).app
+
+"""Rest everything follows."""
+
+import numpy as np
+import unittest
+
+import omni.isaac.lab.terrains.height_field as hf_gen
+from omni.isaac.lab.terrains.height_field import hf_terrains
+
+"""
+Reference implementations.
+
+These are the loop-based implementations of the height field terrains, kept to check that the
+vectorized implementations produce the same height fields for the same random state.
+"""
+
+
+def pyramid_stairs_terrain_reference(difficulty: float, cfg: hf_gen.HfPyramidStairsTerrainCfg) -> np.ndarray:
+    step_height = cfg.step_height_range[0] + difficulty * (cfg.step_height_range[1] - cfg.step_height_range[0])
+    if cfg.inverted:
+        step_height *= -1
+    width_pixels = int(cfg.size[0] / cfg.horizontal_scale)
+    length_pixels = int(cfg.size[1] / cfg.horizontal_scale)
+    step_width = int(cfg.step_width / cfg.horizontal_scale)
+    step_height = int(step_height / cfg.vertical_scale)
+    platform_width = int(cfg.platform_width / cfg.horizontal_scale)
+
+    hf_raw = np.zeros((width_pixels, length_pixels))
+    current_step_height = 0
+    start_x, start_y = 0, 0
+    stop_x, stop_y = width_pixels, length_pixels
+    while (stop_x - start_x) > platform_width and (stop_y - start_y) > platform_width:
+        start_x += step_width
+        stop_x -= step_width
+        start_y += step_width
+        stop_y -= step_width
+        current_step_height += step_height
+        hf_raw[start_x:stop_x, start_y:stop_y] = current_step_height
+    return np.rint(hf_raw).astype(np.int16)
+
+
+def discrete_obstacles_terrain_reference(difficulty: float, cfg: hf_gen.HfDiscreteObstaclesTerrainCfg) -> np.ndarray:
+    obs_height = cfg.obstacle_height_range[0] + difficulty * (
+        cfg.obstacle_height_range[1] - cfg.obstacle_height_range[0]
+    )
+    width_pixels = int(cfg.size[0] / cfg.horizontal_scale)
+    length_pixels = int(cfg.size[1] / cfg.horizontal_scale)
+    obs_height = int(obs_height / cfg.vertical_scale)
+    obs_width_min = int(cfg.obstacle_width_range[0] / cfg.horizontal_scale)
+    obs_width_max = int(cfg.obstacle_width_range[1] / cfg.horizontal_scale)
+    platform_width = int(cfg.platform_width / cfg.horizontal_scale)
+    obs_width_range = np.arange(obs_width_min, obs_width_max, 4)
+    obs_length_range = np.arange(obs_width_min, obs_width_max, 4)
+    obs_x_range = np.arange(0, width_pixels, 4)
+    obs_y_range = np.arange(0, length_pixels, 4)
+
+    hf_raw = np.zeros((width_pixels, length_pixels))
+    for _ in range(cfg.num_obstacles):
+        if cfg.obstacle_height_mode == "choice":
+            height = np.random.choice([-obs_height, -obs_height // 2, obs_height // 2, obs_height])
+        else:
+            height = obs_height
+        width = int(np.random.choice(obs_width_range))
+        length = int(np.random.choice(obs_length_range))
+        x_start = int(np.random.choice(obs_x_range))
+        y_start = int(np.random.choice(obs_y_range))
+        if x_start + width > width_pixels:
+            x_start = width_pixels - width
+        if y_start + length > length_pixels:
+            y_start = length_pixels - length
+        hf_raw[x_start : x_start + width, y_start : y_start + length] = height
+    x1 = (width_pixels - platform_width) // 2
+    x2 = (width_pixels + platform_width) // 2
+    y1 = (length_pixels - platform_width) // 2
+    y2 = (length_pixels + platform_width) // 2
+    hf_raw[x1:x2, y1:y2] = 0
+    return np.rint(hf_raw).astype(np.int16)
+
+
+def stepping_stones_terrain_reference(difficulty: float, cfg: hf_gen.HfSteppingStonesTerrainCfg) -> np.ndarray:
+    stone_width = cfg.stone_width_range[1] - difficulty * (cfg.stone_width_range[1] - cfg.stone_width_range[0])
+    stone_distance = cfg.stone_distance_range[0] + difficulty * (
+        cfg.stone_distance_range[1] - cfg.stone_distance_range[0]
+    )
+    width_pixels = int(cfg.size[0] / cfg.horizontal_scale)
+    length_pixels = int(cfg.size[1] / cfg.horizontal_scale)
+    stone_distance = int(stone_distance / cfg.horizontal_scale)
+    stone_width = int(stone_width / cfg.horizontal_scale)
+    stone_height_max = int(cfg.stone_height_max / cfg.vertical_scale)
+    holes_depth = int(cfg.holes_depth / cfg.vertical_scale)
+    platform_width = int(cfg.platform_width / cfg.horizontal_scale)
+    stone_height_range = np.arange(-stone_height_max - 1, stone_height_max, step=1)
+
+    hf_raw = np.full((width_pixels, length_pixels), holes_depth)
+    start_x, start_y = 0, 0
+    if length_pixels >= width_pixels:
+        while start_y < length_pixels:
+            stop_y = min(length_pixels, start_y + stone_width)
+            start_x = np.random.randint(0, stone_width)
+            stop_x = max(0, start_x - stone_distance)
+            hf_raw[0:stop_x, start_y:stop_y] = np.random.choice(stone_height_range)
+            while start_x < width_pixels:
+                stop_x = min(width_pixels, start_x + stone_width)
+                hf_raw[start_x:stop_x, start_y:stop_y] = np.random.choice(stone_height_range)
+                start_x += stone_width + stone_distance
+            start_y += stone_width + stone_distance
+    elif width_pixels > length_pixels:
+        while start_x < width_pixels:
+            stop_x = min(width_pixels, start_x + stone_width)
+            start_y = np.random.randint(0, stone_width)
+            stop_y = max(0, start_y - stone_distance)
+            hf_raw[start_x:stop_x, 0:stop_y] = np.random.choice(stone_height_range)
+            while start_y < length_pixels:
+                stop_y = min(length_pixels, start_y + stone_width)
+                hf_raw[start_x:stop_x, start_y:stop_y] = np.random.choice(stone_height_range)
+                start_y += stone_width + stone_distance
+            start_x += stone_width + stone_distance
+    x1 = (width_pixels - platform_width) // 2
+    x2 = (width_pixels + platform_width) // 2
+    y1 = (length_pixels - platform_width) // 2
+    y2 = (length_pixels + platform_width) // 2
+    hf_raw[x1:x2, y1:y2] = 0
+    return np.rint(hf_raw).astype(np.int16)
+
+
+class TestHeightFieldTerrains(unittest.TestCase):
+    """Test the height field terrains against their reference implementations."""
+
+    def setUp(self):
+        # terrain sizes to check: square and rectangular along both axes
+        self.sizes = [(8.0, 8.0), (6.0, 9.0), (9.5, 5.0)]
+        self.difficulties = [0.0, 0.35, 1.0]
+
+    def _check_height_fields(self, func, func_reference, cfg):
+        """Check that the height fields are equal for the same random state."""
+        for size in self.sizes:
+            for difficulty in self.difficulties:
+                for seed in range(3):
+                    with self.subTest(size=size, difficulty=difficulty, seed=seed):
+                        cfg.size = size
+                        # generate the height fields from the same random state
+                        np.random.seed(seed)
+                        hf = func.__wrapped__(difficulty, cfg)
+                        next_sample = np.random.rand()
+                        np.random.seed(seed)
+                        hf_reference = func_reference(difficulty, cfg)
+                        next_sample_reference = np.random.rand()
+                        # check that the height fields are equal
+                        self.assertEqual(hf.dtype, hf_reference.dtype)
+                        np.testing.assert_array_equal(hf, hf_reference)
+                        # check that the random state is consumed in the same way
+                        self.assertEqual(next_sample, next_sample_reference)
+
+    def test_pyramid_stairs_terrain(self):
+        """Test the pyramid stairs terrain."""
+        for inverted in [False, True]:
+            for platform_width in [0.0, 1.0, 3.0]:
+                cfg = hf_gen.HfPyramidStairsTerrainCfg(
+                    step_height_range=(0.05, 0.23), step_width=0.3, platform_width=platform_width, inverted=inverted
+                )
+                self._check_height_fields(hf_terrains.pyramid_stairs_terrain, pyramid_stairs_terrain_reference, cfg)
+
+    def test_discrete_obstacles_terrain(self):
+        """Test the discrete obstacles terrain."""
+        for obstacle_height_mode in ["choice", "fixed"]:
+            cfg = hf_gen.HfDiscreteObstaclesTerrainCfg(
+                obstacle_height_mode=obstacle_height_mode,
+                obstacle_width_range=(0.25, 2.0),
+                obstacle_height_range=(0.05, 0.3),
+                num_obstacles=40,
+                platform_width=2.0,
+            )
+            self._check_height_fields(hf_terrains.discrete_obstacles_terrain, discrete_obstacles_terrain_reference, cfg)
+
+    def test_stepping_stones_terrain(self):
+        """Test the stepping stones terrain."""
+        cfg = hf_gen.HfSteppingStonesTerrainCfg(
+            stone_height_max=0.02,
+            stone_width_range=(0.25, 1.0),
+            stone_distance_range=(0.1, 0.4),
+            holes_depth=-5.0,
+            platform_width=2.0,
+        )
+        self._check_height_fields(hf_terrains.stepping_stones_terrain, stepping_stones_terrain_reference, cfg)
+
+
+if __name__ == "__main__":
+    run_tests()
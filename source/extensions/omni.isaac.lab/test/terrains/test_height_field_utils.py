@@ -0,0 +1,119 @@
+# Copyright (c) 2022-2024, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Launch Isaac Sim Simulator first."""
+
+from omni.isaac.lab.app import AppLauncher, run_tests
+
+# launch omniverse app
+simulation_app = AppLauncher(headless=True).app
+
+"""Rest everything follows."""
+
+import numpy as np
+import trimesh
+import unittest
+
+from omni.isaac.lab.terrains.height_field.utils import convert_height_field_to_mesh
+
+
+def convert_height_field_to_mesh_reference(
+    height_field: np.ndarray, horizontal_scale: float, vertical_scale: float, slope_threshold: float | None = None
+) -> tuple[np.ndarray, np.ndarray]:
+    """Reference implementation of the height-field to mesh conversion using explicit loops."""
+    num_rows, num_cols = height_field.shape
+    y = np.linspace(0, (num_cols - 1) * horizontal_scale, num_cols)
+    x = np.linspace(0, (num_rows - 1) * horizontal_scale, num_rows)
+    yy, xx = np.meshgrid(y, x)
+    hf = height_field.copy()
+    if slope_threshold is not None:
+        slope_threshold *= horizontal_scale / vertical_scale
+        move_x = np.zeros((num_rows, num_cols))
+        move_y = np.zeros((num_rows, num_cols))
+        move_corners = np.zeros((num_rows, num_cols))
+        move_x[: num_rows - 1, :] += hf[1:num_rows, :] - hf[: num_rows - 1, :] > slope_threshold
+        move_x[1:num_rows, :] -= hf[: num_rows - 1, :] - hf[1:num_rows, :] > slope_threshold
+        move_y[:, : num_cols - 1] += hf[:, 1:num_cols] - hf[:, : num_cols - 1] > slope_threshold
+        move_y[:, 1:num_cols] -= hf[:, : num_cols - 1] - hf[:, 1:num_cols] > slope_threshold
+        move_corners[: num_rows - 1, : num_cols - 1] += (
+            hf[1:num_rows, 1:num_cols] - hf[: num_rows - 1, : num_cols - 1] > slope_threshold
+        )
+        move_corners[1:num_rows, 1:num_cols] -= (
+            hf[: num_rows - 1, : num_cols - 1] - hf[1:num_rows, 1:num_cols] > slope_threshold
+        )
+        xx += (move_x + move_corners * (move_x == 0)) * horizontal_scale
+        yy += (move_y + move_corners * (move_y == 0)) * horizontal_scale
+    vertices = np.zeros((num_rows * num_cols, 3), dtype=np.float32)
+    vertices[:, 0] = xx.flatten()
+    vertices[:, 1] = yy.flatten()
+    vertices[:, 2] = hf.flatten() * vertical_scale
+    triangles = -np.ones((2 * (num_rows - 1) * (num_cols - 1), 3), dtype=np.uint32)
+    for i in range(num_rows - 1):
+        ind0 = np.arange(0, num_cols - 1) + i * num_cols
+        ind1 = ind0 + 1
+        ind2 = ind0 + num_cols
+        ind3 = ind2 + 1
+        start = 2 * i * (num_cols - 1)
+        stop = start + 2 * (num_cols - 1)
+        triangles[start:stop:2, 0] = ind0
+        triangles[start:stop:2, 1] = ind3
+        triangles[start:stop:2, 2] = ind1
+        triangles[start + 1 : stop : 2, 0] = ind0
+        triangles[start + 1 : stop : 2, 1] = ind2
+        triangles[start + 1 : stop : 2, 2] = ind3
+    return vertices, triangles
+
+
+class TestHeightFieldUtils(unittest.TestCase):
+    """Test the conversion of height fields to meshes."""
+
+    def setUp(self):
+        # create a height field with flat steps and a rough region
+        rng = np.random.default_rng(0)
+        self.height_field = np.zeros((81, 65), dtype=np.int16)
+        self.height_field[20:40, 10:50] = 40
+        self.height_field[50:70, 30:60] = rng.integers(-20, 20, size=(20, 30))
+
+    def test_conversion_matches_reference(self):
+        """Check that the vectorized conversion matches the loop-based implementation."""
+        for slope_threshold in [None, 0.75]:
+            with self.subTest(slope_threshold=slope_threshold):
+                vertices, triangles = convert_height_field_to_mesh(self.height_field, 0.1, 0.005, slope_threshold)
+                vertices_ref, triangles_ref = convert_height_field_to_mesh_reference(
+                    self.height_field, 0.1, 0.005, slope_threshold
+                )
+                np.testing.assert_allclose(vertices, vertices_ref, atol=1e-5)
+                np.testing.assert_array_equal(triangles, triangles_ref)
+
+    def test_decimate_flat_regions(self):
+        """Check that the decimation of flat regions preserves the surface with fewer triangles."""
+        for slope_threshold in [None, 0.75]:
+            with self.subTest(slope_threshold=slope_threshold):
+                mesh = trimesh.Trimesh(
+                    *convert_height_field_to_mesh(self.height_field, 0.1, 0.005, slope_threshold), process=False
+                )
+                mesh_decimated = trimesh.Trimesh(
+                    *convert_height_field_to_mesh(
+                        self.height_field, 0.1, 0.005, slope_threshold, decimate_flat_regions=True
+                    ),
+                    process=False,
+                )
+                # check that the mesh is smaller
+                self.assertLess(len(mesh_decimated.faces), len(mesh.faces))
+                self.assertLess(len(mesh_decimated.vertices), len(mesh.vertices))
+                # check that the surface is the same
+                np.testing.assert_allclose(mesh_decimated.bounds, mesh.bounds, atol=1e-5)
+                self.assertAlmostEqual(mesh_decimated.area, mesh.area, places=3)
+
+    def test_decimate_flat_height_field(self):
+        """Check that a flat height field with power-of-two cells is decimated into a single quad."""
+        height_field = np.full((65, 65), 10, dtype=np.int16)
+        vertices, triangles = convert_height_field_to_mesh(height_field, 0.1, 0.005, decimate_flat_regions=True)
+        self.assertEqual(len(vertices), 4)
+        self.assertEqual(len(triangles), 2)
+
+
+if __name__ == "__main__":
+    run_tests()
@@ -0,0 +1,76 @@
+# Copyright (c) 2022-2024, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Launch Isaac Sim Simulator first."""
+
+from omni.isaac.lab.app import AppLauncher, run_tests
+
+# launch omniverse app
+simulation_app = AppLauncher(headless=True).app
+
+"""Rest everything follows."""
+
+import numpy as np
+import scipy.spatial.transform as tf
+import trimesh
+import unittest
+
+from omni.isaac.lab.terrains.trimesh.utils import make_boxes, make_repeated_objects
+
+
+class TestMeshUtils(unittest.TestCase):
+    """Test the batched mesh primitives."""
+
+    def test_make_boxes(self):
+        """Check that the batched boxes match the boxes created one by one."""
+        rng = np.random.default_rng(0)
+        dims = rng.uniform(0.1, 2.0, size=(20, 3))
+        positions = rng.uniform(-5.0, 5.0, size=(20, 3))
+        rotations = tf.Rotation.random(20, random_state=0).as_matrix()
+        for use_rotations in [False, True]:
+            with self.subTest(use_rotations=use_rotations):
+                # create the boxes one by one
+                meshes = list()
+                for index in range(len(dims)):
+                    transform = np.eye(4)
+                    transform[:3, -1] = positions[index]
+                    if use_rotations:
+                        transform[:3, :3] = rotations[index]
+                    meshes.append(trimesh.creation.box(dims[index], transform))
+                mesh_reference = trimesh.util.concatenate(meshes)
+                # create the boxes at once
+                mesh = make_boxes(dims, positions, rotations if use_rotations else None)
+                # check that the meshes are equal
+                np.testing.assert_allclose(mesh.vertices, mesh_reference.vertices, atol=1e-6)
+                np.testing.assert_array_equal(mesh.faces, mesh_reference.faces)
+
+    def test_make_repeated_objects(self):
+        """Check the dimensions of the batched objects."""
+        num_objects = 30
+        centers = np.zeros((num_objects, 3))
+        centers[:, 0] = np.arange(num_objects) * 3.0
+        heights = np.linspace(0.1, 1.0, num_objects)
+        object_kwargs = {
+            "box": {"length": 0.5, "width": 0.4},
+            "cylinder": {"radius": 0.3},
+            "cone": {"radius": 0.3},
+        }
+        for object_type, kwargs in object_kwargs.items():
+            with self.subTest(object_type=object_type):
+                mesh = make_repeated_objects(object_type, centers, heights, max_yx_angle=0.0, **kwargs)
+                # check that each object has the expected height
+                # note: the objects are far apart so they can be split by their x-position
+                for index in range(num_objects):
+                    vertices = mesh.vertices[np.abs(mesh.vertices[:, 0] - centers[index, 0]) < 1.0]
+                    self.assertAlmostEqual(np.ptp(vertices[:, 2]), heights[index], places=5)
+
+    def test_make_repeated_objects_invalid_type(self):
+        """Check that an unknown object type raises an error."""
+        with self.assertRaises(ValueError):
+            make_repeated_objects("sphere", np.zeros((2, 3)), np.ones(2), radius=0.2)
+
+
+if __name__ == "__main__":
+    run_tests()
@@ -15,13 +15,17 @@ simulation_app = AppLauncher(headless=True).app
 import numpy as np
 import os
 import shutil
+import tempfile
+import time
 import torch
 import unittest
 
 import omni.isaac.core.utils.torch as torch_utils
 
-from omni.isaac.lab.terrains import FlatPatchSamplingCfg, TerrainGenerator, TerrainGeneratorCfg
+from omni.isaac.lab.terrains import FlatPatchSamplingCfg, HfTerrainBaseCfg, TerrainGenerator, TerrainGeneratorCfg
 from omni.isaac.lab.terrains.config.rough import ROUGH_TERRAINS_CFG
+from omni.isaac.lab.terrains.terrain_generator import _run_sub_terrain_workers
+from omni.isaac.lab.terrains.terrain_generator_worker import generate_sub_terrain, load_sub_terrain
 
 
 class TestTerrainGenerator(unittest.TestCase):
@@ -90,6 +94,72 @@ class TestTerrainGenerator(unittest.TestCase):
                         terrain_mesh_1.faces, terrain_mesh_2.faces, atol=1e-5, err_msg="Faces are not equal"
                     )
 
+    def test_generation_parallel(self):
+        """Generates terrains with worker processes and tests that the result does not depend on the number of workers.
+
+        The sub-terrains are seeded based on their location in the grid, so the generated mesh should be the same
+        regardless of the order in which the workers finish.
+        """
+        for curriculum in [True, False]:
+            with self.subTest(curriculum=curriculum):
+                terrain_meshes = list()
+                terrain_origins = list()
+                for num_workers in [1, 4]:
+                    # disturb the global random state
+                    torch_utils.set_seed(num_workers)
+                    # create terrain generator
+                    cfg = ROUGH_TERRAINS_CFG.copy()
+                    cfg.use_cache = False
+                    cfg.seed = 0
+                    cfg.curriculum = curriculum
+                    cfg.num_workers = num_workers
+                    terrain_generator = TerrainGenerator(cfg=cfg)
+                    # keep a copy of the generated terrain
+                    terrain_meshes.append(terrain_generator.terrain_mesh.copy())
+                    terrain_origins.append(terrain_generator.terrain_origins.copy())
+
+                # check if the terrains are equal
+                np.testing.assert_allclose(
+                    terrain_meshes[0].vertices, terrain_meshes[1].vertices, atol=1e-5, err_msg="Vertices are not equal"
+                )
+                np.testing.assert_allclose(
+                    terrain_meshes[0].faces, terrain_meshes[1].faces, atol=1e-5, err_msg="Faces are not equal"
+                )
+                np.testing.assert_allclose(terrain_origins[0], terrain_origins[1], err_msg="Origins are not equal")
+
+    def test_sub_terrain_workers(self):
+        """Generates sub-terrains in worker processes started from this script, which launched the application.
+
+        The worker processes must neither launch the application again nor import the modules that require it.
+        The pool is used directly, so a failure of the workers is not hidden by the fallback to the main process.
+        """
+        cfg = ROUGH_TERRAINS_CFG.copy()
+        cfg.use_cache = False
+        # set the common values of the sub-terrains (as done by the terrain generator)
+        for sub_cfg in cfg.sub_terrains.values():
+            sub_cfg.size = cfg.size
+            if isinstance(sub_cfg, HfTerrainBaseCfg):
+                sub_cfg.horizontal_scale = cfg.horizontal_scale
+                sub_cfg.vertical_scale = cfg.vertical_scale
+                sub_cfg.slope_threshold = cfg.slope_threshold
+
+        with tempfile.TemporaryDirectory() as output_dir:
+            tasks = [
+                (0.5, sub_cfg, cfg, seed, os.path.join(output_dir, "workers", name))
+                for seed, (name, sub_cfg) in enumerate(cfg.sub_terrains.items())
+            ]
+            # generate the sub-terrains in the worker processes
+            sub_terrain_dirs = _run_sub_terrain_workers(tasks, num_workers=2)
+            self.assertEqual(len(sub_terrain_dirs), len(tasks))
+            # check against the sub-terrains generated in the main process
+            for task, sub_terrain_dir in zip(tasks, sub_terrain_dirs):
+                mesh, origin = load_sub_terrain(sub_terrain_dir)
+                expected_dir = generate_sub_terrain(*task[:4], output_dir=task[4].replace("workers", "main"))
+                expected_mesh, expected_origin = load_sub_terrain(expected_dir)
+                np.testing.assert_allclose(mesh.vertices, expected_mesh.vertices, err_msg="Vertices are not equal")
+                np.testing.assert_array_equal(mesh.faces, expected_mesh.faces, err_msg="Faces are not equal")
+                np.testing.assert_allclose(origin, expected_origin, err_msg="Origins are not equal")
+
     def test_generation_cache(self):
         """Generate the terrain and check that caching works.
 
@@ -116,6 +186,10 @@ class TestTerrainGenerator(unittest.TestCase):
                 # with curriculum, all sub-terrains are uniquely generated
                 hash_ids_1 = set(os.listdir(cfg.cache_dir))
                 self.assertTrue(os.listdir(cfg.cache_dir))
+                # check that the sub-terrains are stored in the binary format
+                for hash_id in hash_ids_1:
+                    cache_files = os.listdir(os.path.join(cfg.cache_dir, hash_id))
+                    self.assertTrue({"vertices.npy", "faces.npy", "origin.npy"}.issubset(cache_files))
 
                 # set a random seed to disturb the process
                 # this is to ensure that the seed inside the terrain generator makes deterministic results
@@ -143,6 +217,66 @@ class TestTerrainGenerator(unittest.TestCase):
                     terrain_mesh_1.faces, terrain_mesh_2.faces, atol=1e-5, err_msg="Faces are not equal"
                 )
 
+    def test_generation_cache_eviction(self):
+        """Generate several terrains and check that the least recently used cache entries are removed."""
+        # clear output directory
+        if os.path.exists(self.output_dir):
+            shutil.rmtree(self.output_dir)
+        # create a small terrain with a single sub-terrain
+        cfg: TerrainGeneratorCfg = ROUGH_TERRAINS_CFG.copy()
+        cfg.num_rows = 1
+        cfg.num_cols = 1
+        cfg.border_width = 1.0
+        cfg.sub_terrains = {"random_rough": cfg.sub_terrains["random_rough"]}
+        cfg.use_cache = True
+        cfg.cache_dir = self.output_dir
+
+        def generate_terrain(seed: int) -> tuple[str, str] | None:
+            """Generate the terrain and return its new sub-terrain and combined terrain cache entries."""
+            hash_ids = set(os.listdir(cfg.cache_dir)) if os.path.exists(cfg.cache_dir) else set()
+            # note: the entries are ordered by their modification time
+            time.sleep(0.1)
+            cfg.seed = seed
+            TerrainGenerator(cfg=cfg)
+            new_hash_ids = set(os.listdir(cfg.cache_dir)) - hash_ids
+            if not new_hash_ids:
+                return None
+            # the combined terrain entry is the one storing the flat patches
+            self.assertEqual(len(new_hash_ids), 2)
+            terrain_hash_id = next(
+                hash_id
+                for hash_id in new_hash_ids
+                if os.path.exists(os.path.join(cfg.cache_dir, hash_id, "flat_patches.npz"))
+            )
+            return (new_hash_ids - {terrain_hash_id}).pop(), terrain_hash_id
+
+        # generate the first terrain without bound and measure the size of its entries
+        hash_ids_1 = generate_terrain(seed=0)
+        terrain_size = 0
+        for root, _, filenames in os.walk(cfg.cache_dir):
+            terrain_size += sum(os.path.getsize(os.path.join(root, filename)) for filename in filenames)
+        # bound the cache to fit about two terrains
+        cfg.cache_max_size = 2.2 * terrain_size / 1024**2
+
+        # generate the second terrain: both terrains fit into the cache
+        hash_ids_2 = generate_terrain(seed=1)
+        self.assertTrue(set(hash_ids_1 + hash_ids_2).issubset(os.listdir(cfg.cache_dir)))
+        # generate the third terrain: the entries of the least recently used terrain are removed
+        hash_ids_3 = generate_terrain(seed=2)
+        hash_ids = set(os.listdir(cfg.cache_dir))
+        self.assertTrue(hash_ids.isdisjoint(hash_ids_1))
+        self.assertTrue(set(hash_ids_2 + hash_ids_3).issubset(hash_ids))
+
+        # load the second terrain from the cache: its combined terrain entry becomes the most recently used
+        self.assertIsNone(generate_terrain(seed=1))
+        # generate a fourth terrain: the sub-terrain entries are now the least recently used ones
+        hash_ids_4 = generate_terrain(seed=3)
+        hash_ids = set(os.listdir(cfg.cache_dir))
+        self.assertTrue(set(hash_ids_4).issubset(hash_ids))
+        self.assertIn(hash_ids_2[1], hash_ids)
+        self.assertNotIn(hash_ids_2[0], hash_ids)
+        self.assertNotIn(hash_ids_3[0], hash_ids)
+
     def test_terrain_flat_patches(self):
         """Test the flat patches generation."""
         # create terrain generator
@@ -164,6 +298,16 @@ class TestTerrainGenerator(unittest.TestCase):
         # check that no flat patches are zero
         for _, flat_patches in terrain_generator.flat_patches.items():
             self.assertFalse(torch.allclose(flat_patches, torch.zeros_like(flat_patches)))
+        # check that the flat patches are within their sub-terrain
+        rows = torch.arange(cfg.num_rows, device=terrain_generator.device).view(-1, 1, 1)
+        cols = torch.arange(cfg.num_cols, device=terrain_generator.device).view(1, -1, 1)
+        lower_x = rows * cfg.size[0] - 0.5 * cfg.num_rows * cfg.size[0]
+        lower_y = cols * cfg.size[1] - 0.5 * cfg.num_cols * cfg.size[1]
+        for _, flat_patches in terrain_generator.flat_patches.items():
+            self.assertTrue(torch.all(flat_patches[..., 0] >= lower_x - 1e-5))
+            self.assertTrue(torch.all(flat_patches[..., 0] <= lower_x + cfg.size[0] + 1e-5))
+            self.assertTrue(torch.all(flat_patches[..., 1] >= lower_y - 1e-5))
+            self.assertTrue(torch.all(flat_patches[..., 1] <= lower_y + cfg.size[1] + 1e-5))
 
 
 if __name__ == "__main__":
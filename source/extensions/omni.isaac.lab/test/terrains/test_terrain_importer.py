@@ -30,6 +30,7 @@ from omni.isaac.lab.sim import SimulationContext, build_simulation_context
 from omni.isaac.lab.terrains import TerrainImporter, TerrainImporterCfg
 from omni.isaac.lab.terrains.config.rough import ROUGH_TERRAINS_CFG
 from omni.isaac.lab.utils.assets import ISAAC_NUCLEUS_DIR
+from omni.isaac.lab.utils.warp import raycast_mesh
 
 
 class TestTerrainImporter(unittest.TestCase):
@@ -153,6 +154,64 @@ class TestTerrainImporter(unittest.TestCase):
                 self.assertAlmostEqual(actualSize[0], expectedSizeX)
                 self.assertAlmostEqual(actualSize[1], expectedSizeY)
 
+    def test_height_map(self) -> None:
+        """Generates a terrain with a height map and tests the height queries against ray-casting."""
+        for device in ("cuda:0", "cpu"):
+            with build_simulation_context(device=device, auto_add_lighting=True) as sim:
+                # Handler for terrains importing
+                terrain_importer_cfg = terrain_gen.TerrainImporterCfg(
+                    prim_path="/World/ground",
+                    terrain_type="generator",
+                    terrain_generator=ROUGH_TERRAINS_CFG.replace(num_rows=2, num_cols=2),
+                    num_envs=1,
+                    height_map_resolution=0.1,
+                )
+                terrain_importer = TerrainImporter(terrain_importer_cfg)
+                self.assertIsNotNone(terrain_importer.height_map)
+
+                # query the heights at the grid points of the height map
+                mesh = terrain_importer.meshes["terrain"]
+                num_x, num_y = terrain_importer.height_map.shape
+                xs = mesh.bounds[0, 0] + 0.1 * torch.arange(num_x - 1, device=sim.device)
+                ys = mesh.bounds[0, 1] + 0.1 * torch.arange(num_y - 1, device=sim.device)
+                xy = torch.stack(torch.meshgrid(xs, ys, indexing="ij"), dim=-1)
+                heights = terrain_importer.sample_height(xy)
+                # compute the heights with ray-casting
+                ray_starts = torch.cat([xy, torch.full_like(xy[..., :1], mesh.bounds[1, 2] + 1.0)], dim=-1)
+                ray_directions = torch.zeros_like(ray_starts)
+                ray_directions[..., 2] = -1.0
+                ray_hits = raycast_mesh(
+                    ray_starts.view(-1, 3), ray_directions.view(-1, 3), terrain_importer.warp_meshes["terrain"]
+                )[0]
+                # check that the heights match
+                torch.testing.assert_close(heights, ray_hits[:, 2].view(heights.shape), atol=1e-4, rtol=1e-5)
+
+                # check that interpolated heights are bounded by the mesh
+                xy = torch.rand(1000, 2, device=sim.device) * torch.tensor(mesh.extents[:2], device=sim.device)
+                heights = terrain_importer.sample_height(xy + torch.tensor(mesh.bounds[0, :2], device=sim.device))
+                self.assertEqual(heights.shape, (1000,))
+                self.assertTrue(torch.all(heights >= mesh.bounds[0, 2] - 1e-4))
+                self.assertTrue(torch.all(heights <= mesh.bounds[1, 2] + 1e-4))
+
+    def test_height_map_plane(self) -> None:
+        """Generates a plane with a height map and tests that the heights are zero."""
+        for device in ("cuda:0", "cpu"):
+            with build_simulation_context(device=device, auto_add_lighting=True) as sim:
+                # Handler for terrains importing
+                terrain_importer_cfg = terrain_gen.TerrainImporterCfg(
+                    prim_path="/World/ground",
+                    terrain_type="plane",
+                    num_envs=1,
+                    env_spacing=1.0,
+                    height_map_resolution=0.1,
+                )
+                terrain_importer = TerrainImporter(terrain_importer_cfg)
+                # check that the height map is tiny
+                self.assertEqual(terrain_importer.height_map.shape, (2, 2))
+                # check that the heights are zero
+                heights = terrain_importer.sample_height(torch.randn(100, 3, device=sim.device) * 100.0)
+                torch.testing.assert_close(heights, torch.zeros(100, device=sim.device))
+
     def test_ball_drop(self) -> None:
         """Generates assorted terrains and spheres created as meshes.
 
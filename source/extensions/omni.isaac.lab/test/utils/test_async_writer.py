@@ -0,0 +1,137 @@
+# Copyright (c) 2022-2024, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Launch Isaac Sim Simulator first."""
+
+from omni.isaac.lab.app import AppLauncher, run_tests
+
+# launch omniverse app in headless mode
+simulation_app = AppLauncher(headless=True).app
+
+"""Rest everything follows from here."""
+
+import numpy as np
+import os
+import tempfile
+import threading
+import torch
+import unittest
+
+from omni.isaac.lab.utils.io import AsyncWriter
+
+
+class _BlockingWriter(AsyncWriter):
+    """Writer whose workers wait for a signal before writing, to fill the queue deterministically."""
+
+    def __init__(self, *args, **kwargs):
+        self.started = threading.Event()
+        self.resume = threading.Event()
+        super().__init__(*args, **kwargs)
+
+    def _save(self, request):
+        self.started.set()
+        self.resume.wait()
+        super()._save(request)
+
+
+class TestAsyncWriter(unittest.TestCase):
+    """Test fixture for checking the asynchronous writer implementation."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.output_dir = self.temp_dir.name
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    """
+    Test cases for AsyncWriter class.
+    """
+
+    def test_file_formats(self):
+        """Test writing tensors and dictionaries in the different file formats."""
+        images = torch.randint(0, 256, (2, 8, 6, 3), dtype=torch.uint8)
+        depth = torch.rand(2, 8, 6, 1)
+        for file_format in ["npy", "npz", "png"]:
+            with self.subTest(file_format=file_format):
+                with AsyncWriter(os.path.join(self.output_dir, file_format), file_format=file_format) as writer:
+                    writer.write("rgb", images)
+                    writer.write("frame", {"rgb": images[0], "depth": depth[0]})
+                    # modifying the inputs after the write should not affect the files
+                    images_copy = images.clone()
+                    images.zero_()
+                    writer.flush()
+                    images.copy_(images_copy)
+                    self.assertEqual(writer.num_written, 2)
+
+                # check the written files
+                file_dir = os.path.join(self.output_dir, file_format)
+                if file_format == "npy":
+                    np.testing.assert_array_equal(np.load(os.path.join(file_dir, "rgb.npy")), images.numpy())
+                    np.testing.assert_array_equal(np.load(os.path.join(file_dir, "frame_depth.npy")), depth[0].numpy())
+                elif file_format == "npz":
+                    np.testing.assert_array_equal(np.load(os.path.join(file_dir, "rgb.npz"))["data"], images.numpy())
+                    frame = np.load(os.path.join(file_dir, "frame.npz"))
+                    np.testing.assert_array_equal(frame["rgb"], images[0].numpy())
+                    np.testing.assert_array_equal(frame["depth"], depth[0].numpy())
+                else:
+                    self.assertListEqual(
+                        sorted(os.listdir(file_dir)), ["frame_depth.png", "frame_rgb.png", "rgb_0.png", "rgb_1.png"]
+                    )
+
+    def test_drop_newest(self):
+        """Test that the incoming data is dropped when the queue is full."""
+        writer = _BlockingWriter(self.output_dir, num_workers=1, max_queue_size=1, drop_policy="drop_newest")
+        data = np.zeros((4, 4), dtype=np.float32)
+        # the first write is taken by the worker and the second one fills the queue
+        self.assertTrue(writer.write("data_0", data))
+        writer.started.wait()
+        self.assertTrue(writer.write("data_1", data))
+        self.assertFalse(writer.write("data_2", data))
+        # resume the worker
+        writer.resume.set()
+        writer.close()
+        self.assertEqual(writer.num_written, 2)
+        self.assertEqual(writer.num_dropped, 1)
+        self.assertListEqual(sorted(os.listdir(self.output_dir)), ["data_0.npy", "data_1.npy"])
+
+    def test_drop_oldest(self):
+        """Test that the oldest pending data is dropped when the queue is full."""
+        writer = _BlockingWriter(self.output_dir, num_workers=1, max_queue_size=1, drop_policy="drop_oldest")
+        data = np.zeros((4, 4), dtype=np.float32)
+        # the first write is taken by the worker and the second one fills the queue
+        self.assertTrue(writer.write("data_0", data))
+        writer.started.wait()
+        self.assertTrue(writer.write("data_1", data))
+        self.assertTrue(writer.write("data_2", data))
+        # resume the worker
+        writer.resume.set()
+        writer.close()
+        self.assertEqual(writer.num_written, 2)
+        self.assertEqual(writer.num_dropped, 1)
+        self.assertListEqual(sorted(os.listdir(self.output_dir)), ["data_0.npy", "data_2.npy"])
+
+    def test_write_error(self):
+        """Test that errors of the workers are raised on the calling thread."""
+        writer = AsyncWriter(self.output_dir, file_format="png")
+        # images with two channels are not supported
+        writer.write("image", np.zeros((4, 4, 2), dtype=np.uint8))
+        with self.assertRaises(RuntimeError):
+            writer.flush()
+        with self.assertRaises(RuntimeError):
+            writer.close()
+
+    def test_delete_with_error(self):
+        """Test that errors of the workers are not raised when the writer is deleted."""
+        writer = AsyncWriter(self.output_dir, file_format="png")
+        writer.write("image", np.zeros((4, 4, 2), dtype=np.uint8))
+        writer._queue.join()
+        # the error is logged instead of raised
+        writer.__del__()
+        self.assertTrue(writer._is_closed)
+
+
+if __name__ == "__main__":
+    run_tests()
@@ -24,6 +24,7 @@ import torch.utils.benchmark as benchmark
 from math import pi as PI
 
 import omni.isaac.lab.utils.math as math_utils
+import omni.isaac.lab.utils.warp as warp_utils
 
 
 class TestMathUtilities(unittest.TestCase):
@@ -413,6 +414,44 @@ class TestMathUtilities(unittest.TestCase):
                 iter_old_quat_rotate_inverse(q_rand, v_rand),
             )
 
+    def test_fused_quat_ops(self):
+        """Test that the fused warp implementations of the quaternion operations match the torch implementations."""
+        for device in ["cpu", "cuda:0"]:
+            for batch_shape in [(1,), (1024,), (16, 8)]:
+                with self.subTest(device=device, batch_shape=batch_shape):
+                    num = math.prod(batch_shape)
+                    q1 = math_utils.random_orientation(num, device).view(*batch_shape, 4)
+                    q2 = math_utils.random_orientation(num, device).view(*batch_shape, 4)
+                    t1 = torch.randn(*batch_shape, 3, device=device)
+                    t2 = torch.randn(*batch_shape, 3, device=device)
+                    # operations with the inputs to compare
+                    inputs = {
+                        "quat_mul": (q1, q2),
+                        "quat_apply": (q1, t1),
+                        "quat_rotate": (q1, t1),
+                        "quat_rotate_inverse": (q1, t1),
+                        "quat_error_magnitude": (q1, q2),
+                        "combine_frame_transforms": (t1, q1, t2, q2),
+                        "subtract_frame_transforms": (t1, q1, t2, q2),
+                    }
+                    for name, args in inputs.items():
+                        expected_output = getattr(math_utils, name)(*args)
+                        output = getattr(warp_utils, name)(*args)
+                        torch.testing.assert_close(output, expected_output, rtol=1e-5, atol=1e-4, msg=name)
+                    # frame transforms with missing inputs
+                    for name in ["combine_frame_transforms", "subtract_frame_transforms"]:
+                        for args in [(t1, q1), (t1, q1, t2), (t1, q1, None, q2)]:
+                            expected_output = getattr(math_utils, name)(*args)
+                            output = getattr(warp_utils, name)(*args)
+                            torch.testing.assert_close(output, expected_output, rtol=1e-5, atol=1e-4, msg=name)
+
+        # check that the batch dimensions are broadcast
+        q = math_utils.random_orientation(1, "cpu")
+        v = torch.randn(8, 3)
+        torch.testing.assert_close(
+            warp_utils.quat_rotate(q, v), math_utils.quat_rotate(q.expand(8, 4), v), rtol=1e-5, atol=1e-5
+        )
+
     def test_orthogonalize_perspective_depth(self):
         """Test for converting perspective depth to orthogonal depth."""
         for device in ["cpu", "cuda:0"]:
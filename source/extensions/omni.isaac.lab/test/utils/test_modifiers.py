@@ -156,6 +156,39 @@ class TestModifiers(unittest.TestCase):
                     # check if the modified data is close to the expected result
                     torch.testing.assert_close(processed_data, test_cfg.result)
 
+    def test_digital_filter_history(self):
+        """Test digital filter against a reference implementation with an explicit history window."""
+        for device in ["cpu", "cuda"]:
+            with self.subTest(device=device):
+                # create a modifier configuration with different lengths of input and output history
+                modifier_cfg = modifiers.DigitalFilterCfg(A=[0.3, -0.1, 0.05], B=[0.2, 0.5, 0.1, 0.2])
+                # create a modifier instance
+                modifier_obj = modifier_cfg.func(modifier_cfg, (32, 4), device=device)
+
+                # reference filter coefficients and history
+                A = torch.tensor(modifier_cfg.A, device=device)
+                B = torch.tensor(modifier_cfg.B, device=device)
+                x_n = torch.zeros(32, 4, len(modifier_cfg.B), device=device)
+                y_n = torch.zeros(32, 4, len(modifier_cfg.A), device=device)
+
+                for i in range(50):
+                    # reset some of the environments midway
+                    if i == 25:
+                        modifier_obj.reset([0, 5, 7])
+                        x_n[[0, 5, 7]] = 0.0
+                        y_n[[0, 5, 7]] = 0.0
+                    data = torch.rand(32, 4, device=device)
+                    # compute the reference output
+                    x_n = torch.cat([data.unsqueeze(-1), x_n[..., :-1]], dim=-1)
+                    y_i = torch.sum(x_n * B, dim=-1) - torch.sum(y_n * A, dim=-1)
+                    y_n = torch.cat([y_i.unsqueeze(-1), y_n[..., :-1]], dim=-1)
+                    # apply the modifier
+                    processed_data = modifier_obj(data)
+
+                    torch.testing.assert_close(processed_data, y_i)
+                    torch.testing.assert_close(modifier_obj.x_n, x_n)
+                    torch.testing.assert_close(modifier_obj.y_n, y_n)
+
     def test_integral(self):
         """Test for integral modifier."""
         for device in ["cpu", "cuda"]:
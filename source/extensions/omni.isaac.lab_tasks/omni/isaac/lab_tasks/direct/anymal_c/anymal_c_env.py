@@ -129,7 +129,8 @@ class AnymalCEnv(DirectRLEnv):
             torch.norm(self._commands[:, :2], dim=1) > 0.1
         )
         # undersired contacts
-        net_contact_forces = self._contact_sensor.data.net_forces_w_history
+        # note: the maximum over the history does not depend on its order
+        net_contact_forces = self._contact_sensor.data.net_forces_w_history_buffer
         is_contact = (
             torch.max(torch.norm(net_contact_forces[:, :, self._undesired_contact_body_ids], dim=-1), dim=1)[0] > 1.0
         )
@@ -157,7 +158,8 @@ class AnymalCEnv(DirectRLEnv):
 
     def _get_dones(self) -> tuple[torch.Tensor, torch.Tensor]:
         time_out = self.episode_length_buf >= self.max_episode_length - 1
-        net_contact_forces = self._contact_sensor.data.net_forces_w_history
+        # note: the maximum over the history does not depend on its order
+        net_contact_forces = self._contact_sensor.data.net_forces_w_history_buffer
         died = torch.any(torch.max(torch.norm(net_contact_forces[:, :, self._base_id], dim=-1), dim=1)[0] > 1.0, dim=1)
         return died, time_out
 
@@ -0,0 +1,122 @@
+# Copyright (c) 2022-2024, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Script to benchmark the asynchronous writer for images and sensor data.
+
+The script emulates a recording loop, where synthetic camera frames are written at every step while a
+fixed amount of computation stands in for the simulation step. It compares writing the frames on the
+stepping thread against queuing them for the worker threads of the asynchronous writer.
+
+.. code-block:: bash
+
+    ./isaaclab.sh -p source/standalone/benchmarks/benchmark_async_writer.py --headless --device cpu
+
+"""
+
+"""Launch Isaac Sim Simulator first."""
+
+import argparse
+
+from omni.isaac.lab.app import AppLauncher
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Benchmark the asynchronous writer for images and sensor data.")
+parser.add_argument("--num_cameras", type=int, default=16, help="Number of cameras in a frame.")
+parser.add_argument("--height", type=int, default=120, help="Height of the camera images.")
+parser.add_argument("--width", type=int, default=160, help="Width of the camera images.")
+parser.add_argument("--num_steps", type=int, default=50, help="Number of recorded steps per method.")
+parser.add_argument("--step_time", type=float, default=10.0, help="Time of the emulated simulation step in ms.")
+parser.add_argument(
+    "--num_workers", type=int, nargs="+", default=[1, 2, 4], help="Number of worker threads to evaluate."
+)
+# append AppLauncher cli args
+AppLauncher.add_app_launcher_args(parser)
+# parse the arguments
+args_cli = parser.parse_args()
+
+# launch omniverse app
+app_launcher = AppLauncher(args_cli)
+simulation_app = app_launcher.app
+
+"""Rest everything follows."""
+
+import tempfile
+import time
+import torch
+from prettytable import PrettyTable
+
+from omni.isaac.lab.utils.io import AsyncWriter
+
+FILE_FORMATS = ["npy", "npz", "png"]
+"""The file formats to benchmark."""
+
+
+def emulate_step(frame: dict[str, torch.Tensor]):
+    """Emulates a simulation step that renders a new frame."""
+    start_time = time.perf_counter()
+    while (time.perf_counter() - start_time) * 1e3 < args_cli.step_time:
+        pass
+    frame["rgb"].add_(1)
+    frame["depth"].add_(0.01)
+
+
+def benchmark_writer(file_format: str, num_workers: int, device: str) -> float:
+    """Measures the average time of a recording step.
+
+    Args:
+        file_format: The format of the written files.
+        num_workers: The number of worker threads. If zero, the frames are written on the stepping thread.
+        device: The device the frames are stored on.
+
+    Returns:
+        The average time per step in milliseconds.
+    """
+    # create synthetic frames
+    generator = torch.Generator(device=device).manual_seed(0)
+    image_shape = (args_cli.num_cameras, args_cli.height, args_cli.width)
+    frame = {
+        "rgb": torch.randint(0, 256, (*image_shape, 3), dtype=torch.uint8, device=device, generator=generator),
+        "depth": torch.rand((*image_shape, 1), device=device, generator=generator),
+    }
+
+    with tempfile.TemporaryDirectory() as output_dir:
+        # note: waiting for every write to complete is equivalent to writing on the stepping thread
+        writer = AsyncWriter(output_dir, file_format=file_format, num_workers=max(num_workers, 1))
+        start_time = time.perf_counter()
+        for step in range(args_cli.num_steps):
+            emulate_step(frame)
+            writer.write(f"frame_{step:04d}", frame)
+            if num_workers == 0:
+                writer.flush()
+        # wait for the pending writes
+        writer.close()
+        step_time = (time.perf_counter() - start_time) / args_cli.num_steps * 1e3
+    return step_time
+
+
+def main():
+    """Main function."""
+    # create table for the results
+    table = PrettyTable()
+    table.title = (
+        f"Recording of {args_cli.num_cameras} cameras on '{args_cli.device}' with a step of"
+        f" {args_cli.step_time} ms (time per step in ms)"
+    )
+    table.field_names = ["Format", "Synchronous"] + [f"{num_workers} workers" for num_workers in args_cli.num_workers]
+    table.align["Format"] = "l"
+    # run the benchmark
+    for file_format in FILE_FORMATS:
+        timings = [benchmark_writer(file_format, 0, args_cli.device)]
+        timings += [benchmark_writer(file_format, num_workers, args_cli.device) for num_workers in args_cli.num_workers]
+        table.add_row([file_format] + [f"{timing:.3f}" for timing in timings])
+    # print the results
+    print(table)
+
+
+if __name__ == "__main__":
+    # run the main function
+    main()
+    # close sim app
+    simulation_app.close()
@@ -0,0 +1,109 @@
+# Copyright (c) 2022-2024, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Script to benchmark the different solvers of the differential inverse kinematics controller.
+
+The script evaluates the computation of the delta in joint space for random Jacobian matrices, without
+running the simulation.
+
+.. code-block:: bash
+
+    ./isaaclab.sh -p source/standalone/benchmarks/benchmark_differential_ik.py --headless --device cpu
+
+"""
+
+"""Launch Isaac Sim Simulator first."""
+
+import argparse
+
+from omni.isaac.lab.app import AppLauncher
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Benchmark the solvers of the differential IK controller.")
+parser.add_argument(
+    "--num_envs", type=int, nargs="+", default=[1024, 4096, 16384], help="Number of environments to evaluate."
+)
+parser.add_argument("--num_joints", type=int, default=7, help="Number of joints of the arm.")
+parser.add_argument("--num_iterations", type=int, default=100, help="Number of timed iterations per solver.")
+parser.add_argument(
+    "--factorization_period",
+    type=int,
+    default=1,
+    help="Number of calls for which the factorization of the Cholesky-based solvers is reused.",
+)
+# append AppLauncher cli args
+AppLauncher.add_app_launcher_args(parser)
+# parse the arguments
+args_cli = parser.parse_args()
+
+# launch omniverse app
+app_launcher = AppLauncher(args_cli)
+simulation_app = app_launcher.app
+
+"""Rest everything follows."""
+
+import time
+import torch
+from prettytable import PrettyTable
+
+from omni.isaac.lab.controllers import DifferentialIKController, DifferentialIKControllerCfg
+
+IK_METHODS = ["pinv", "svd", "trans", "dls", "dls_cholesky", "dls_warp"]
+"""The inverse kinematics methods to benchmark."""
+
+
+def benchmark_ik_method(ik_method: str, num_envs: int, device: str) -> float:
+    """Measures the average time taken to compute the delta in joint space.
+
+    Args:
+        ik_method: The inverse kinematics method.
+        num_envs: The number of environments.
+        device: The device to run the benchmark on.
+
+    Returns:
+        The average time per call in milliseconds.
+    """
+    # create the controller
+    ik_params = {"factorization_period": args_cli.factorization_period} if ik_method.startswith("dls_") else None
+    diff_ik_cfg = DifferentialIKControllerCfg(command_type="pose", ik_method=ik_method, ik_params=ik_params)
+    diff_ik_controller = DifferentialIKController(diff_ik_cfg, num_envs=num_envs, device=device)
+    # create random inputs
+    jacobian = torch.randn(num_envs, 6, args_cli.num_joints, device=device)
+    delta_pose = torch.randn(num_envs, 6, device=device)
+
+    # warm-up
+    for _ in range(10):
+        diff_ik_controller._compute_delta_joint_pos(delta_pose=delta_pose, jacobian=jacobian)
+    if "cuda" in device:
+        torch.cuda.synchronize()
+    # time the solver
+    start_time = time.perf_counter()
+    for _ in range(args_cli.num_iterations):
+        diff_ik_controller._compute_delta_joint_pos(delta_pose=delta_pose, jacobian=jacobian)
+    if "cuda" in device:
+        torch.cuda.synchronize()
+    return (time.perf_counter() - start_time) / args_cli.num_iterations * 1e3
+
+
+def main():
+    """Main function."""
+    # create table for the results
+    table = PrettyTable()
+    table.title = f"Differential IK solvers on '{args_cli.device}' (time per call in ms)"
+    table.field_names = ["Method"] + [f"{num_envs} envs" for num_envs in args_cli.num_envs]
+    table.align["Method"] = "l"
+    # run the benchmark
+    for ik_method in IK_METHODS:
+        timings = [benchmark_ik_method(ik_method, num_envs, args_cli.device) for num_envs in args_cli.num_envs]
+        table.add_row([ik_method] + [f"{timing:.3f}" for timing in timings])
+    # print the results
+    print(table)
+
+
+if __name__ == "__main__":
+    # run the main function
+    main()
+    # close sim app
+    simulation_app.close()
@@ -0,0 +1,138 @@
+# Copyright (c) 2022-2024, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Script to benchmark the quaternion operations of the math utilities.
+
+The script compares the torch implementations in :mod:`omni.isaac.lab.utils.math` against the fused warp
+implementations in :mod:`omni.isaac.lab.utils.warp` for different batch sizes. It reports the throughput of
+each operation in million elements per second and the maximum absolute difference between the outputs.
+
+.. code-block:: bash
+
+    ./isaaclab.sh -p source/standalone/benchmarks/benchmark_math_ops.py --headless --device cpu
+
+"""
+
+"""Launch Isaac Sim Simulator first."""
+
+import argparse
+
+from omni.isaac.lab.app import AppLauncher
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Benchmark the quaternion operations of the math utilities.")
+parser.add_argument("--batch_sizes", type=int, nargs="+", default=[256, 4096, 65536], help="Batch sizes to evaluate.")
+parser.add_argument("--num_iterations", type=int, default=100, help="Number of timed iterations per operation.")
+# append AppLauncher cli args
+AppLauncher.add_app_launcher_args(parser)
+# parse the arguments
+args_cli = parser.parse_args()
+
+# launch omniverse app
+app_launcher = AppLauncher(args_cli)
+simulation_app = app_launcher.app
+
+"""Rest everything follows."""
+
+import time
+import torch
+from collections.abc import Callable
+from prettytable import PrettyTable
+
+import warp as wp
+
+import omni.isaac.lab.utils.math as math_utils
+import omni.isaac.lab.utils.warp as warp_utils
+
+OPERATIONS = [
+    "quat_mul",
+    "quat_apply",
+    "quat_rotate",
+    "quat_rotate_inverse",
+    "combine_frame_transforms",
+    "subtract_frame_transforms",
+    "quat_error_magnitude",
+]
+"""The quaternion operations to benchmark."""
+
+
+def create_inputs(operation: str, batch_size: int, device: str) -> tuple[torch.Tensor, ...]:
+    """Creates random inputs for an operation with the same seed for all implementations."""
+    torch.manual_seed(0)
+    q1 = math_utils.random_orientation(batch_size, device)
+    q2 = math_utils.random_orientation(batch_size, device)
+    t1 = torch.randn(batch_size, 3, device=device)
+    t2 = torch.randn(batch_size, 3, device=device)
+    if operation in ["quat_mul", "quat_error_magnitude"]:
+        return q1, q2
+    elif operation in ["quat_apply", "quat_rotate", "quat_rotate_inverse"]:
+        return q1, t1
+    else:
+        return t1, q1, t2, q2
+
+
+def benchmark_operation(func: Callable, inputs: tuple[torch.Tensor, ...], device: str) -> float:
+    """Measures the average time taken by an operation.
+
+    Args:
+        func: The operation to benchmark.
+        inputs: The inputs of the operation.
+        device: The device to run the benchmark on.
+
+    Returns:
+        The average time per call in seconds.
+    """
+    # warm-up
+    for _ in range(10):
+        func(*inputs)
+    wp.synchronize_device(device)
+    # time the operation
+    start_time = time.perf_counter()
+    for _ in range(args_cli.num_iterations):
+        func(*inputs)
+    wp.synchronize_device(device)
+    return (time.perf_counter() - start_time) / args_cli.num_iterations
+
+
+def main():
+    """Main function."""
+    # create table for the results
+    table = PrettyTable()
+    table.title = f"Quaternion operations on '{args_cli.device}' (throughput in million elements per second)"
+    table.field_names = (
+        ["Operation", "Backend"] + [f"{batch_size} elements" for batch_size in args_cli.batch_sizes] + ["Max. error"]
+    )
+    table.align["Operation"] = "l"
+    # run the benchmark
+    for operation in OPERATIONS:
+        # evaluate the outputs of the torch implementation as reference
+        reference_outputs = dict()
+        for backend, module in [("torch", math_utils), ("warp", warp_utils)]:
+            func = getattr(module, operation)
+            throughputs = list()
+            max_error = 0.0
+            for batch_size in args_cli.batch_sizes:
+                inputs = create_inputs(operation, batch_size, args_cli.device)
+                timing = benchmark_operation(func, inputs, args_cli.device)
+                throughputs.append(batch_size / timing * 1e-6)
+                # compare against the reference
+                outputs = func(*inputs)
+                outputs = outputs if isinstance(outputs, tuple) else (outputs,)
+                if batch_size not in reference_outputs:
+                    reference_outputs[batch_size] = outputs
+                for output, reference_output in zip(outputs, reference_outputs[batch_size]):
+                    max_error = max(max_error, torch.max(torch.abs(output - reference_output)).item())
+            table.add_row(
+                [operation, backend] + [f"{throughput:.2f}" for throughput in throughputs] + [f"{max_error:.2e}"]
+            )
+    # print the results
+    print(table)
+
+
+if __name__ == "__main__":
+    # run the main function
+    main()
+    # close sim app
+    simulation_app.close()
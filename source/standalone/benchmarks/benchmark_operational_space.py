@@ -0,0 +1,139 @@
+# Copyright (c) 2022-2024, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Script to benchmark the inertial compensation solvers of the operational-space controller.
+
+The script evaluates the computation of the desired end-effector wrench for random Jacobian and mass
+matrices, without running the simulation.
+
+.. code-block:: bash
+
+    ./isaaclab.sh -p source/standalone/benchmarks/benchmark_operational_space.py --headless --device cpu
+
+"""
+
+"""Launch Isaac Sim Simulator first."""
+
+import argparse
+
+from omni.isaac.lab.app import AppLauncher
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Benchmark the inertial solvers of the operational-space controller.")
+parser.add_argument(
+    "--num_envs", type=int, nargs="+", default=[1024, 4096, 16384], help="Number of environments to evaluate."
+)
+parser.add_argument("--num_joints", type=int, default=7, help="Number of joints of the arm.")
+parser.add_argument("--num_iterations", type=int, default=100, help="Number of timed iterations per solver.")
+# append AppLauncher cli args
+AppLauncher.add_app_launcher_args(parser)
+# parse the arguments
+args_cli = parser.parse_args()
+
+# launch omniverse app
+app_launcher = AppLauncher(args_cli)
+simulation_app = app_launcher.app
+
+"""Rest everything follows."""
+
+import time
+import torch
+from prettytable import PrettyTable
+
+from omni.isaac.lab.controllers.operational_space import OperationSpaceController, OperationSpaceControllerCfg
+
+INERTIAL_SOLVERS = ["inverse", "cholesky"]
+"""The inertial solvers to benchmark."""
+
+
+def benchmark_inertial_solver(
+    inertial_solver: str, uncouple_motion_wrench: bool, num_envs: int, device: str
+) -> tuple[float, torch.Tensor]:
+    """Measures the average time taken to compute the desired end-effector wrench.
+
+    Args:
+        inertial_solver: The inertial solver of the controller.
+        uncouple_motion_wrench: Whether to decouple the position and orientation blocks of the task-space inertia.
+        num_envs: The number of environments.
+        device: The device to run the benchmark on.
+
+    Returns:
+        A tuple containing the average time per call in milliseconds and the computed wrench.
+    """
+    # create the controller
+    osc_cfg = OperationSpaceControllerCfg(
+        command_types=["pose_abs"],
+        impedance_mode="fixed",
+        inertial_compensation=True,
+        inertial_solver=inertial_solver,
+        uncouple_motion_wrench=uncouple_motion_wrench,
+        stiffness=100.0,
+        damping_ratio=1.0,
+    )
+    osc = OperationSpaceController(osc_cfg, num_robots=num_envs, num_dof=args_cli.num_joints, device=device)
+    # create random inputs with the same seed for all solvers
+    generator = torch.Generator(device=device).manual_seed(0)
+    jacobian = torch.randn(num_envs, 6, args_cli.num_joints, device=device, generator=generator)
+    mass_factor = torch.randn(num_envs, args_cli.num_joints, args_cli.num_joints, device=device, generator=generator)
+    mass_matrix = mass_factor @ mass_factor.transpose(1, 2) + torch.eye(args_cli.num_joints, device=device)
+    des_ee_acc = torch.randn(num_envs, 6, device=device, generator=generator)
+
+    # warm-up
+    for _ in range(10):
+        wrench = osc._compute_inertial_wrench(jacobian, mass_matrix, des_ee_acc)
+    if "cuda" in device:
+        torch.cuda.synchronize()
+    # time the solver
+    start_time = time.perf_counter()
+    for _ in range(args_cli.num_iterations):
+        osc._compute_inertial_wrench(jacobian, mass_matrix, des_ee_acc)
+    if "cuda" in device:
+        torch.cuda.synchronize()
+    return (time.perf_counter() - start_time) / args_cli.num_iterations * 1e3, wrench
+
+
+def main():
+    """Main function."""
+    # create table for the results
+    table = PrettyTable()
+    table.title = f"Operational-space inertial solvers on '{args_cli.device}' (time per call in ms)"
+    table.field_names = (
+        ["Solver", "Decoupled"] + [f"{num_envs} envs" for num_envs in args_cli.num_envs] + ["Max. relative error"]
+    )
+    table.align["Solver"] = "l"
+    # run the benchmark
+    for uncouple_motion_wrench in [False, True]:
+        # reference wrenches computed with explicit inverses
+        reference_wrenches = dict()
+        for inertial_solver in INERTIAL_SOLVERS:
+            timings = list()
+            max_error = 0.0
+            for num_envs in args_cli.num_envs:
+                timing, wrench = benchmark_inertial_solver(
+                    inertial_solver, uncouple_motion_wrench, num_envs, args_cli.device
+                )
+                timings.append(timing)
+                # compare against the reference
+                if num_envs not in reference_wrenches:
+                    reference_wrenches[num_envs] = wrench
+                error = torch.max(
+                    torch.abs(wrench - reference_wrenches[num_envs])
+                    / torch.abs(reference_wrenches[num_envs]).clamp(min=1e-6)
+                )
+                max_error = max(max_error, error.item())
+            table.add_row(
+                [inertial_solver, uncouple_motion_wrench]
+                + [f"{timing:.3f}" for timing in timings]
+                + [f"{max_error:.2e}"]
+            )
+    # print the results
+    print(table)
+
+
+if __name__ == "__main__":
+    # run the main function
+    main()
+    # close sim app
+    simulation_app.close()
@@ -0,0 +1,150 @@
+# Copyright (c) 2022-2024, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Script to benchmark the de-tiling of the images rendered by the tiled camera.
+
+The script evaluates the reshaping of synthetic tiled RGBA and depth images into batches of RGB and clipped
+depth images, without running the simulation. The fused operation is compared against reshaping the images
+first and post-processing them with torch afterwards.
+
+.. code-block:: bash
+
+    ./isaaclab.sh -p source/standalone/benchmarks/benchmark_tiled_image.py --headless --device cpu
+
+"""
+
+"""Launch Isaac Sim Simulator first."""
+
+import argparse
+
+from omni.isaac.lab.app import AppLauncher
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Benchmark the de-tiling of the tiled camera images.")
+parser.add_argument(
+    "--num_envs", type=int, nargs="+", default=[16, 64, 256], help="Number of environments to evaluate."
+)
+parser.add_argument("--height", type=int, default=80, help="Height of the camera images.")
+parser.add_argument("--width", type=int, default=80, help="Width of the camera images.")
+parser.add_argument("--max_depth", type=float, default=5.0, help="Depth beyond which the values are clipped.")
+parser.add_argument("--num_iterations", type=int, default=100, help="Number of timed iterations per method.")
+# append AppLauncher cli args
+AppLauncher.add_app_launcher_args(parser)
+# parse the arguments
+args_cli = parser.parse_args()
+
+# launch omniverse app
+app_launcher = AppLauncher(args_cli)
+simulation_app = app_launcher.app
+
+"""Rest everything follows."""
+
+import math
+import time
+import torch
+from prettytable import PrettyTable
+
+import warp as wp
+
+from omni.isaac.lab.utils.warp import reshape_tiled_image
+
+METHODS = ["reshape + torch", "fused"]
+"""The de-tiling methods to benchmark."""
+
+
+def reshape_and_post_process(
+    tiled_rgba: torch.Tensor, tiled_depth: torch.Tensor, rgba: torch.Tensor, depth: torch.Tensor, num_tiles_x: int
+) -> tuple[torch.Tensor, torch.Tensor]:
+    """Reshapes the tiled images without processing the values and post-processes them with torch."""
+    reshape_tiled_image(tiled_rgba, rgba, num_tiles_x)
+    reshape_tiled_image(tiled_depth, depth, num_tiles_x)
+    # post-process the images
+    rgb = rgba[..., :3].float() / 255.0
+    depth = depth.clone()
+    depth[depth > args_cli.max_depth] = args_cli.max_depth
+    return rgb, depth
+
+
+def benchmark_method(method: str, num_envs: int, device: str) -> tuple[float, torch.Tensor, torch.Tensor]:
+    """Measures the average time taken to de-tile the RGB and depth images.
+
+    Args:
+        method: The de-tiling method.
+        num_envs: The number of environments.
+        device: The device to run the benchmark on.
+
+    Returns:
+        A tuple containing the average time per call in milliseconds and the RGB and depth images.
+    """
+    # create synthetic tiled images with the same seed for all methods
+    num_tiles_x = math.ceil(math.sqrt(num_envs))
+    num_tiles_y = math.ceil(num_envs / num_tiles_x)
+    tiled_shape = (num_tiles_y * args_cli.height, num_tiles_x * args_cli.width)
+    generator = torch.Generator(device=device).manual_seed(0)
+    tiled_rgba = torch.randint(0, 256, (*tiled_shape, 4), dtype=torch.uint8, device=device, generator=generator)
+    tiled_depth = 2.0 * args_cli.max_depth * torch.rand(tiled_shape, device=device, generator=generator)
+    tiled_depth[tiled_depth > 1.5 * args_cli.max_depth] = float("inf")
+    # create the output buffers
+    image_shape = (num_envs, args_cli.height, args_cli.width)
+    rgba = torch.zeros((*image_shape, 4), dtype=torch.uint8, device=device)
+    rgb = torch.zeros((*image_shape, 3), device=device)
+    depth = torch.zeros((*image_shape, 1), device=device)
+
+    # resolve the method
+    if method == "fused":
+
+        def detile():
+            reshape_tiled_image(tiled_rgba, rgb, num_tiles_x, scale=1.0 / 255.0)
+            reshape_tiled_image(tiled_depth, depth, num_tiles_x, max_value=args_cli.max_depth)
+            return rgb, depth
+
+    else:
+
+        def detile():
+            return reshape_and_post_process(tiled_rgba, tiled_depth, rgba, depth, num_tiles_x)
+
+    # warm-up
+    for _ in range(10):
+        outputs = detile()
+    wp.synchronize_device(device)
+    # time the method
+    start_time = time.perf_counter()
+    for _ in range(args_cli.num_iterations):
+        detile()
+    wp.synchronize_device(device)
+    return (time.perf_counter() - start_time) / args_cli.num_iterations * 1e3, *outputs
+
+
+def main():
+    """Main function."""
+    # create table for the results
+    table = PrettyTable()
+    table.title = f"De-tiling of RGB and depth images on '{args_cli.device}' (time per call in ms)"
+    table.field_names = ["Method"] + [f"{num_envs} envs" for num_envs in args_cli.num_envs] + ["Max. error"]
+    table.align["Method"] = "l"
+    # run the benchmark
+    reference_outputs = dict()
+    for method in METHODS:
+        timings = list()
+        max_error = 0.0
+        for num_envs in args_cli.num_envs:
+            timing, rgb, depth = benchmark_method(method, num_envs, args_cli.device)
+            timings.append(timing)
+            # compare against the reference
+            if num_envs not in reference_outputs:
+                reference_outputs[num_envs] = (rgb.clone(), depth.clone())
+            reference_rgb, reference_depth = reference_outputs[num_envs]
+            error = max(torch.max(torch.abs(rgb - reference_rgb)), torch.max(torch.abs(depth - reference_depth)))
+            max_error = max(max_error, error.item())
+        table.add_row([method] + [f"{timing:.3f}" for timing in timings] + [f"{max_error:.2e}"])
+    # print the results
+    print(table)
+
+
+if __name__ == "__main__":
+    # run the main function
+    main()
+    # close sim app
+    simulation_app.close()